@@ -12,7 +12,13 @@ from fastapi import HTTPException
 import httpx
 from pydantic import BaseModel
 
-from .payer_interface import PayerInterface, EligibilityRequest, EligibilityResponse
+from .payer_interface import (
+    PayerInterface,
+    EligibilityRequest,
+    EligibilityResponse,
+    EligibilityCache,
+    create_pooled_client
+)
 from ..models.credentials import MedicaidCredentials
 from ..config import Settings
 
@@ -25,11 +31,22 @@ class MedicaidService(PayerInterface):
         self.credentials = credentials
         self.settings = settings
         self.base_url = settings.medicaid_portal_url
-        self.client = httpx.AsyncClient(
+        self.max_concurrency = getattr(settings, "medicaid_max_concurrency", 10)
+        # Long-lived pooled client; closed via aclose(), not per request
+        self.client = create_pooled_client(
             base_url=self.base_url,
             timeout=settings.medicaid_timeout,
-            verify=settings.ssl_verify
+            verify=settings.ssl_verify,
+            max_connections=self.max_concurrency
         )
+        self.eligibility_cache = EligibilityCache(
+            ttl_seconds=getattr(settings, "eligibility_cache_ttl", 3600)
+        )
+
+    @property
+    def payer_key(self) -> str:
+        """Identifier of the payer used for caching and concurrency limits."""
+        return "medicaid"
 
     async def verify_eligibility(
         self, 
@@ -41,13 +58,12 @@ class MedicaidService(PayerInterface):
             medicaid_request = self._transform_to_medicaid(request)
             
             # Call Medicaid service
-            async with self.client as client:
-                response = await client.post(
-                    "/eligibility/verify",
-                    json=medicaid_request,
-                    headers=self._get_auth_headers()
-                )
-                response.raise_for_status()
+            response = await self.client.post(
+                "/eligibility/verify",
+                json=medicaid_request,
+                headers=self._get_auth_headers()
+            )
+            response.raise_for_status()
                 
             # Transform response
             return self._transform_from_medicaid(response.json())
@@ -66,21 +82,19 @@ class MedicaidService(PayerInterface):
     async def validate_credentials(self) -> bool:
         """Validate Medicaid credentials."""
         try:
-            async with self.client as client:
-                response = await client.post(
-                    "/auth/validate",
-                    headers=self._get_auth_headers()
-                )
-                return response.status_code == 200
+            response = await self.client.post(
+                "/auth/validate",
+                headers=self._get_auth_headers()
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
     async def check_service_availability(self) -> bool:
         """Check Medicaid portal availability."""
         try:
-            async with self.client as client:
-                response = await client.get("/health")
-                return response.status_code == 200
+            response = await self.client.get("/health")
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -12,7 +12,13 @@ from fastapi import HTTPException
 import httpx
 from pydantic import BaseModel
 
-from .payer_interface import PayerInterface, EligibilityRequest, EligibilityResponse
+from .payer_interface import (
+    PayerInterface,
+    EligibilityRequest,
+    EligibilityResponse,
+    EligibilityCache,
+    create_pooled_client
+)
 from ..models.credentials import MedicareCredentials
 from ..config import Settings
 
@@ -25,11 +31,22 @@ class MedicareService(PayerInterface):
         self.credentials = credentials
         self.settings = settings
         self.base_url = settings.medicare_hets_url
-        self.client = httpx.AsyncClient(
+        self.max_concurrency = getattr(settings, "medicare_max_concurrency", 10)
+        # Long-lived pooled client; closed via aclose(), not per request
+        self.client = create_pooled_client(
             base_url=self.base_url,
             timeout=settings.medicare_timeout,
-            verify=settings.ssl_verify
+            verify=settings.ssl_verify,
+            max_connections=self.max_concurrency
         )
+        self.eligibility_cache = EligibilityCache(
+            ttl_seconds=getattr(settings, "eligibility_cache_ttl", 3600)
+        )
+
+    @property
+    def payer_key(self) -> str:
+        """Identifier of the payer used for caching and concurrency limits."""
+        return "medicare"
 
     async def verify_eligibility(
         self, 
@@ -41,13 +58,12 @@ class MedicareService(PayerInterface):
             hets_request = self._transform_to_hets(request)
             
             # Call HETS service
-            async with self.client as client:
-                response = await client.post(
-                    "/eligibility",
-                    json=hets_request,
-                    headers=self._get_auth_headers()
-                )
-                response.raise_for_status()
+            response = await self.client.post(
+                "/eligibility",
+                json=hets_request,
+                headers=self._get_auth_headers()
+            )
+            response.raise_for_status()
                 
             # Transform response
             return self._transform_from_hets(response.json())
@@ -66,21 +82,19 @@ class MedicareService(PayerInterface):
     async def validate_credentials(self) -> bool:
         """Validate Medicare credentials."""
         try:
-            async with self.client as client:
-                response = await client.post(
-                    "/validateCredentials",
-                    headers=self._get_auth_headers()
-                )
-                return response.status_code == 200
+            response = await self.client.post(
+                "/validateCredentials",
+                headers=self._get_auth_headers()
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
     async def check_service_availability(self) -> bool:
         """Check HETS service availability."""
         try:
-            async with self.client as client:
-                response = await client.get("/health")
-                return response.status_code == 200
+            response = await self.client.get("/health")
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -4,10 +4,17 @@ Payer Interface Module
 This module defines the base interface for all payer integrations.
 """
 from abc import ABC, abstractmethod
+import asyncio
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Optional, List
+import json
+import time
+from typing import Dict, Optional, List, Tuple
+import weakref
 from uuid import UUID
 
+from fastapi import HTTPException
+import httpx
 from pydantic import BaseModel
 
 
@@ -36,9 +43,182 @@ class EligibilityResponse(BaseModel):
     raw_response: Optional[Dict] = None
 
 
+class EligibilityBatchItem(BaseModel):
+    """Result of one request within a batch eligibility check."""
+    index: int
+    subscriber_id: str
+    response: Optional[EligibilityResponse] = None
+    error: Optional[str] = None
+    cached: bool = False
+
+
+# (payer, member, dependent, provider NPI, date of service,
+#  service type codes, additional info)
+EligibilityCacheKey = Tuple[str, str, Optional[str], str, str, Tuple[str, ...], str]
+
+
+class EligibilityCache:
+    """Bounded TTL cache of eligibility responses."""
+
+    def __init__(self, ttl_seconds: float = 3600, max_entries: int = 10000):
+        """Initialize the cache."""
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[EligibilityCacheKey, Tuple[float, EligibilityResponse]]" = OrderedDict()
+
+    def get(self, key: EligibilityCacheKey) -> Optional[EligibilityResponse]:
+        """Get a cached response if it has not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: EligibilityCacheKey, response: EligibilityResponse) -> None:
+        """Cache a response, evicting the oldest entries when full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+
+# Per event loop, so a semaphore is never awaited from a loop it was not
+# created on; within a loop it is shared by every instance of a payer
+_payer_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def payer_semaphore(payer_key: str, limit: int) -> asyncio.Semaphore:
+    """Concurrency limit for a payer on the running event loop."""
+    semaphores = _payer_semaphores.setdefault(asyncio.get_running_loop(), {})
+    if payer_key not in semaphores:
+        semaphores[payer_key] = asyncio.Semaphore(limit)
+    return semaphores[payer_key]
+
+
+def create_pooled_client(
+    base_url: str,
+    timeout: float,
+    verify: bool = True,
+    max_connections: int = 20,
+    max_keepalive_connections: int = 10,
+    keepalive_expiry: float = 30.0
+) -> httpx.AsyncClient:
+    """Create a long-lived HTTP client with keep-alive connection pooling."""
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=timeout,
+        verify=verify,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+    )
+
+
 class PayerInterface(ABC):
     """Abstract base class for payer integrations."""
 
+    # Concurrency limit shared by all instances talking to the same payer
+    max_concurrency: int = 10
+
+    client: Optional[httpx.AsyncClient] = None
+    eligibility_cache: Optional[EligibilityCache] = None
+
+    @property
+    def payer_key(self) -> str:
+        """Identifier of the payer used for caching and concurrency limits."""
+        return self.__class__.__name__
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self.client is not None and not self.client.is_closed:
+            await self.client.aclose()
+
+    def eligibility_cache_key(self, request: EligibilityRequest) -> EligibilityCacheKey:
+        """Cache key built from every request field that affects the response."""
+        return (
+            self.payer_key,
+            request.subscriber_id,
+            request.dependent_code,
+            request.provider_npi,
+            request.service_date.date().isoformat(),
+            tuple(sorted(request.service_type_codes)),
+            json.dumps(request.additional_info, sort_keys=True, default=str)
+        )
+
+    async def verify_eligibility_batch(
+        self,
+        requests: List[EligibilityRequest],
+        *,
+        use_cache: bool = True
+    ) -> List[EligibilityBatchItem]:
+        """
+        Verify eligibility for many members concurrently.
+
+        Identical requests (same payer, member, dependent, provider, date
+        of service, service types and additional info) are sent once,
+        cached responses are reused, and in-flight calls to this
+        payer never exceed ``max_concurrency``. Results are returned in
+        request order; failures are reported per item.
+        """
+        if self.eligibility_cache is None:
+            self.eligibility_cache = EligibilityCache()
+        semaphore = payer_semaphore(self.payer_key, self.max_concurrency)
+
+        items = [
+            EligibilityBatchItem(index=index, subscriber_id=request.subscriber_id)
+            for index, request in enumerate(requests)
+        ]
+        pending: Dict[EligibilityCacheKey, List[int]] = {}
+        for index, request in enumerate(requests):
+            key = self.eligibility_cache_key(request)
+            cached = self.eligibility_cache.get(key) if use_cache else None
+            if cached is not None:
+                items[index].response = cached
+                items[index].cached = True
+            else:
+                pending.setdefault(key, []).append(index)
+
+        async def verify(key: EligibilityCacheKey, indexes: List[int]) -> None:
+            async with semaphore:
+                try:
+                    response = await self.verify_eligibility(requests[indexes[0]])
+                except HTTPException as e:
+                    for index in indexes:
+                        items[index].error = str(e.detail)
+                    return
+                except Exception as e:
+                    for index in indexes:
+                        items[index].error = str(e)
+                    return
+            self.eligibility_cache.set(key, response)
+            for index in indexes:
+                items[index].response = response
+
+        await asyncio.gather(*(
+            verify(key, indexes) for key, indexes in pending.items()
+        ))
+        return items
+
     @abstractmethod
     async def verify_eligibility(
         self, 
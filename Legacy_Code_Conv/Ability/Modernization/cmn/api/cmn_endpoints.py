@@ -3,7 +3,7 @@ CMN (Certificate of Medical Necessity) API Endpoints
 
 This module provides FastAPI endpoints for CMN operations.
 """
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -11,10 +11,21 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.cmn_models import CmnRequest, CmnResponse, CmnSearchCriteria
 from ..services.cmn_service import CmnService
-from ..dependencies import get_db, get_current_user, get_cmn_service
+from ..config import get_settings
+from ..dependencies import (
+    close_medicare_client,
+    get_db,
+    get_current_user,
+    get_cmn_service
+)
+
+settings = get_settings()
 
 router = APIRouter(prefix="/api/v1/cmn", tags=["cmn"])
 
+# The Medicare client is shared across requests; log out its sessions on shutdown
+router.add_event_handler("shutdown", close_medicare_client)
+
 @router.post("/search", response_model=CmnResponse)
 async def search_cmn(
     request: CmnRequest,
@@ -44,6 +55,40 @@ async def search_cmn(
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@router.post("/search/bulk", response_model=List[CmnResponse])
+async def search_cmn_bulk(
+    requests: List[CmnRequest],
+    current_user = Depends(get_current_user),
+    cmn_service: CmnService = Depends(get_cmn_service),
+    db: AsyncSession = Depends(get_db)
+) -> List[CmnResponse]:
+    """
+    Run several CMN searches in one call.
+    
+    Args:
+        requests: CMN search requests
+        current_user: Authenticated user
+        cmn_service: CMN service instance
+        db: Database session
+    
+    Returns:
+        CmnResponse per request, in request order
+    
+    Raises:
+        HTTPException: If any request is invalid or processing fails
+    """
+    if len(requests) > settings.CMN_BULK_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.CMN_BULK_MAX_REQUESTS} searches per bulk request"
+        )
+    try:
+        return await cmn_service.process_bulk(requests, db)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 @router.get("/{request_id}", response_model=CmnResponse)
 async def get_cmn_response(
     request_id: UUID,
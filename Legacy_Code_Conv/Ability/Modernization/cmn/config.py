@@ -15,6 +15,9 @@ class CmnSettings(BaseSettings):
     CONNECTION_TIMEOUT: float = Field(30.0, description="Connection timeout in seconds")
     RETRY_ATTEMPTS: int = Field(3, description="Number of retry attempts")
     MAX_CONCURRENT_REQUESTS: int = Field(1000, description="Maximum concurrent requests")
+    POOL_PER_ENDPOINT_LIMIT: int = Field(5, description="Maximum concurrent connections per endpoint")
+    POOL_WAIT_TIMEOUT: float = Field(10.0, description="Seconds to wait for a free connection")
+    KEEPALIVE_TIMEOUT: float = Field(30.0, description="Idle keep-alive connection lifetime in seconds")
     
     # Database Settings
     POSTGRES_USER: str = Field(..., description="PostgreSQL username")
@@ -76,6 +79,14 @@ class CmnSettings(BaseSettings):
     MEDICARE_API_URL: str = Field(..., description="Medicare API URL")
     MEDICARE_API_TIMEOUT: int = Field(30, description="API timeout in seconds")
     MEDICARE_MAX_RETRIES: int = Field(3, description="Maximum API retries")
+    MAINFRAME_SESSIONS_PER_HOST: int = Field(2, description="Pooled sessions per mainframe login")
+    MAINFRAME_KEEPALIVE_INTERVAL: float = Field(60.0, description="Seconds between keep-alives on idle sessions")
+    MAINFRAME_IDLE_TIMEOUT: float = Field(600.0, description="Seconds before an idle session is closed")
+
+    # CMN Search Cache Settings
+    CMN_CACHE_TTL: int = Field(3600, description="TTL in seconds for cached CMN search results")
+    CMN_NEGATIVE_CACHE_TTL: int = Field(300, description="TTL in seconds for cached empty CMN searches")
+    CMN_BULK_MAX_REQUESTS: int = Field(100, description="Maximum searches per bulk request")
     
     class Config:
         """Pydantic config."""
@@ -20,6 +20,7 @@ from sqlalchemy.ext.asyncio import (
 from .config import CmnSettings, get_settings
 from .services.cmn_service import CmnService
 from .repositories.cmn_repository import CmnRepository
+from .utils.cache import CacheService
 from .utils.medicare_client import MedicareClient
 from .utils.monitoring import (
     get_logger,
@@ -98,18 +99,25 @@ def get_medicare_client() -> MedicareClient:
     """Get Medicare client instance."""
     return MedicareClient(settings)
 
+async def close_medicare_client() -> None:
+    """Log out pooled mainframe sessions and stop their keep-alive task."""
+    if get_medicare_client.cache_info().currsize:
+        client = get_medicare_client()
+        get_medicare_client.cache_clear()
+        await client.disconnect()
+
 def get_cmn_service(
     repository: CmnRepository = Depends(get_cmn_repository),
     medicare_client: MedicareClient = Depends(get_medicare_client),
-    redis: Redis = Depends(get_redis),
-    logger = logger
+    redis: Redis = Depends(get_redis)
 ) -> CmnService:
     """Get CMN service instance."""
     return CmnService(
         repository=repository,
         medicare_client=medicare_client,
-        cache_service=redis,
-        logger=logger
+        cache_service=CacheService(redis, ttl=settings.CMN_CACHE_TTL),
+        cache_ttl=settings.CMN_CACHE_TTL,
+        negative_cache_ttl=settings.CMN_NEGATIVE_CACHE_TTL
     )
 
 async def verify_api_key(
@@ -5,7 +5,7 @@ This module provides Pydantic models for CMN request/response handling.
 """
 from datetime import datetime
 from typing import List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, constr
 
@@ -42,7 +42,7 @@ class CmnSearchCriteria(BaseModel):
 
 class CmnRequest(BaseModel):
     """CMN request model."""
-    request_id: UUID = Field(default_factory=UUID.uuid4, description="Unique request ID")
+    request_id: UUID = Field(default_factory=uuid4, description="Unique request ID")
     medicare_mainframe: MedicareMainframe = Field(..., description="Mainframe configuration")
     search_criteria: CmnSearchCriteria = Field(..., description="Search criteria")
     mock_response: bool = Field(False, description="Use mock response for testing")
@@ -69,7 +69,7 @@ class CmnRequest(BaseModel):
 
 class CmnResponseEntry(BaseModel):
     """Individual CMN response entry."""
-    entry_id: UUID = Field(default_factory=UUID.uuid4, description="Unique entry ID")
+    entry_id: UUID = Field(default_factory=uuid4, description="Unique entry ID")
     npi: str = Field(..., description="Provider NPI")
     hic: Optional[str] = Field(None, description="Health Insurance Claim Number")
     mbi: str = Field(..., description="Medicare Beneficiary Identifier")
@@ -82,7 +82,7 @@ class CmnResponseEntry(BaseModel):
 
 class CmnResponse(BaseModel):
     """CMN response model."""
-    response_id: UUID = Field(default_factory=UUID.uuid4, description="Unique response ID")
+    response_id: UUID = Field(default_factory=uuid4, description="Unique response ID")
     request_id: UUID = Field(..., description="Associated request ID")
     entries: List[CmnResponseEntry] = Field(default_factory=list, description="Response entries")
     total_count: int = Field(..., description="Total number of matching records")
@@ -51,6 +51,24 @@ ACTIVE_CONNECTIONS = Gauge(
     ["endpoint"]
 )
 
+POOL_IN_USE = Gauge(
+    "connection_pool_in_use",
+    "Connections currently checked out of the pool",
+    ["endpoint"]
+)
+
+POOL_IDLE = Gauge(
+    "connection_pool_idle",
+    "Free connection slots in the pool",
+    ["endpoint"]
+)
+
+POOL_WAITING = Gauge(
+    "connection_pool_waiting",
+    "Requests queued for a pool connection",
+    ["endpoint"]
+)
+
 CIRCUIT_BREAKER_STATUS = Gauge(
     "circuit_breaker_status",
     "Circuit breaker status (0=open, 1=closed)",
@@ -129,6 +147,19 @@ class TelemetryService:
         """Update active connection count."""
         ACTIVE_CONNECTIONS.labels(endpoint=endpoint).set(count)
 
+    async def update_pool_stats(
+        self,
+        endpoint: str,
+        in_use: int,
+        idle: int,
+        waiting: int
+    ):
+        """Update connection pool gauges."""
+        POOL_IN_USE.labels(endpoint=endpoint).set(in_use)
+        POOL_IDLE.labels(endpoint=endpoint).set(idle)
+        POOL_WAITING.labels(endpoint=endpoint).set(waiting)
+        ACTIVE_CONNECTIONS.labels(endpoint=endpoint).set(in_use)
+
     async def update_circuit_breaker(self, endpoint: str, is_open: bool):
         """Update circuit breaker status."""
         CIRCUIT_BREAKER_STATUS.labels(endpoint=endpoint).set(0 if is_open else 1)
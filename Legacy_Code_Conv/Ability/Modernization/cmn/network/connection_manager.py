@@ -4,29 +4,60 @@ Connection Manager Module
 Handles async network connections with connection pooling and circuit breaker pattern.
 """
 from asyncio import Lock
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Set
+from enum import Enum
+from typing import Any, Deque, Dict, Optional
 import aiohttp
 import asyncio
+import time
 from fastapi import HTTPException, status
 from pydantic import BaseModel
+from yarl import URL
 
 from ..config import get_settings
+from ..monitoring.telemetry_service import TelemetryService, telemetry_service
 from ..utils.monitoring import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+class CircuitMode(str, Enum):
+    """Circuit breaker mode."""
+    CLOSED = "closed"        # requests flow normally
+    OPEN = "open"            # requests are rejected
+    HALF_OPEN = "half_open"  # a single trial request is allowed
+
+class Admission(int, Enum):
+    """Result of asking the circuit breaker to run a request.
+
+    REJECTED is falsy, so callers that only need a yes/no can test it
+    directly.
+    """
+    REJECTED = 0
+    ADMITTED = 1  # circuit closed
+    TRIAL = 2     # this caller owns the half-open trial
+
 class ConnectionState(BaseModel):
     """Connection state tracking."""
     is_open: bool = True
+    mode: CircuitMode = CircuitMode.CLOSED
+    trial_in_flight: bool = False
     failure_count: int = 0
     last_failure: Optional[datetime] = None
     last_success: Optional[datetime] = None
 
 class CircuitBreaker:
-    """Circuit breaker implementation."""
+    """
+    Circuit breaker implementation.
+
+    After ``failure_threshold`` failures the circuit opens. Once
+    ``half_open_timeout`` has passed, exactly one trial request is let
+    through; its success closes the circuit, its failure re-opens it.
+    Failures older than ``reset_timeout`` no longer count towards the
+    threshold.
+    """
     def __init__(
         self,
         failure_threshold: int = 5,
@@ -39,42 +70,139 @@ class CircuitBreaker:
         self.state = ConnectionState()
         self._lock = Lock()
 
+    def _set_mode(self, mode: CircuitMode):
+        """Switch mode, keeping the legacy is_open flag in sync."""
+        self.state.mode = mode
+        self.state.is_open = mode == CircuitMode.CLOSED
+
     async def record_failure(self):
         """Record a connection failure."""
         async with self._lock:
+            now = datetime.utcnow()
+            if (self.state.last_failure and
+                now - self.state.last_failure >= self.reset_timeout):
+                self.state.failure_count = 0
             self.state.failure_count += 1
-            self.state.last_failure = datetime.utcnow()
-            
-            if (self.state.failure_count >= self.failure_threshold and 
-                self.state.is_open):
-                self.state.is_open = False
+            self.state.last_failure = now
+
+            if self.state.mode == CircuitMode.HALF_OPEN:
+                self.state.trial_in_flight = False
+                self._set_mode(CircuitMode.OPEN)
+                logger.warning("Circuit breaker trial failed; re-opened")
+            elif (self.state.failure_count >= self.failure_threshold and
+                  self.state.mode == CircuitMode.CLOSED):
+                self._set_mode(CircuitMode.OPEN)
                 logger.warning(f"Circuit breaker opened after {self.failure_threshold} failures")
 
     async def record_success(self):
         """Record a successful connection."""
         async with self._lock:
+            if self.state.mode != CircuitMode.CLOSED:
+                logger.info("Circuit breaker closed after successful trial")
             self.state.failure_count = 0
             self.state.last_success = datetime.utcnow()
-            self.state.is_open = True
+            self.state.trial_in_flight = False
+            self._set_mode(CircuitMode.CLOSED)
+
+    async def release_trial(self):
+        """Give up a trial slot that ended without a success or failure.
 
-    async def can_execute(self) -> bool:
-        """Check if operation can be executed."""
+        Only the caller that was admitted with Admission.TRIAL may call
+        this.
+        """
         async with self._lock:
-            if self.state.is_open:
-                return True
+            self.state.trial_in_flight = False
 
-            now = datetime.utcnow()
-            if (self.state.last_failure and 
-                now - self.state.last_failure >= self.reset_timeout):
-                self.state.is_open = True
-                self.state.failure_count = 0
-                return True
+    async def can_execute(self) -> Admission:
+        """Check if operation can be executed.
+
+        Returns Admission.TRIAL to the single caller allowed through a
+        half-open circuit; that caller must record an outcome or release
+        the trial.
+        """
+        async with self._lock:
+            if self.state.mode == CircuitMode.CLOSED:
+                return Admission.ADMITTED
+
+            if self.state.mode == CircuitMode.OPEN:
+                now = datetime.utcnow()
+                if (self.state.last_failure and
+                    now - self.state.last_failure < self.half_open_timeout):
+                    return Admission.REJECTED
+                self._set_mode(CircuitMode.HALF_OPEN)
+
+            # Half-open: only one trial request at a time
+            if self.state.trial_in_flight:
+                return Admission.REJECTED
+            self.state.trial_in_flight = True
+            return Admission.TRIAL
+
+class EndpointSlots:
+    """
+    Per-endpoint connection slots with a FIFO wait queue.
+
+    Freed slots are handed directly to the longest-waiting caller, so
+    late arrivals cannot barge ahead of queued requests.
+    """
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.total_wait_time = 0.0
+        self.acquired = 0
+        self.timeouts = 0
+        self.latency_ewma: Optional[float] = None
+        self.requests = 0
 
-            if (self.state.last_failure and 
-                now - self.state.last_failure >= self.half_open_timeout):
-                return True
+    @property
+    def waiting(self) -> int:
+        """Number of queued callers."""
+        return sum(1 for waiter in self._waiters if not waiter.done())
 
-            return False
+    async def acquire(self, timeout: Optional[float]) -> bool:
+        """Wait for a slot; return False on timeout."""
+        started = time.monotonic()
+        if self.in_use < self.limit and not self.waiting:
+            self.in_use += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, timeout)
+            except asyncio.TimeoutError:
+                if not (waiter.done() and not waiter.cancelled()):
+                    self.timeouts += 1
+                    return False
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Slot was handed over just as we were cancelled
+                    self.release()
+                raise
+            finally:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+        self.acquired += 1
+        self.total_wait_time += time.monotonic() - started
+        return True
+
+    def release(self):
+        """Release a slot, handing it to the next waiter if any."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(True)
+                return
+        self.in_use -= 1
+
+    def record_latency(self, latency: float, alpha: float = 0.2):
+        """Track an exponentially weighted request latency."""
+        self.requests += 1
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma = alpha * latency + (1 - alpha) * self.latency_ewma
 
 class ConnectionPool:
     """Async connection pool with circuit breaker."""
@@ -82,21 +210,41 @@ class ConnectionPool:
         self,
         pool_size: int = 10,
         timeout: float = 30.0,
-        retry_attempts: int = 3
+        retry_attempts: int = 3,
+        per_endpoint_limit: Optional[int] = None,
+        wait_timeout: Optional[float] = 10.0,
+        keepalive_timeout: float = 30.0,
+        telemetry: Optional[TelemetryService] = None
     ):
         self.pool_size = pool_size
         self.timeout = timeout
         self.retry_attempts = retry_attempts
+        self.per_endpoint_limit = min(per_endpoint_limit or pool_size, pool_size)
+        self.wait_timeout = wait_timeout
+        self.keepalive_timeout = keepalive_timeout
+        self.telemetry = telemetry
         self.session: Optional[aiohttp.ClientSession] = None
         self._circuit_breakers: Dict[str, CircuitBreaker] = {}
-        self._active_connections: Set[str] = set()
+        self._slots: Dict[str, EndpointSlots] = {}
+        self._active_connections: Dict[str, int] = {}
+        self._connections_created: Dict[str, int] = {}
+        self._connections_reused: Dict[str, int] = {}
         self._pool_lock = Lock()
 
     async def initialize(self):
         """Initialize connection pool."""
         if not self.session:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.per_endpoint_limit,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self.session = aiohttp.ClientSession(
+                timeout=timeout,
+                connector=connector,
+                trace_configs=[self._keepalive_trace()]
+            )
 
     async def close(self):
         """Close all connections."""
@@ -104,11 +252,72 @@ class ConnectionPool:
             await self.session.close()
             self.session = None
 
+    def _keepalive_trace(self) -> aiohttp.TraceConfig:
+        """Count new versus reused (keep-alive) connections per host."""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_create(session, context, params):
+            key = context.trace_request_ctx or "unknown"
+            self._connections_created[key] = self._connections_created.get(key, 0) + 1
+
+        async def on_reuse(session, context, params):
+            key = context.trace_request_ctx or "unknown"
+            self._connections_reused[key] = self._connections_reused.get(key, 0) + 1
+
+        trace_config.on_connection_create_end.append(on_create)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        return trace_config
+
+    @staticmethod
+    def _endpoint_key(endpoint: str) -> str:
+        """Pool and circuit state are kept per origin (scheme, host, port)."""
+        url = URL(endpoint)
+        return str(url.origin()) if url.is_absolute() else endpoint
+
     def _get_circuit_breaker(self, endpoint: str) -> CircuitBreaker:
         """Get or create circuit breaker for endpoint."""
-        if endpoint not in self._circuit_breakers:
-            self._circuit_breakers[endpoint] = CircuitBreaker()
-        return self._circuit_breakers[endpoint]
+        key = self._endpoint_key(endpoint)
+        if key not in self._circuit_breakers:
+            self._circuit_breakers[key] = CircuitBreaker()
+        return self._circuit_breakers[key]
+
+    def _get_slots(self, key: str) -> EndpointSlots:
+        """Get or create connection slots for endpoint."""
+        if key not in self._slots:
+            self._slots[key] = EndpointSlots(self.per_endpoint_limit)
+        return self._slots[key]
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint in-use/idle/waiting/latency and keep-alive stats."""
+        stats = {}
+        for key, slots in self._slots.items():
+            breaker = self._circuit_breakers.get(key)
+            stats[key] = {
+                "in_use": slots.in_use,
+                "idle": max(slots.limit - slots.in_use, 0),
+                "waiting": slots.waiting,
+                "limit": slots.limit,
+                "wait_timeouts": slots.timeouts,
+                "avg_wait_seconds": (
+                    slots.total_wait_time / slots.acquired if slots.acquired else 0.0
+                ),
+                "latency_ewma_seconds": slots.latency_ewma,
+                "requests": slots.requests,
+                "connections_created": self._connections_created.get(key, 0),
+                "connections_reused": self._connections_reused.get(key, 0),
+                "circuit": breaker.state.mode.value if breaker else CircuitMode.CLOSED.value
+            }
+        return stats
+
+    async def _publish_stats(self, key: str, slots: EndpointSlots):
+        """Push pool gauges to the telemetry service."""
+        if self.telemetry:
+            await self.telemetry.update_pool_stats(
+                key,
+                in_use=slots.in_use,
+                idle=max(slots.limit - slots.in_use, 0),
+                waiting=slots.waiting
+            )
 
     @asynccontextmanager
     async def get_connection(self, endpoint: str):
@@ -116,30 +325,55 @@ class ConnectionPool:
         if not self.session:
             await self.initialize()
 
+        key = self._endpoint_key(endpoint)
         circuit_breaker = self._get_circuit_breaker(endpoint)
-        
-        if not await circuit_breaker.can_execute():
+
+        admission = await circuit_breaker.can_execute()
+        if not admission:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Service temporarily unavailable"
             )
+        owns_trial = admission == Admission.TRIAL
+
+        slots = self._get_slots(key)
+        if not await slots.acquire(self.wait_timeout):
+            if owns_trial:
+                await circuit_breaker.release_trial()
+            await self._publish_stats(key, slots)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Connection pool exhausted"
+            )
 
         async with self._pool_lock:
-            if len(self._active_connections) >= self.pool_size:
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="Connection pool exhausted"
-                )
-            self._active_connections.add(endpoint)
+            self._active_connections[key] = self._active_connections.get(key, 0) + 1
+        await self._publish_stats(key, slots)
 
+        outcome_recorded = False
         try:
             for attempt in range(self.retry_attempts):
+                started = time.monotonic()
                 try:
-                    async with self.session.get(endpoint) as response:
+                    async with self.session.get(endpoint, trace_request_ctx=key) as response:
+                        latency = time.monotonic() - started
+                        slots.record_latency(latency)
+                        if self.telemetry:
+                            await self.telemetry.record_request(
+                                endpoint=key,
+                                method="GET",
+                                status_code=response.status,
+                                duration=latency
+                            )
                         if response.status < 500:
                             await circuit_breaker.record_success()
+                            outcome_recorded = True
                             yield response
                             return
+                        if owns_trial:
+                            # A failing trial must re-open the circuit
+                            await circuit_breaker.record_failure()
+                            outcome_recorded = True
                         raise HTTPException(
                             status_code=response.status,
                             detail=await response.text()
@@ -147,17 +381,30 @@ class ConnectionPool:
                 except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                     if attempt == self.retry_attempts - 1:
                         await circuit_breaker.record_failure()
+                        outcome_recorded = True
                         raise HTTPException(
                             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                             detail=str(e)
                         )
                     await asyncio.sleep(2 ** attempt)  # Exponential backoff
         finally:
+            if owns_trial and not outcome_recorded:
+                await circuit_breaker.release_trial()
+            slots.release()
             async with self._pool_lock:
-                self._active_connections.remove(endpoint)
+                remaining = self._active_connections.get(key, 1) - 1
+                if remaining > 0:
+                    self._active_connections[key] = remaining
+                else:
+                    self._active_connections.pop(key, None)
+            await self._publish_stats(key, slots)
 
 connection_pool = ConnectionPool(
     pool_size=settings.POOL_SIZE,
     timeout=settings.CONNECTION_TIMEOUT,
-    retry_attempts=settings.RETRY_ATTEMPTS
+    retry_attempts=settings.RETRY_ATTEMPTS,
+    per_endpoint_limit=settings.POOL_PER_ENDPOINT_LIMIT,
+    wait_timeout=settings.POOL_WAIT_TIMEOUT,
+    keepalive_timeout=settings.KEEPALIVE_TIMEOUT,
+    telemetry=telemetry_service
 )
@@ -3,17 +3,26 @@ CMN (Certificate of Medical Necessity) Service Module
 
 This module provides the business logic for CMN operations.
 """
+import asyncio
+import hashlib
+import json
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models.cmn_models import CmnRequest, CmnResponse, CmnResponseEntry
+from ..models.cmn_models import (
+    CmnRequest,
+    CmnResponse,
+    CmnResponseEntry,
+    CmnSearchCriteria,
+    MedicareMainframe
+)
 from ..repositories.cmn_repository import CmnRepository
-from ..utils.medicare_client import MedicareClient
+from ..utils.medicare_client import MainframeKey, MedicareClient, mainframe_key
 from ..utils.validation import validate_request
 
 class CmnService:
@@ -23,7 +32,9 @@ class CmnService:
         self,
         repository: CmnRepository,
         medicare_client: MedicareClient,
-        cache_service = None
+        cache_service = None,
+        cache_ttl: int = 3600,
+        negative_cache_ttl: int = 300
     ):
         """
         Initialize CMN service.
@@ -32,10 +43,14 @@ class CmnService:
             repository: CMN repository for data access
             medicare_client: Client for Medicare mainframe interaction
             cache_service: Optional cache service
+            cache_ttl: TTL in seconds for cached search results
+            negative_cache_ttl: TTL in seconds for cached empty searches
         """
         self.repository = repository
         self.medicare_client = medicare_client
         self.cache_service = cache_service
+        self.cache_ttl = cache_ttl
+        self.negative_cache_ttl = negative_cache_ttl
 
     async def process_request(
         self,
@@ -62,41 +77,26 @@ class CmnService:
         start_time = time.time()
         
         try:
-            # Check cache if available
-            if self.cache_service:
-                cached_response = await self.cache_service.get(str(request.request_id))
-                if cached_response:
-                    return cached_response
-
-            # Process request
-            if request.mock_response:
-                entries = await self._get_mock_entries(request)
-            else:
-                entries = await self.medicare_client.search_cmn(
-                    request.medicare_mainframe,
-                    request.search_criteria
-                )
+            # Repeated searches for the same criteria are served from cache
+            entries = None
+            if not request.mock_response:
+                entries = await self._get_cached_entries(request)
 
-            # Create response
-            response = CmnResponse(
-                request_id=request.request_id,
-                entries=entries,
-                total_count=len(entries),
-                returned_count=len(entries),
-                processing_time_ms=(time.time() - start_time) * 1000
-            )
+            if entries is None:
+                if request.mock_response:
+                    entries = await self._get_mock_entries(request)
+                else:
+                    entries = await self.medicare_client.search_cmn(
+                        request.medicare_mainframe,
+                        request.search_criteria
+                    )
+                    await self._cache_entries({self.search_cache_key(request): entries})
+
+            response = self._build_response(request, entries, start_time)
 
             # Save to database
             await self.repository.save_response(response, db)
 
-            # Cache if available
-            if self.cache_service:
-                await self.cache_service.set(
-                    str(request.request_id),
-                    response,
-                    expire=3600
-                )
-
             return response
 
         except Exception as e:
@@ -106,6 +106,192 @@ class CmnService:
                 detail=f"Error processing request: {str(e)}"
             )
 
+    async def process_bulk(
+        self,
+        requests: List[CmnRequest],
+        db: AsyncSession
+    ) -> List[CmnResponse]:
+        """
+        Process several CMN search requests together.
+        
+        Cache hits are answered immediately. Remaining searches are grouped
+        by mainframe login so each mainframe is visited once over a pooled
+        session, and different mainframes are searched concurrently.
+        
+        Args:
+            requests: The search requests
+            db: Database session
+        
+        Returns:
+            CmnResponse per request, in input order
+        
+        Raises:
+            ValueError: If request validation fails
+            HTTPException: If processing fails
+        """
+        for request in requests:
+            validate_request(request)
+
+        start_time = time.time()
+
+        try:
+            results: List[Optional[List[CmnResponseEntry]]] = [None] * len(requests)
+
+            live = [i for i, r in enumerate(requests) if not r.mock_response]
+            cached = await self._get_cached_entries_many([requests[i] for i in live])
+            for i, entries in zip(live, cached):
+                results[i] = entries
+
+            # Group misses by mainframe, collapsing duplicate criteria
+            groups: Dict[MainframeKey, Tuple[MedicareMainframe, Dict[str, List[int]]]] = {}
+            for i, request in enumerate(requests):
+                if results[i] is not None:
+                    continue
+                if request.mock_response:
+                    results[i] = await self._get_mock_entries(request)
+                    continue
+                key = mainframe_key(request.medicare_mainframe)
+                _, pending = groups.setdefault(key, (request.medicare_mainframe, {}))
+                pending.setdefault(self.search_cache_key(request), []).append(i)
+
+            searches = await asyncio.gather(*[
+                self.medicare_client.search_cmn_bulk(
+                    mainframe,
+                    [requests[indexes[0]].search_criteria for indexes in pending.values()]
+                )
+                for mainframe, pending in groups.values()
+            ])
+
+            fetched: Dict[str, List[CmnResponseEntry]] = {}
+            for (_, pending), group_results in zip(groups.values(), searches):
+                for (cache_key, indexes), entries in zip(pending.items(), group_results):
+                    fetched[cache_key] = entries
+                    for i in indexes:
+                        results[i] = entries
+            await self._cache_entries(fetched)
+
+            responses = [
+                self._build_response(request, entries, start_time)
+                for request, entries in zip(requests, results)
+            ]
+            for response in responses:
+                await self.repository.save_response(response, db)
+
+            return responses
+
+        except Exception as e:
+            # Log error
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error processing bulk request: {str(e)}"
+            )
+
+    @staticmethod
+    def search_cache_key(request: CmnRequest) -> str:
+        """
+        Build the cache key for a search.
+        
+        Keyed by mainframe carrier/facility and normalized criteria so
+        identical searches share results regardless of request_id.
+        """
+        criteria: CmnSearchCriteria = request.search_criteria
+        normalized = {
+            "npi": (criteria.npi or "").strip(),
+            "hic": (criteria.hic or "").strip().upper(),
+            "hcpcs": (criteria.hcpcs or "").strip().upper(),
+            "mbi": (criteria.mbi or "").replace("-", "").strip().upper(),
+            "max_results": criteria.max_results
+        }
+        digest = hashlib.sha256(
+            json.dumps(normalized, sort_keys=True).encode()
+        ).hexdigest()[:32]
+        mainframe = request.medicare_mainframe
+        return f"cmn:search:{mainframe.carrier_id}:{mainframe.facility_id}:{digest}"
+
+    def _build_response(
+        self,
+        request: CmnRequest,
+        entries: List[CmnResponseEntry],
+        start_time: float
+    ) -> CmnResponse:
+        """Create a response for a request."""
+        return CmnResponse(
+            request_id=request.request_id,
+            entries=entries,
+            total_count=len(entries),
+            returned_count=len(entries),
+            processing_time_ms=(time.time() - start_time) * 1000
+        )
+
+    async def _get_cached_entries(
+        self,
+        request: CmnRequest
+    ) -> Optional[List[CmnResponseEntry]]:
+        """Get cached entries for a search, None on a miss."""
+        return (await self._get_cached_entries_many([request]))[0]
+
+    async def _get_cached_entries_many(
+        self,
+        requests: List[CmnRequest]
+    ) -> List[Optional[List[CmnResponseEntry]]]:
+        """
+        Get cached entries for several searches.
+        
+        An empty list is a valid (negative) hit; None means not cached.
+        """
+        if not self.cache_service or not requests:
+            return [None] * len(requests)
+
+        keys = [self.search_cache_key(r) for r in requests]
+        try:
+            if hasattr(self.cache_service, "get_many"):
+                values = await self.cache_service.get_many(keys)
+            else:
+                values = await asyncio.gather(*[self.cache_service.get(k) for k in keys])
+        except Exception:
+            # Cache is an optimization; fall through to the mainframe
+            return [None] * len(requests)
+
+        results: List[Optional[List[CmnResponseEntry]]] = []
+        for value in values:
+            if value is None:
+                results.append(None)
+                continue
+            try:
+                payload = json.loads(value)
+                results.append([CmnResponseEntry.parse_obj(e) for e in payload["entries"]])
+            except (ValueError, KeyError, TypeError):
+                results.append(None)
+        return results
+
+    async def _cache_entries(
+        self,
+        entries_by_key: Dict[str, List[CmnResponseEntry]]
+    ) -> None:
+        """Cache search results; empty results use the shorter negative TTL."""
+        if not self.cache_service or not entries_by_key:
+            return
+
+        by_ttl: Dict[int, Dict[str, str]] = {}
+        for key, entries in entries_by_key.items():
+            ttl = self.cache_ttl if entries else self.negative_cache_ttl
+            by_ttl.setdefault(ttl, {})[key] = json.dumps({
+                "entries": [json.loads(e.json()) for e in entries]
+            })
+
+        try:
+            for ttl, items in by_ttl.items():
+                if hasattr(self.cache_service, "set_many"):
+                    await self.cache_service.set_many(items, expire=ttl)
+                else:
+                    await asyncio.gather(*[
+                        self.cache_service.set(k, v, expire=ttl)
+                        for k, v in items.items()
+                    ])
+        except Exception:
+            # Cache is an optimization; results are still returned
+            pass
+
     async def get_response(
         self,
         request_id: UUID,
@@ -0,0 +1,111 @@
+"""
+Integration tests for the CMN search cache.
+"""
+import pytest
+from datetime import datetime
+from uuid import uuid4
+
+from ...models.cmn_models import (
+    CmnRequest,
+    CmnResponseEntry,
+    CmnSearchCriteria,
+    MedicareMainframe
+)
+from ...services.cmn_service import CmnService
+
+def make_request(facility_id: str = "67890", **criteria) -> CmnRequest:
+    return CmnRequest(
+        request_id=uuid4(),
+        medicare_mainframe=MedicareMainframe(
+            carrier_id="12345",
+            facility_id=facility_id,
+            user_id="TESTUSER",
+            password="encrypted_password"
+        ),
+        search_criteria=CmnSearchCriteria(**criteria)
+    )
+
+def make_entry() -> CmnResponseEntry:
+    return CmnResponseEntry(
+        entry_id=uuid4(),
+        npi="1234567890",
+        mbi="1EG4TE5MK73",
+        hcpcs="E0470",
+        initial_date=datetime(2024, 1, 1),
+        status="active"
+    )
+
+class FakeCache:
+    """In-memory stand-in for the Redis cache that records TTLs."""
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    async def get_many(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    async def set_many(self, items, expire=None):
+        self.values.update(items)
+        self.ttls.update({key: expire for key in items})
+
+class FakeMedicareClient:
+    """Mainframe client that counts searches."""
+    def __init__(self, entries):
+        self.entries = entries
+        self.searches = 0
+
+    async def search_cmn(self, mainframe, criteria):
+        self.searches += 1
+        return self.entries
+
+class FakeRepository:
+    async def save_response(self, response, db):
+        return response
+
+def make_service(entries):
+    return CmnService(
+        repository=FakeRepository(),
+        medicare_client=FakeMedicareClient(entries),
+        cache_service=FakeCache(),
+        cache_ttl=3600,
+        negative_cache_ttl=300
+    )
+
+def test_search_cache_key_normalizes_criteria():
+    """Equivalent criteria share a key regardless of case, spacing and request_id."""
+    key = CmnService.search_cache_key(make_request(hic="1234a", hcpcs="E0470", mbi="1EG4TE5MK73"))
+
+    assert CmnService.search_cache_key(
+        make_request(hic=" 1234A ", hcpcs="e0470", mbi="1eg4te5mk73")
+    ) == key
+    assert CmnService.search_cache_key(
+        make_request(hic="1234A", hcpcs="E0470", mbi="1EG4TE5MK73", max_results=10)
+    ) != key
+    assert CmnService.search_cache_key(
+        make_request(facility_id="11111", hic="1234A", hcpcs="E0470", mbi="1EG4TE5MK73")
+    ) != key
+
+@pytest.mark.asyncio
+async def test_repeated_search_is_served_from_cache():
+    """A cached result is reused for an equivalent search."""
+    service = make_service([make_entry()])
+
+    first = await service.process_request(make_request(hcpcs="E0470"), db=None)
+    second = await service.process_request(make_request(hcpcs="e0470"), db=None)
+
+    assert service.medicare_client.searches == 1
+    assert second.total_count == 1
+    assert second.entries[0].entry_id == first.entries[0].entry_id
+    assert list(service.cache_service.ttls.values()) == [3600]
+
+@pytest.mark.asyncio
+async def test_empty_results_use_negative_ttl():
+    """Empty searches are cached, but only for the negative TTL."""
+    service = make_service([])
+
+    await service.process_request(make_request(hcpcs="E0470"), db=None)
+    response = await service.process_request(make_request(hcpcs="E0470"), db=None)
+
+    assert service.medicare_client.searches == 1
+    assert response.total_count == 0
+    assert list(service.cache_service.ttls.values()) == [300]
@@ -0,0 +1,107 @@
+"""
+Integration tests for pooled mainframe sessions.
+"""
+import asyncio
+import pytest
+
+from ...models.cmn_models import MedicareMainframe
+from ...utils import medicare_client
+from ...utils.medicare_client import MainframeSession, MainframeSessionPool, MedicareClient
+
+def make_mainframe(user_id: str = "TESTUSER") -> MedicareMainframe:
+    return MedicareMainframe(
+        carrier_id="12345",
+        facility_id="67890",
+        user_id=user_id,
+        password="encrypted_password"
+    )
+
+@pytest.fixture(autouse=True)
+def plain_passwords(monkeypatch):
+    """Skip password decryption; the mainframe transport is simulated."""
+    monkeypatch.setattr(medicare_client, "decrypt_password", lambda password: password)
+
+@pytest.fixture
+async def pool():
+    """Create test session pool."""
+    pool = MainframeSessionPool(max_sessions=1, keepalive_interval=60.0)
+    yield pool
+    await pool.close()
+
+@pytest.mark.asyncio
+async def test_session_pool_reuses_sessions(pool):
+    """Sequential checkouts for one login share a logged-in session."""
+    async with pool.session(make_mainframe()) as first:
+        assert first.connected
+    async with pool.session(make_mainframe()) as second:
+        assert second is first
+
+    async with pool.session(make_mainframe("OTHER")) as other:
+        assert other is not first
+
+@pytest.mark.asyncio
+async def test_session_pool_limits_sessions_per_login(pool):
+    """Checkouts beyond max_sessions wait for a session to be returned."""
+    order = []
+
+    async def search(index):
+        async with pool.session(make_mainframe()) as session:
+            order.append(("start", index))
+            await asyncio.sleep(0.01)
+            order.append(("end", index))
+            return session
+
+    sessions = await asyncio.gather(search(0), search(1))
+
+    assert order == [("start", 0), ("end", 0), ("start", 1), ("end", 1)]
+    assert sessions[0] is sessions[1]
+
+@pytest.mark.asyncio
+async def test_failed_checkout_discards_session(pool):
+    """A session whose borrower failed is logged out, not reused."""
+    with pytest.raises(RuntimeError):
+        async with pool.session(make_mainframe()) as failed:
+            raise RuntimeError("search failed")
+
+    assert not failed.connected
+    async with pool.session(make_mainframe()) as session:
+        assert session is not failed
+
+@pytest.mark.asyncio
+async def test_keepalive_pings_idle_sessions_then_expires_them(monkeypatch):
+    """Idle sessions get no-ops until they pass the idle timeout."""
+    noops = []
+
+    async def send_noop(session):
+        noops.append(session)
+
+    monkeypatch.setattr(MainframeSession, "_send_noop", send_noop)
+    pool = MainframeSessionPool(keepalive_interval=0.01, idle_timeout=0.3)
+    try:
+        async with pool.session(make_mainframe()) as session:
+            pass
+
+        await asyncio.sleep(0.05)
+        assert noops and set(noops) == {session}
+        assert session.connected
+
+        await asyncio.sleep(0.5)
+        assert not session.connected
+        assert not any(pool._idle.values())
+    finally:
+        await pool.close()
+
+@pytest.mark.asyncio
+async def test_client_disconnect_stops_keepalive():
+    """Closing the client logs out idle sessions and stops the keep-alive task."""
+    client = MedicareClient({"MAINFRAME_KEEPALIVE_INTERVAL": 0.01})
+    async with client.session_pool.session(make_mainframe()) as session:
+        pass
+    task = client.session_pool._keepalive_task
+    assert task and not task.done()
+
+    await client.disconnect()
+
+    assert task.cancelled()
+    assert client.session_pool._keepalive_task is None
+    assert not session.connected
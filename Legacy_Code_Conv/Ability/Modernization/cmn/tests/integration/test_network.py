@@ -3,14 +3,20 @@ Integration tests for network operations.
 """
 import asyncio
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 import ssl
 import aiohttp
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.testclient import TestClient
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
-from ...network.connection_manager import ConnectionPool, CircuitBreaker
+from ...network.connection_manager import (
+    Admission,
+    ConnectionPool,
+    CircuitBreaker,
+    CircuitMode,
+    EndpointSlots
+)
 from ...security.certificate_manager import CertificateManager
 from ...monitoring.telemetry_service import TelemetryService
 from ...config import get_settings
@@ -89,6 +95,144 @@ async def test_circuit_breaker_functionality(connection_pool):
     await asyncio.sleep(circuit_breaker.half_open_timeout.total_seconds())
     assert await circuit_breaker.can_execute()
 
+@pytest.mark.asyncio
+async def test_circuit_breaker_single_trial():
+    """Half-open circuit lets exactly one trial request through."""
+    circuit_breaker = CircuitBreaker(failure_threshold=2, half_open_timeout=0)
+
+    for _ in range(circuit_breaker.failure_threshold):
+        await circuit_breaker.record_failure()
+    assert circuit_breaker.state.mode == CircuitMode.OPEN
+
+    assert await circuit_breaker.can_execute()
+    assert circuit_breaker.state.mode == CircuitMode.HALF_OPEN
+    assert not await circuit_breaker.can_execute()
+
+    await circuit_breaker.record_failure()
+    assert circuit_breaker.state.mode == CircuitMode.OPEN
+
+    assert await circuit_breaker.can_execute()
+    await circuit_breaker.record_success()
+    assert circuit_breaker.state.mode == CircuitMode.CLOSED
+    assert await circuit_breaker.can_execute()
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_trial_ownership():
+    """Only the caller admitted for the trial is told it owns it."""
+    circuit_breaker = CircuitBreaker(failure_threshold=1, half_open_timeout=0)
+    assert await circuit_breaker.can_execute() == Admission.ADMITTED
+
+    await circuit_breaker.record_failure()
+    assert await circuit_breaker.can_execute() == Admission.TRIAL
+    assert await circuit_breaker.can_execute() == Admission.REJECTED
+    assert circuit_breaker.state.trial_in_flight
+
+@pytest.mark.asyncio
+async def test_trial_server_error_reopens_circuit():
+    """A 5xx answer to the half-open trial re-opens the circuit."""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    async def failing(request):
+        return web.Response(status=503, text="down")
+
+    server_app = web.Application()
+    server_app.router.add_get("/", failing)
+    server = TestServer(server_app)
+    await server.start_server()
+    pool = ConnectionPool(pool_size=2, timeout=5.0, retry_attempts=1)
+    try:
+        url = str(server.make_url("/"))
+        circuit_breaker = pool._get_circuit_breaker(url)
+        circuit_breaker.half_open_timeout = timedelta(0)
+        circuit_breaker.failure_threshold = 1
+        await circuit_breaker.record_failure()
+
+        with pytest.raises(HTTPException):
+            async with pool.get_connection(url):
+                pass
+
+        assert circuit_breaker.state.mode == CircuitMode.OPEN
+        assert not circuit_breaker.state.trial_in_flight
+    finally:
+        await pool.close()
+        await server.close()
+
+def test_shared_pool_reports_to_telemetry():
+    """The application-wide pool publishes to the telemetry service."""
+    from ...network.connection_manager import connection_pool
+    from ...monitoring.telemetry_service import telemetry_service
+
+    assert connection_pool.telemetry is telemetry_service
+
+@pytest.mark.asyncio
+async def test_pool_stats_reach_telemetry():
+    """Pool gauges and request metrics are published per origin."""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    from prometheus_client import REGISTRY
+
+    in_use_during_request = []
+
+    async def ok(request):
+        return web.Response(text="ok")
+
+    server_app = web.Application()
+    server_app.router.add_get("/", ok)
+    server = TestServer(server_app)
+    await server.start_server()
+    pool = ConnectionPool(pool_size=2, timeout=5.0, retry_attempts=1, telemetry=TelemetryService())
+    try:
+        url = str(server.make_url("/"))
+        key = pool._endpoint_key(url)
+
+        def sample(name, **labels):
+            return REGISTRY.get_sample_value(name, {"endpoint": key, **labels})
+
+        async with pool.get_connection(url) as response:
+            assert response.status == 200
+            in_use_during_request.append(sample("connection_pool_in_use"))
+
+        assert in_use_during_request == [1.0]
+        assert sample("connection_pool_in_use") == 0.0
+        assert sample("connection_pool_idle") == 2.0
+        assert sample("connection_pool_waiting") == 0.0
+        assert sample("network_requests_total", method="GET", status="200") == 1.0
+        assert sample("request_latency_seconds_count", method="GET") == 1.0
+    finally:
+        await pool.close()
+        await server.close()
+
+@pytest.mark.asyncio
+async def test_endpoint_slots_queue_fairly():
+    """Callers beyond the per-endpoint limit wait in FIFO order."""
+    slots = EndpointSlots(limit=2)
+    order = []
+
+    async def worker(index):
+        assert await slots.acquire(timeout=1.0)
+        order.append(index)
+        await asyncio.sleep(0.01)
+        slots.release()
+
+    await asyncio.gather(*(worker(i) for i in range(6)))
+
+    assert order == list(range(6))
+    assert slots.in_use == 0
+    assert slots.waiting == 0
+
+@pytest.mark.asyncio
+async def test_endpoint_slots_wait_timeout():
+    """A caller gives up after the wait timeout instead of failing fast."""
+    slots = EndpointSlots(limit=1)
+    assert await slots.acquire(timeout=1.0)
+
+    assert not await slots.acquire(timeout=0.01)
+    assert slots.timeouts == 1
+
+    slots.release()
+    assert slots.in_use == 0
+
 @pytest.mark.asyncio
 async def test_certificate_management(certificate_manager):
     """Test certificate operations."""
@@ -3,7 +3,7 @@ Cache Module
 
 This module provides caching utilities.
 """
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 from redis.asyncio import Redis
 
 class CacheService:
@@ -52,6 +52,39 @@ class CacheService:
             ex=expire or self.default_ttl
         )
 
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several values from cache in one round trip.
+        
+        Args:
+            keys: Cache keys
+        
+        Returns:
+            Cached values aligned with keys, None for misses
+        """
+        if not keys:
+            return []
+        return await self.redis.mget(keys)
+
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        expire: Optional[int] = None
+    ) -> None:
+        """
+        Set several values in cache in one pipeline.
+        
+        Args:
+            items: Mapping of cache key to value
+            expire: Optional TTL in seconds
+        """
+        if not items:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, value, ex=expire or self.default_ttl)
+            await pipe.execute()
+
     async def delete(self, key: str) -> None:
         """
         Delete value from cache.
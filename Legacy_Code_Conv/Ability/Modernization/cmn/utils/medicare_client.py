@@ -5,7 +5,9 @@ This module provides a client for interacting with Medicare mainframe systems.
 """
 import asyncio
 import logging
-from typing import List, Optional
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from ..models.cmn_models import (
     CmnResponseEntry,
@@ -16,52 +18,223 @@ from .encryption import decrypt_password
 
 logger = logging.getLogger(__name__)
 
-class MedicareClient:
-    """Client for Medicare mainframe interactions."""
+MainframeKey = Tuple[str, str, str]
+
+def mainframe_key(mainframe: MedicareMainframe) -> MainframeKey:
+    """Identify a mainframe login (carrier, facility, user)."""
+    return (mainframe.carrier_id, mainframe.facility_id, mainframe.user_id)
 
-    def __init__(self, config: dict):
+class MainframeSession:
+    """A single logged-in mainframe session."""
+
+    def __init__(self, mainframe: MedicareMainframe):
         """
-        Initialize Medicare client.
-        
+        Initialize session.
+
         Args:
-            config: Configuration dictionary
+            mainframe: Mainframe configuration
         """
-        self.config = config
-        self.session = None
+        self.mainframe = mainframe
+        self.connected = False
+        self.last_used = time.monotonic()
 
-    async def connect(self, mainframe: MedicareMainframe) -> None:
+    async def connect(self) -> None:
         """
-        Establish connection to Medicare mainframe.
-        
-        Args:
-            mainframe: Mainframe configuration
-        
+        Log in to the mainframe.
+
         Raises:
             ConnectionError: If connection fails
         """
         try:
             # Decrypt password
-            password = decrypt_password(mainframe.password)
+            password = decrypt_password(self.mainframe.password)
 
             # Initialize connection
             # TODO: Implement actual mainframe connection logic
             await asyncio.sleep(0.1)  # Simulated connection delay
-            self.session = True
+            self.connected = True
+            self.last_used = time.monotonic()
 
-            logger.info(f"Connected to Medicare mainframe for carrier {mainframe.carrier_id}")
+            logger.info(f"Connected to Medicare mainframe for carrier {self.mainframe.carrier_id}")
 
         except Exception as e:
             logger.error(f"Failed to connect to Medicare mainframe: {str(e)}")
             raise ConnectionError(f"Mainframe connection failed: {str(e)}")
 
     async def disconnect(self) -> None:
-        """Close mainframe connection."""
-        if self.session:
+        """Log out of the mainframe."""
+        if self.connected:
             # TODO: Implement actual disconnection logic
             await asyncio.sleep(0.1)  # Simulated disconnection delay
-            self.session = None
+            self.connected = False
             logger.info("Disconnected from Medicare mainframe")
 
+    async def keep_alive(self) -> bool:
+        """
+        Send a no-op to keep the session from timing out.
+
+        Returns:
+            bool indicating whether the session is still usable
+        """
+        if not self.connected:
+            return False
+        await self._send_noop()
+        return True
+
+    async def _send_noop(self) -> None:
+        """
+        Send the mainframe no-op transaction.
+
+        The mainframe transport is simulated like connect() and disconnect(),
+        so this completes immediately. Replace it with a screen refresh when
+        the real connection logic lands.
+        """
+        await asyncio.sleep(0)
+
+class MainframeSessionPool:
+    """
+    Pool of persistent mainframe sessions per login.
+
+    Sessions are reused across searches instead of logging in and out for
+    every request. A background task keeps idle sessions alive and closes
+    those that have been idle longer than ``idle_timeout``.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 2,
+        keepalive_interval: float = 60.0,
+        idle_timeout: float = 600.0
+    ):
+        """
+        Initialize session pool.
+
+        Args:
+            max_sessions: Maximum concurrent sessions per mainframe login
+            keepalive_interval: Seconds between keep-alives on idle sessions
+            idle_timeout: Seconds before an idle session is closed
+        """
+        self.max_sessions = max_sessions
+        self.keepalive_interval = keepalive_interval
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[MainframeKey, List[MainframeSession]] = {}
+        self._limits: Dict[MainframeKey, asyncio.Semaphore] = {}
+        self._keepalive_task: Optional[asyncio.Task] = None
+
+    @asynccontextmanager
+    async def session(self, mainframe: MedicareMainframe) -> AsyncIterator[MainframeSession]:
+        """
+        Borrow a connected session for a mainframe login.
+
+        Args:
+            mainframe: Mainframe configuration
+
+        Yields:
+            Connected MainframeSession
+        """
+        self._ensure_keepalive()
+        key = mainframe_key(mainframe)
+        limit = self._limits.setdefault(key, asyncio.Semaphore(self.max_sessions))
+
+        async with limit:
+            idle = self._idle.setdefault(key, [])
+            session = idle.pop() if idle else MainframeSession(mainframe)
+            if not session.connected:
+                await session.connect()
+
+            healthy = False
+            try:
+                yield session
+                healthy = True
+            finally:
+                session.last_used = time.monotonic()
+                if healthy and session.connected:
+                    idle.append(session)
+                else:
+                    await session.disconnect()
+
+    async def close(self) -> None:
+        """Close all idle sessions and stop the keep-alive task."""
+        task, self._keepalive_task = self._keepalive_task, None
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        idle = list(self._idle.values())
+        self._idle.clear()
+        for sessions in idle:
+            for session in sessions:
+                await session.disconnect()
+
+    def _ensure_keepalive(self) -> None:
+        """Start the keep-alive task on first use."""
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+    async def _keepalive_loop(self) -> None:
+        """Keep idle sessions alive and expire stale ones."""
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            now = time.monotonic()
+            for _, sessions in list(self._idle.items()):
+                for session in list(sessions):
+                    try:
+                        if now - session.last_used > self.idle_timeout:
+                            sessions.remove(session)
+                            await session.disconnect()
+                        elif not await session.keep_alive():
+                            sessions.remove(session)
+                    except Exception as e:
+                        logger.warning(f"Mainframe keep-alive failed: {str(e)}")
+                        if session in sessions:
+                            sessions.remove(session)
+
+class MedicareClient:
+    """Client for Medicare mainframe interactions."""
+
+    def __init__(self, config):
+        """
+        Initialize Medicare client.
+
+        Args:
+            config: Configuration (settings object or dictionary)
+        """
+        self.config = config
+        self.session = None
+        self.session_pool = MainframeSessionPool(
+            max_sessions=self._config_value("MAINFRAME_SESSIONS_PER_HOST", 2),
+            keepalive_interval=self._config_value("MAINFRAME_KEEPALIVE_INTERVAL", 60.0),
+            idle_timeout=self._config_value("MAINFRAME_IDLE_TIMEOUT", 600.0)
+        )
+
+    def _config_value(self, name: str, default):
+        """Read a setting from a dict or settings object."""
+        if isinstance(self.config, dict):
+            return self.config.get(name, default)
+        return getattr(self.config, name, default)
+
+    async def connect(self, mainframe: MedicareMainframe) -> None:
+        """
+        Establish a standalone connection to Medicare mainframe.
+
+        Args:
+            mainframe: Mainframe configuration
+
+        Raises:
+            ConnectionError: If connection fails
+        """
+        self.session = MainframeSession(mainframe)
+        await self.session.connect()
+
+    async def disconnect(self) -> None:
+        """Close standalone and pooled mainframe connections."""
+        if self.session:
+            await self.session.disconnect()
+            self.session = None
+        await self.session_pool.close()
+
     async def search_cmn(
         self,
         mainframe: MedicareMainframe,
@@ -69,44 +242,76 @@ class MedicareClient:
     ) -> List[CmnResponseEntry]:
         """
         Search for CMN records.
-        
+
         Args:
             mainframe: Mainframe configuration
             criteria: Search criteria
-        
+
         Returns:
             List of matching CMN entries
-        
+
         Raises:
             ConnectionError: If mainframe connection fails
             ValueError: If search criteria invalid
         """
+        results = await self.search_cmn_bulk(mainframe, [criteria])
+        return results[0]
+
+    async def search_cmn_bulk(
+        self,
+        mainframe: MedicareMainframe,
+        criteria_list: List[CmnSearchCriteria]
+    ) -> List[List[CmnResponseEntry]]:
+        """
+        Run several CMN searches against one mainframe over a single session.
+
+        Args:
+            mainframe: Mainframe configuration
+            criteria_list: Search criteria, one per search
+
+        Returns:
+            List of matching CMN entries per criteria, in input order
+
+        Raises:
+            ConnectionError: If mainframe connection fails
+            ValueError: If any search criteria invalid
+        """
+        for criteria in criteria_list:
+            self._validate_criteria(criteria)
+
         try:
-            # Connect to mainframe
-            if not self.session:
-                await self.connect(mainframe)
-
-            # Validate search criteria
-            if not any([
-                criteria.npi,
-                criteria.hic,
-                criteria.mbi,
-                criteria.hcpcs
-            ]):
-                raise ValueError("At least one search criterion must be provided")
-
-            # TODO: Implement actual mainframe search logic
-            # For now, return mock data
-            await asyncio.sleep(0.5)  # Simulated search delay
-            
-            return self._generate_mock_results(criteria)
+            async with self.session_pool.session(mainframe) as session:
+                results = []
+                for criteria in criteria_list:
+                    results.append(await self._search(session, criteria))
+                return results
 
         except Exception as e:
             logger.error(f"CMN search failed: {str(e)}")
             raise
 
-        finally:
-            await self.disconnect()
+    def _validate_criteria(self, criteria: CmnSearchCriteria) -> None:
+        """Validate search criteria."""
+        if not any([
+            criteria.npi,
+            criteria.hic,
+            criteria.mbi,
+            criteria.hcpcs
+        ]):
+            raise ValueError("At least one search criterion must be provided")
+
+    async def _search(
+        self,
+        session: MainframeSession,
+        criteria: CmnSearchCriteria
+    ) -> List[CmnResponseEntry]:
+        """Run one search on an open session."""
+        # TODO: Implement actual mainframe search logic
+        # For now, return mock data
+        await asyncio.sleep(0.5)  # Simulated search delay
+        session.last_used = time.monotonic()
+
+        return self._generate_mock_results(criteria)
 
     def _generate_mock_results(
         self,
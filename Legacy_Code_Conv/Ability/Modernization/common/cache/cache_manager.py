@@ -5,8 +5,7 @@ Provides a unified caching system with support for multiple backends.
 """
 from datetime import datetime, timedelta
 from functools import wraps
-import json
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
 import aioredis
 from fastapi import FastAPI
 from pydantic import BaseModel
@@ -14,6 +13,7 @@ from pydantic import BaseModel
 from ..config import get_settings
 from ..monitoring.logger import get_logger
 from ..errors.error_handler import TechnicalError
+from .serializers import Codec
 
 settings = get_settings()
 logger = get_logger(__name__)
@@ -25,7 +25,9 @@ class CacheConfig(BaseModel):
     ttl: int = 3600  # Default TTL in seconds
     prefix: str = ""
     namespace: str = ""
-    serializer: str = "json"  # json or pickle
+    serializer: str = "json"  # json, orjson or msgpack
+    compression: Optional[str] = None  # zstd or lz4
+    compress_threshold: int = 1024  # Only compress payloads at least this large
 
 class CacheManager:
     """Manages caching operations."""
@@ -33,6 +35,7 @@ class CacheManager:
     def __init__(self, app: Optional[FastAPI] = None):
         """Initialize cache manager."""
         self.redis: Optional[aioredis.Redis] = None
+        self._codecs: Dict[Tuple[str, Optional[str], int], Codec] = {}
         if app:
             self.init_app(app)
 
@@ -47,8 +50,7 @@ class CacheManager:
             self.redis = await aioredis.create_redis_pool(
                 settings.REDIS_URL,
                 minsize=5,
-                maxsize=10,
-                encoding='utf-8'
+                maxsize=10
             )
             
             @app.on_event("shutdown")
@@ -88,11 +90,32 @@ class CacheManager:
         parts.append(key)
         return ":".join(parts)
 
+    def _codec(self, config: CacheConfig) -> Codec:
+        """
+        Get the codec for a cache configuration.
+        
+        Args:
+            config: Cache configuration
+            
+        Returns:
+            Codec instance, shared across calls with the same settings
+        """
+        key = (config.serializer, config.compression, config.compress_threshold)
+        codec = self._codecs.get(key)
+        if codec is None:
+            codec = Codec(
+                serializer=config.serializer,
+                compression=config.compression,
+                compress_threshold=config.compress_threshold
+            )
+            self._codecs[key] = codec
+        return codec
+
     def _serialize(
         self,
         value: Any,
         config: CacheConfig
-    ) -> str:
+    ) -> bytes:
         """
         Serialize value for caching.
         
@@ -103,21 +126,20 @@ class CacheManager:
         Returns:
             Serialized value
         """
-        if config.serializer == "json":
-            if isinstance(value, BaseModel):
-                return value.json()
-            return json.dumps(value)
-        raise ValueError(f"Unsupported serializer: {config.serializer}")
+        return self._codec(config).encode(value)
 
     def _deserialize(
         self,
-        value: str,
+        value: bytes,
         target_type: Optional[Type[T]] = None,
         config: CacheConfig = CacheConfig()
     ) -> Any:
         """
         Deserialize cached value.
         
+        Models are validated from the parsed payload, so each value is
+        parsed once.
+        
         Args:
             value: Value to deserialize
             target_type: Optional target type
@@ -126,12 +148,7 @@ class CacheManager:
         Returns:
             Deserialized value
         """
-        if config.serializer == "json":
-            data = json.loads(value)
-            if target_type and issubclass(target_type, BaseModel):
-                return target_type.parse_raw(value)
-            return data
-        raise ValueError(f"Unsupported serializer: {config.serializer}")
+        return self._codec(config).decode(value, target_type)
 
     async def get(
         self,
@@ -197,6 +214,82 @@ class CacheManager:
         except Exception as e:
             logger.error(f"Cache set failed: {str(e)}")
 
+    async def get_many(
+        self,
+        keys: List[str],
+        target_type: Optional[Type[T]] = None,
+        config: CacheConfig = CacheConfig()
+    ) -> List[Optional[T]]:
+        """
+        Get several values from cache in one round trip.
+        
+        Args:
+            keys: Cache keys
+            target_type: Optional target type
+            config: Cache configuration
+            
+        Returns:
+            Cached values aligned with keys, None for misses
+        """
+        if not keys:
+            return []
+
+        try:
+            if not self.redis:
+                raise TechnicalError("Cache not initialized")
+                
+            full_keys = [self._build_key(key, config) for key in keys]
+            values = await self.redis.mget(*full_keys)
+
+            results: List[Optional[T]] = []
+            for value in values:
+                if not value:
+                    results.append(None)
+                    continue
+                try:
+                    results.append(self._deserialize(value, target_type, config))
+                except Exception as e:
+                    logger.error(f"Cache value decode failed: {str(e)}")
+                    results.append(None)
+            return results
+            
+        except Exception as e:
+            logger.error(f"Cache get_many failed: {str(e)}")
+            return [None] * len(keys)
+
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        config: CacheConfig = CacheConfig()
+    ):
+        """
+        Set several values in cache in one pipeline.
+        
+        Args:
+            items: Mapping of cache key to value
+            ttl: Optional TTL override
+            config: Cache configuration
+        """
+        if not items:
+            return
+
+        try:
+            if not self.redis:
+                raise TechnicalError("Cache not initialized")
+                
+            pipe = self.redis.pipeline()
+            for key, value in items.items():
+                pipe.set(
+                    self._build_key(key, config),
+                    self._serialize(value, config),
+                    expire=ttl or config.ttl
+                )
+            await pipe.execute()
+            
+        except Exception as e:
+            logger.error(f"Cache set_many failed: {str(e)}")
+
     async def delete(
         self,
         key: str,
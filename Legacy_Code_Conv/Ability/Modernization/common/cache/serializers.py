@@ -0,0 +1,274 @@
+"""
+Cache Serializers
+
+Pluggable value serializers and compressors for the CacheManager.
+
+Stored payloads are framed with a one-byte codec marker so compressed and
+uncompressed values can share a keyspace. Values written before framing was
+introduced (plain JSON text) start with a printable character and are read
+as uncompressed.
+"""
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+import json
+from typing import Any, Callable, Dict, Optional, Type
+from uuid import UUID
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+def _default(value: Any) -> Any:
+    """Encode types the binary formats do not support natively."""
+    if isinstance(value, BaseModel):
+        return to_python(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+def to_python(value: Any) -> Any:
+    """
+    Dump a Pydantic model to Python objects; other values pass through.
+
+    Dates, UUIDs and the like are left for the serializer, which encodes
+    them natively or through ``_default``.
+    """
+    if isinstance(value, BaseModel):
+        if hasattr(value, "model_dump"):
+            return value.model_dump()
+        return value.dict()
+    return value
+
+def validate_model(target_type: Type[BaseModel], data: Any) -> BaseModel:
+    """Build a model from already-parsed data without re-parsing."""
+    if hasattr(target_type, "model_validate"):
+        return target_type.model_validate(data)
+    return target_type.parse_obj(data)
+
+class Serializer(ABC):
+    """Serializer interface."""
+
+    name: str = "abstract"
+    # Output is JSON text, so models can be validated straight from bytes
+    json_text: bool = False
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value."""
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Decode a value."""
+
+class JsonSerializer(Serializer):
+    """Standard library JSON."""
+
+    name = "json"
+    json_text = True
+
+    def dumps(self, value: Any) -> bytes:
+        if isinstance(value, BaseModel):
+            if hasattr(value, "model_dump_json"):
+                return value.model_dump_json().encode()
+            return value.json().encode()
+        return json.dumps(value, default=_default).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+class OrjsonSerializer(Serializer):
+    """orjson: JSON-compatible output, several times faster than json."""
+
+    name = "orjson"
+    json_text = True
+
+    def __init__(self):
+        if orjson is None:
+            raise ValueError("orjson serializer requires the 'orjson' package")
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(
+            to_python(value),
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+class MsgpackSerializer(Serializer):
+    """MessagePack: compact binary encoding."""
+
+    name = "msgpack"
+
+    def __init__(self):
+        if msgpack is None:
+            raise ValueError("msgpack serializer requires the 'msgpack' package")
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(to_python(value), default=_default, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+class Compressor(ABC):
+    """Compressor interface."""
+
+    name: str = "abstract"
+    marker: bytes = b""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress encoded bytes."""
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Restore compressed bytes."""
+
+class ZstdCompressor(Compressor):
+    """Zstandard: best ratio at a moderate CPU cost."""
+
+    name = "zstd"
+    marker = b"\x01"
+
+    def __init__(self, level: int = 3):
+        if zstandard is None:
+            raise ValueError("zstd compression requires the 'zstandard' package")
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+class Lz4Compressor(Compressor):
+    """LZ4: lowest CPU cost, lighter compression."""
+
+    name = "lz4"
+    marker = b"\x02"
+
+    def __init__(self):
+        if lz4_frame is None:
+            raise ValueError("lz4 compression requires the 'lz4' package")
+
+    def compress(self, data: bytes) -> bytes:
+        return lz4_frame.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lz4_frame.decompress(data)
+
+UNCOMPRESSED = b"\x00"
+
+SERIALIZERS: Dict[str, Callable[[], Serializer]] = {
+    "json": JsonSerializer,
+    "orjson": OrjsonSerializer,
+    "msgpack": MsgpackSerializer,
+}
+
+COMPRESSORS: Dict[str, Callable[[], Compressor]] = {
+    "zstd": ZstdCompressor,
+    "lz4": Lz4Compressor,
+}
+
+class Codec:
+    """A serializer plus optional compression above a size threshold."""
+
+    def __init__(
+        self,
+        serializer: str = "json",
+        compression: Optional[str] = None,
+        compress_threshold: int = 1024
+    ):
+        """
+        Initialize codec.
+
+        Args:
+            serializer: Serializer name
+            compression: Optional compressor name
+            compress_threshold: Minimum encoded size in bytes to compress
+
+        Raises:
+            ValueError: If the serializer or compressor is unknown or unavailable
+        """
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unsupported serializer: {serializer}")
+        if compression and compression not in COMPRESSORS:
+            raise ValueError(f"Unsupported compression: {compression}")
+
+        self.serializer = SERIALIZERS[serializer]()
+        self.compressor = COMPRESSORS[compression]() if compression else None
+        self.compress_threshold = compress_threshold
+        self._decompressors: Dict[bytes, Compressor] = {}
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize and frame a value."""
+        data = self.serializer.dumps(value)
+        if self.compressor and len(data) >= self.compress_threshold:
+            return self.compressor.marker + self.compressor.compress(data)
+        return UNCOMPRESSED + data
+
+    def decode(
+        self,
+        payload: bytes,
+        target_type: Optional[Type[Any]] = None
+    ) -> Any:
+        """Unframe and deserialize a value, parsing it exactly once."""
+        if isinstance(payload, str):
+            payload = payload.encode()
+
+        marker = payload[:1]
+        if marker == UNCOMPRESSED:
+            data = payload[1:]
+        elif self.compressor and marker == self.compressor.marker:
+            data = self.compressor.decompress(payload[1:])
+        elif marker in (ZstdCompressor.marker, Lz4Compressor.marker):
+            # Written with a different compression setting
+            data = self._decompressor(marker).decompress(payload[1:])
+        else:
+            # Unframed legacy value
+            data = payload
+
+        if (
+            target_type
+            and isinstance(target_type, type)
+            and issubclass(target_type, BaseModel)
+        ):
+            if self.serializer.json_text and hasattr(target_type, "model_validate_json"):
+                return target_type.model_validate_json(data)
+            return validate_model(target_type, self.serializer.loads(data))
+        return self.serializer.loads(data)
+
+    def _decompressor(self, marker: bytes) -> Compressor:
+        """Get a decompressor for a marker written under other settings."""
+        if marker not in self._decompressors:
+            factory = ZstdCompressor if marker == ZstdCompressor.marker else Lz4Compressor
+            self._decompressors[marker] = factory()
+        return self._decompressors[marker]
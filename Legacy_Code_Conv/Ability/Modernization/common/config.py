@@ -73,6 +73,15 @@ class CommonSettings(BaseSettings):
         description="Allowed file extensions"
     )
 
+    # File Storage
+    STORAGE_BACKEND: str = Field("azure", description="Storage backend (azure or local)")
+    LOCAL_STORAGE_PATH: str = Field("./storage", description="Root directory for local storage")
+    UPLOAD_BLOCK_SIZE: int = Field(
+        4 * 1024 * 1024,
+        description="Block size in bytes for streamed uploads and reads"
+    )
+    UPLOAD_CONCURRENCY: int = Field(4, description="Blocks staged concurrently per upload")
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
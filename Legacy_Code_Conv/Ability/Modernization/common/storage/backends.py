@@ -0,0 +1,369 @@
+"""
+Storage Backends
+
+Block-oriented storage backends used by the FileManager. Uploads are staged
+as numbered blocks and committed once every block has been written, so a
+file never has to be held in memory in full.
+"""
+from abc import ABC, abstractmethod
+import base64
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
+import uuid
+
+import aiofiles
+import aiofiles.os
+
+class StoredObject:
+    """Properties of a stored file as reported by a backend."""
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        content_type: str,
+        created_at: datetime,
+        last_modified: datetime,
+        filename: Optional[str] = None,
+        hash: str = "",
+        metadata: Optional[Dict[str, str]] = None
+    ):
+        self.path = path
+        self.size = size
+        self.content_type = content_type
+        self.created_at = created_at
+        self.last_modified = last_modified
+        self.filename = filename or Path(path).name
+        self.hash = hash
+        self.metadata = metadata or {}
+
+class StorageBackend(ABC):
+    """Interface for block-staged storage backends."""
+
+    name: str = "abstract"
+
+    @staticmethod
+    def block_id(index: int) -> str:
+        """Build a fixed-width block id for a block index."""
+        return base64.b64encode(f"{index:08d}".encode()).decode()
+
+    @abstractmethod
+    async def begin_upload(self, path: str) -> str:
+        """
+        Start a staged upload.
+
+        Args:
+            path: Destination path
+
+        Returns:
+            Upload id passed to the other upload calls
+        """
+
+    @abstractmethod
+    async def stage_block(
+        self,
+        upload_id: str,
+        path: str,
+        index: int,
+        offset: int,
+        data: bytes
+    ):
+        """
+        Stage one block of an upload.
+
+        Args:
+            upload_id: Upload id from begin_upload
+            path: Destination path
+            index: Block index
+            offset: Byte offset of the block in the file
+            data: Block content
+        """
+
+    @abstractmethod
+    async def commit_upload(
+        self,
+        upload_id: str,
+        path: str,
+        block_count: int,
+        content_type: str,
+        filename: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> StoredObject:
+        """
+        Commit staged blocks as the file at path.
+
+        Returns:
+            Properties of the committed file
+        """
+
+    @abstractmethod
+    async def abort_upload(self, upload_id: str, path: str):
+        """Discard staged blocks of an unfinished upload."""
+
+    @abstractmethod
+    async def get_properties(self, path: str) -> StoredObject:
+        """Get properties of a stored file."""
+
+    @abstractmethod
+    def read_range(
+        self,
+        path: str,
+        offset: int = 0,
+        length: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Read a byte range of a stored file.
+
+        Args:
+            path: File path
+            offset: First byte to read
+            length: Number of bytes to read, None for the rest of the file
+
+        Yields:
+            File chunks
+        """
+
+    @abstractmethod
+    async def delete(self, path: str):
+        """Delete a stored file."""
+
+    @abstractmethod
+    def list_paths(self, prefix: Optional[str] = None) -> AsyncIterator[str]:
+        """List stored file paths under a prefix."""
+
+class AzureBlobBackend(StorageBackend):
+    """Azure Blob Storage backend using staged block blobs."""
+
+    name = "azure"
+
+    def __init__(self, container_client):
+        """
+        Initialize backend.
+
+        Args:
+            container_client: Async Azure container client
+        """
+        self.container_client = container_client
+
+    async def begin_upload(self, path: str) -> str:
+        # Uncommitted blocks live on the blob itself until commit
+        return path
+
+    async def stage_block(
+        self,
+        upload_id: str,
+        path: str,
+        index: int,
+        offset: int,
+        data: bytes
+    ):
+        blob_client = self.container_client.get_blob_client(path)
+        await blob_client.stage_block(self.block_id(index), data, length=len(data))
+
+    async def commit_upload(
+        self,
+        upload_id: str,
+        path: str,
+        block_count: int,
+        content_type: str,
+        filename: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> StoredObject:
+        from azure.storage.blob import BlobBlock, ContentSettings
+
+        blob_client = self.container_client.get_blob_client(path)
+        await blob_client.commit_block_list(
+            [BlobBlock(block_id=self.block_id(i)) for i in range(block_count)],
+            content_settings=ContentSettings(
+                content_type=content_type,
+                content_disposition=f'attachment; filename="{filename}"'
+            ),
+            metadata=metadata
+        )
+        return await self.get_properties(path)
+
+    async def abort_upload(self, upload_id: str, path: str):
+        # Azure garbage-collects uncommitted blocks after a week
+        pass
+
+    async def get_properties(self, path: str) -> StoredObject:
+        blob_client = self.container_client.get_blob_client(path)
+        properties = await blob_client.get_blob_properties()
+        metadata = properties.metadata or {}
+        content_md5 = properties.content_settings.content_md5
+        return StoredObject(
+            path=path,
+            size=properties.size,
+            content_type=properties.content_settings.content_type,
+            created_at=properties.creation_time,
+            last_modified=properties.last_modified,
+            hash=metadata.get("sha256") or (content_md5.hex() if content_md5 else ""),
+            metadata=metadata
+        )
+
+    async def read_range(
+        self,
+        path: str,
+        offset: int = 0,
+        length: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        blob_client = self.container_client.get_blob_client(path)
+        downloader = await blob_client.download_blob(offset=offset, length=length)
+        async for chunk in downloader.chunks():
+            yield chunk
+
+    async def delete(self, path: str):
+        blob_client = self.container_client.get_blob_client(path)
+        await blob_client.delete_blob()
+
+    async def list_paths(self, prefix: Optional[str] = None) -> AsyncIterator[str]:
+        async for blob in self.container_client.list_blobs(name_starts_with=prefix):
+            yield blob.name
+
+class LocalFileBackend(StorageBackend):
+    """
+    Local filesystem backend.
+
+    Blocks are written at their offsets into a temporary part file that is
+    renamed into place on commit. Content type and metadata are kept in a
+    JSON sidecar under ``.meta``.
+    """
+
+    name = "local"
+
+    def __init__(self, root: Path, read_chunk_size: int = 1024 * 1024):
+        """
+        Initialize backend.
+
+        Args:
+            root: Storage root directory
+            read_chunk_size: Chunk size for reads
+        """
+        self.root = Path(root)
+        self.read_chunk_size = read_chunk_size
+        self._uploads_dir = self.root / ".uploads"
+        self._meta_dir = self.root / ".meta"
+        self._uploads_dir.mkdir(parents=True, exist_ok=True)
+        self._meta_dir.mkdir(parents=True, exist_ok=True)
+
+    def _file_path(self, path: str) -> Path:
+        """Resolve a storage path, refusing paths outside the root."""
+        resolved = (self.root / path).resolve()
+        if self.root.resolve() not in resolved.parents:
+            raise ValueError(f"Invalid storage path: {path}")
+        return resolved
+
+    def _meta_path(self, path: str) -> Path:
+        return self._meta_dir / f"{path}.json"
+
+    def _part_path(self, upload_id: str) -> Path:
+        return self._uploads_dir / f"{upload_id}.part"
+
+    async def begin_upload(self, path: str) -> str:
+        self._file_path(path)
+        upload_id = uuid.uuid4().hex
+        async with aiofiles.open(self._part_path(upload_id), "wb"):
+            pass
+        return upload_id
+
+    async def stage_block(
+        self,
+        upload_id: str,
+        path: str,
+        index: int,
+        offset: int,
+        data: bytes
+    ):
+        async with aiofiles.open(self._part_path(upload_id), "r+b") as f:
+            await f.seek(offset)
+            await f.write(data)
+
+    async def commit_upload(
+        self,
+        upload_id: str,
+        path: str,
+        block_count: int,
+        content_type: str,
+        filename: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> StoredObject:
+        target = self._file_path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self._part_path(upload_id), target)
+
+        meta_path = self._meta_path(path)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(meta_path, "w") as f:
+            await f.write(json.dumps({
+                "content_type": content_type,
+                "filename": filename,
+                "metadata": metadata or {}
+            }))
+        return await self.get_properties(path)
+
+    async def abort_upload(self, upload_id: str, path: str):
+        try:
+            await aiofiles.os.remove(self._part_path(upload_id))
+        except FileNotFoundError:
+            pass
+
+    async def get_properties(self, path: str) -> StoredObject:
+        target = self._file_path(path)
+        stat = await aiofiles.os.stat(target)
+
+        sidecar: Dict = {}
+        meta_path = self._meta_path(path)
+        if meta_path.exists():
+            async with aiofiles.open(meta_path, "r") as f:
+                sidecar = json.loads(await f.read())
+        metadata = sidecar.get("metadata", {})
+
+        return StoredObject(
+            path=path,
+            size=stat.st_size,
+            content_type=sidecar.get("content_type", "application/octet-stream"),
+            created_at=datetime.fromtimestamp(stat.st_ctime, tz=timezone.utc),
+            last_modified=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            filename=sidecar.get("filename"),
+            hash=metadata.get("sha256", ""),
+            metadata=metadata
+        )
+
+    async def read_range(
+        self,
+        path: str,
+        offset: int = 0,
+        length: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        remaining = length
+        async with aiofiles.open(self._file_path(path), "rb") as f:
+            await f.seek(offset)
+            while remaining is None or remaining > 0:
+                size = self.read_chunk_size
+                if remaining is not None:
+                    size = min(size, remaining)
+                chunk = await f.read(size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    async def delete(self, path: str):
+        await aiofiles.os.remove(self._file_path(path))
+        try:
+            await aiofiles.os.remove(self._meta_path(path))
+        except FileNotFoundError:
+            pass
+
+    async def list_paths(self, prefix: Optional[str] = None) -> AsyncIterator[str]:
+        internal = {self._uploads_dir, self._meta_dir}
+        for file_path in sorted(self.root.rglob("*")):
+            if not file_path.is_file() or internal & set(file_path.parents):
+                continue
+            relative = file_path.relative_to(self.root).as_posix()
+            if prefix is None or relative.startswith(prefix):
+                yield relative
@@ -3,24 +3,29 @@ File Management System
 
 Provides a unified interface for file operations across different storage backends.
 """
+import asyncio
 from datetime import datetime, timedelta
 import hashlib
-import mimetypes
 from pathlib import Path
-from typing import AsyncIterator, Dict, List, Optional, Union
+import re
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 import aiofiles
 from azure.storage.blob.aio import BlobServiceClient
-from azure.storage.blob import ContentSettings, generate_blob_sas, BlobSasPermissions
+from azure.storage.blob import generate_blob_sas, BlobSasPermissions
 from fastapi import HTTPException, UploadFile, status
+from fastapi.responses import StreamingResponse
 import magic
 from pydantic import BaseModel
 
 from ..config import get_settings
 from ..monitoring.logger import get_logger
+from .backends import AzureBlobBackend, LocalFileBackend, StorageBackend, StoredObject
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
 class FileMetadata(BaseModel):
     """File metadata model."""
     filename: str
@@ -33,19 +38,82 @@ class FileMetadata(BaseModel):
     path: str
     metadata: Dict[str, str] = {}
 
-class FileManager:
-    """Manages file operations across different storage backends."""
+def parse_range_header(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range HTTP Range header.
     
-    def __init__(self):
-        """Initialize file manager."""
-        self.blob_service = BlobServiceClient.from_connection_string(
-            settings.AZURE_STORAGE_CONNECTION_STRING
+    Args:
+        range_header: Range header value, e.g. "bytes=0-1023"
+        size: Total file size
+        
+    Returns:
+        Inclusive (start, end) byte positions, or None for the whole file
+        
+    Raises:
+        HTTPException: 416 if the range cannot be satisfied
+    """
+    if not range_header:
+        return None
+
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match or match.groups() == ("", ""):
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Invalid range",
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: last N bytes
+        start = max(size - int(last), 0)
+        end = size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"}
         )
-        self.container_client = self.blob_service.get_container_client(
-            settings.AZURE_STORAGE_CONTAINER
+    return start, end
+
+def create_storage_backend() -> StorageBackend:
+    """Create the storage backend selected in settings."""
+    if settings.STORAGE_BACKEND == "local":
+        return LocalFileBackend(
+            Path(settings.LOCAL_STORAGE_PATH),
+            read_chunk_size=settings.UPLOAD_BLOCK_SIZE
         )
-        self.local_storage_path = Path(settings.LOCAL_STORAGE_PATH)
-        self.local_storage_path.mkdir(parents=True, exist_ok=True)
+    blob_service = BlobServiceClient.from_connection_string(
+        settings.AZURE_STORAGE_CONNECTION_STRING
+    )
+    return AzureBlobBackend(
+        blob_service.get_container_client(settings.AZURE_CONTAINER_NAME)
+    )
+
+class FileManager:
+    """Manages file operations across different storage backends."""
+    
+    def __init__(
+        self,
+        backend: Optional[StorageBackend] = None,
+        block_size: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ):
+        """
+        Initialize file manager.
+        
+        Args:
+            backend: Storage backend, defaults to the one selected in settings
+            block_size: Block size in bytes for streamed uploads
+            concurrency: Blocks staged concurrently per upload
+        """
+        self.backend = backend or create_storage_backend()
+        self.block_size = block_size or settings.UPLOAD_BLOCK_SIZE
+        self.concurrency = concurrency or settings.UPLOAD_CONCURRENCY
 
     async def upload_file(
         self,
@@ -56,6 +124,10 @@ class FileManager:
         """
         Upload file to storage.
         
+        The file is read in fixed-size blocks which are hashed incrementally
+        and staged concurrently, then committed in order. At most
+        ``concurrency`` blocks are held in memory at a time.
+        
         Args:
             file: File to upload
             destination: Destination path
@@ -68,43 +140,29 @@ class FileManager:
             # Determine content type
             if isinstance(file, UploadFile):
                 content_type = file.content_type
-                file_content = await file.read()
                 filename = file.filename
+                blocks = self._read_upload_blocks(file)
             else:
                 content_type = magic.from_file(str(file), mime=True)
-                async with aiofiles.open(file, 'rb') as f:
-                    file_content = await f.read()
                 filename = file.name
+                blocks = self._read_path_blocks(file)
 
-            # Calculate hash
-            file_hash = hashlib.sha256(file_content).hexdigest()
-            
-            # Upload to Azure Blob Storage
-            blob_client = self.container_client.get_blob_client(destination)
-            
-            content_settings = ContentSettings(
-                content_type=content_type,
-                content_disposition=f'attachment; filename="{filename}"'
+            stored, file_hash = await self._upload_blocks(
+                blocks,
+                destination,
+                content_type,
+                filename,
+                metadata
             )
-            
-            await blob_client.upload_blob(
-                file_content,
-                content_settings=content_settings,
-                metadata=metadata,
-                overwrite=True
-            )
-            
-            # Get blob properties
-            properties = await blob_client.get_blob_properties()
-            
+
             return FileMetadata(
                 filename=filename,
                 content_type=content_type,
-                size=len(file_content),
+                size=stored.size,
                 hash=file_hash,
-                created_at=properties.creation_time,
-                last_modified=properties.last_modified,
-                storage_backend="azure",
+                created_at=stored.created_at,
+                last_modified=stored.last_modified,
+                storage_backend=self.backend.name,
                 path=destination,
                 metadata=metadata or {}
             )
@@ -116,6 +174,77 @@ class FileManager:
                 detail=f"File upload failed: {str(e)}"
             )
 
+    async def _upload_blocks(
+        self,
+        blocks: AsyncIterator[bytes],
+        destination: str,
+        content_type: str,
+        filename: str,
+        metadata: Optional[Dict[str, str]]
+    ) -> Tuple[StoredObject, str]:
+        """Stage blocks concurrently, then commit them in order."""
+        hasher = hashlib.sha256()
+        slots = asyncio.Semaphore(self.concurrency)
+        tasks: List[asyncio.Task] = []
+        upload_id = await self.backend.begin_upload(destination)
+
+        async def stage(index: int, offset: int, data: bytes):
+            try:
+                await self.backend.stage_block(upload_id, destination, index, offset, data)
+            finally:
+                slots.release()
+
+        try:
+            offset = 0
+            index = 0
+            async for data in blocks:
+                hasher.update(data)
+                # Bound buffered blocks before reading the next one
+                await slots.acquire()
+                tasks.append(asyncio.create_task(stage(index, offset, data)))
+                offset += len(data)
+                index += 1
+                failed = [t for t in tasks if t.done() and t.exception()]
+                if failed:
+                    raise failed[0].exception()
+
+            await asyncio.gather(*tasks)
+
+            file_hash = hasher.hexdigest()
+            stored = await self.backend.commit_upload(
+                upload_id,
+                destination,
+                index,
+                content_type,
+                filename,
+                {**(metadata or {}), "sha256": file_hash}
+            )
+            return stored, file_hash
+
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.backend.abort_upload(upload_id, destination)
+            raise
+
+    async def _read_upload_blocks(self, file: UploadFile) -> AsyncIterator[bytes]:
+        """Read an UploadFile in fixed-size blocks."""
+        while True:
+            data = await file.read(self.block_size)
+            if not data:
+                break
+            yield data
+
+    async def _read_path_blocks(self, path: Path) -> AsyncIterator[bytes]:
+        """Read a local file in fixed-size blocks."""
+        async with aiofiles.open(path, 'rb') as f:
+            while True:
+                data = await f.read(self.block_size)
+                if not data:
+                    break
+                yield data
+
     async def download_file(
         self,
         path: str,
@@ -132,18 +261,16 @@ class FileManager:
             File content or local path
         """
         try:
-            blob_client = self.container_client.get_blob_client(path)
-            
             if destination:
                 # Download to file
                 destination.parent.mkdir(parents=True, exist_ok=True)
                 async with aiofiles.open(destination, "wb") as f:
-                    async for chunk in blob_client.download_blob().chunks():
+                    async for chunk in self.backend.read_range(path):
                         await f.write(chunk)
                 return destination
             else:
                 # Return content
-                return await blob_client.download_blob().content_as_bytes()
+                return b"".join([chunk async for chunk in self.backend.read_range(path)])
                 
         except Exception as e:
             logger.error(f"File download failed: {str(e)}")
@@ -160,8 +287,7 @@ class FileManager:
             path: File path
         """
         try:
-            blob_client = self.container_client.get_blob_client(path)
-            await blob_client.delete_blob()
+            await self.backend.delete(path)
             
         except Exception as e:
             logger.error(f"File deletion failed: {str(e)}")
@@ -181,19 +307,18 @@ class FileManager:
             File metadata
         """
         try:
-            blob_client = self.container_client.get_blob_client(path)
-            properties = await blob_client.get_blob_properties()
+            stored = await self.backend.get_properties(path)
             
             return FileMetadata(
-                filename=Path(path).name,
-                content_type=properties.content_settings.content_type,
-                size=properties.size,
-                hash=properties.content_settings.content_md5 or "",
-                created_at=properties.creation_time,
-                last_modified=properties.last_modified,
-                storage_backend="azure",
+                filename=stored.filename,
+                content_type=stored.content_type,
+                size=stored.size,
+                hash=stored.hash,
+                created_at=stored.created_at,
+                last_modified=stored.last_modified,
+                storage_backend=self.backend.name,
                 path=path,
-                metadata=properties.metadata or {}
+                metadata=stored.metadata
             )
             
         except Exception as e:
@@ -220,11 +345,8 @@ class FileManager:
         """
         try:
             files = []
-            async for blob in self.container_client.list_blobs(
-                name_starts_with=prefix,
-                results_per_page=max_results
-            ):
-                metadata = await self.get_file_metadata(blob.name)
+            async for path in self.backend.list_paths(prefix):
+                metadata = await self.get_file_metadata(path)
                 files.append(metadata)
                 
                 if max_results and len(files) >= max_results:
@@ -254,8 +376,14 @@ class FileManager:
         Returns:
             Temporary URL
         """
+        if not isinstance(self.backend, AzureBlobBackend):
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="Temporary URLs require the Azure storage backend"
+            )
+
         try:
-            blob_client = self.container_client.get_blob_client(path)
+            blob_client = self.backend.container_client.get_blob_client(path)
             
             sas_token = generate_blob_sas(
                 account_name=blob_client.account_name,
@@ -275,20 +403,26 @@ class FileManager:
                 detail=f"Failed to generate file URL: {str(e)}"
             )
 
-    async def stream_file(self, path: str) -> AsyncIterator[bytes]:
+    async def stream_file(
+        self,
+        path: str,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
         """
         Stream file content.
         
         Args:
             path: File path
+            start: First byte to stream
+            end: Last byte to stream (inclusive), None for end of file
             
         Yields:
             File chunks
         """
         try:
-            blob_client = self.container_client.get_blob_client(path)
-            
-            async for chunk in blob_client.download_blob().chunks():
+            length = None if end is None else end - start + 1
+            async for chunk in self.backend.read_range(path, start, length):
                 yield chunk
                 
         except Exception as e:
@@ -298,4 +432,38 @@ class FileManager:
                 detail=f"File streaming failed: {str(e)}"
             )
 
+    async def stream_response(
+        self,
+        path: str,
+        range_header: Optional[str] = None
+    ) -> StreamingResponse:
+        """
+        Build a streaming response honouring an HTTP Range header.
+        
+        Args:
+            path: File path
+            range_header: Optional Range request header
+            
+        Returns:
+            200 response for the whole file or 206 for a byte range
+        """
+        metadata = await self.get_file_metadata(path)
+        byte_range = parse_range_header(range_header, metadata.size)
+        start, end = byte_range or (0, max(metadata.size - 1, 0))
+
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": f'attachment; filename="{metadata.filename}"',
+            "Content-Length": str(end - start + 1 if metadata.size else 0)
+        }
+        if byte_range:
+            headers["Content-Range"] = f"bytes {start}-{end}/{metadata.size}"
+
+        return StreamingResponse(
+            self.stream_file(path, start, end if byte_range else None),
+            status_code=status.HTTP_206_PARTIAL_CONTENT if byte_range else status.HTTP_200_OK,
+            media_type=metadata.content_type,
+            headers=headers
+        )
+
 file_manager = FileManager()
@@ -0,0 +1,143 @@
+"""
+Integration tests for batch eligibility verification against a mock HETS server.
+"""
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from ability.services.payer_interface import EligibilityRequest
+from ability.services.medicare_service import MedicareService
+
+
+class MockHetsServer:
+    """Local stand-in for the Medicare HETS eligibility endpoint."""
+
+    def __init__(self, latency: float = 0.01):
+        self.latency = latency
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.app = FastAPI()
+
+        @self.app.post("/eligibility")
+        async def eligibility(request: Request):
+            body = await request.json()
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(self.latency)
+            finally:
+                self.in_flight -= 1
+            eligible = not body["subscriberId"].startswith("X")
+            return {
+                "eligible": eligible,
+                "coverageStatus": "active" if eligible else "inactive",
+                "planInfo": {"plan": "Part B"},
+                "benefits": {},
+                "responseCode": "AA" if eligible else "72",
+                "responseMessage": ""
+            }
+
+        @self.app.get("/health")
+        async def health():
+            return {"status": "ok"}
+
+
+@pytest.fixture
+def hets_server():
+    """Mock HETS server fixture."""
+    return MockHetsServer()
+
+
+@pytest_asyncio.fixture
+async def medicare_service(hets_server):
+    """Medicare service wired to the mock HETS server."""
+    settings = SimpleNamespace(
+        medicare_hets_url="http://mock-hets",
+        medicare_timeout=5,
+        medicare_max_concurrency=4,
+        ssl_verify=False,
+        system_identifier="ability-tests"
+    )
+    credentials = SimpleNamespace(token="test-token")
+    service = MedicareService(credentials, settings)
+    await service.client.aclose()
+    service.client = AsyncClient(
+        transport=ASGITransport(app=hets_server.app),
+        base_url="http://mock-hets"
+    )
+    async with service:
+        yield service
+
+
+def _request(
+    subscriber_id: str,
+    day: int = 15,
+    service_type_codes=("DM",),
+    provider_npi: str = "1234567890"
+) -> EligibilityRequest:
+    return EligibilityRequest(
+        subscriber_id=subscriber_id,
+        provider_npi=provider_npi,
+        service_date=datetime(2025, 1, day, 9, 30),
+        service_type_codes=list(service_type_codes)
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_preserves_order_and_limits_concurrency(medicare_service, hets_server):
+    """Batch results come back in request order within the payer limit."""
+    requests = [_request(f"{i:09d}A") for i in range(25)]
+
+    results = await medicare_service.verify_eligibility_batch(requests)
+
+    assert [item.subscriber_id for item in results] == [r.subscriber_id for r in requests]
+    assert all(item.response and item.response.is_eligible for item in results)
+    assert hets_server.calls == 25
+    assert 1 < hets_server.max_in_flight <= 4
+
+
+@pytest.mark.asyncio
+async def test_batch_reuses_cached_and_duplicate_requests(medicare_service, hets_server):
+    """Same member, payer and date of service is only sent once."""
+    first = await medicare_service.verify_eligibility_batch(
+        [_request("111111111A"), _request("111111111A"), _request("X22222222A")]
+    )
+    assert hets_server.calls == 2
+    assert first[0].response.is_eligible
+    assert not first[2].response.is_eligible
+
+    second = await medicare_service.verify_eligibility_batch(
+        [_request("111111111A"), _request("111111111A", day=16)]
+    )
+    assert second[0].cached
+    assert not second[1].cached
+    assert hets_server.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_keeps_requests_with_different_details_apart(medicare_service, hets_server):
+    """Service types and provider are part of the cache key."""
+    results = await medicare_service.verify_eligibility_batch([
+        _request("555555555A"),
+        _request("555555555A", service_type_codes=("30",)),
+        _request("555555555A", provider_npi="9876543210")
+    ])
+
+    assert hets_server.calls == 3
+    assert not any(item.cached for item in results)
+
+
+@pytest.mark.asyncio
+async def test_client_survives_multiple_calls(medicare_service, hets_server):
+    """The pooled client stays open between calls."""
+    await medicare_service.verify_eligibility(_request("333333333A"))
+    await medicare_service.verify_eligibility(_request("444444444A"))
+
+    assert not medicare_service.client.is_closed
+    assert await medicare_service.check_service_availability()
@@ -0,0 +1,108 @@
+"""
+Integration tests for streamed file storage on the local filesystem backend.
+"""
+import hashlib
+import io
+import os
+
+os.environ.setdefault("STORAGE_BACKEND", "local")
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from common.storage.backends import LocalFileBackend
+from common.storage.file_manager import FileManager, parse_range_header
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """File manager on a temporary local backend with small blocks."""
+    return FileManager(
+        backend=LocalFileBackend(tmp_path / "store", read_chunk_size=7),
+        block_size=16,
+        concurrency=3
+    )
+
+
+def _upload(content: bytes, filename: str = "scan.pdf") -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(content),
+        filename=filename,
+        headers={"content-type": "application/pdf"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_streamed_upload_round_trip(manager):
+    """Blocks staged out of order are committed in order with a full-file hash."""
+    content = bytes(range(256)) * 5 + b"tail"
+
+    metadata = await manager.upload_file(_upload(content), "batches/2025/scan.pdf")
+
+    assert metadata.size == len(content)
+    assert metadata.hash == hashlib.sha256(content).hexdigest()
+    assert metadata.storage_backend == "local"
+    assert await manager.download_file("batches/2025/scan.pdf") == content
+
+    stored = await manager.get_file_metadata("batches/2025/scan.pdf")
+    assert stored.content_type == "application/pdf"
+    assert stored.hash == metadata.hash
+
+
+@pytest.mark.asyncio
+async def test_upload_from_path(manager, tmp_path):
+    """Local files are read in blocks rather than all at once."""
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"x" * 100)
+
+    metadata = await manager.upload_file(source, "copies/source.bin")
+
+    assert metadata.size == 100
+    assert [m.path for m in await manager.list_files("copies/")] == ["copies/source.bin"]
+
+
+@pytest.mark.asyncio
+async def test_failed_upload_leaves_no_file(manager):
+    """A failing block aborts the upload and discards staged data."""
+    backend = manager.backend
+    original = backend.stage_block
+
+    async def flaky(upload_id, path, index, offset, data):
+        if index == 2:
+            raise IOError("disk full")
+        await original(upload_id, path, index, offset, data)
+
+    backend.stage_block = flaky
+
+    with pytest.raises(HTTPException):
+        await manager.upload_file(_upload(b"y" * 100), "broken.pdf")
+
+    assert [m async for m in backend.list_paths()] == []
+    assert list((backend.root / ".uploads").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_range_reads(manager):
+    """Ranges stream only the requested bytes."""
+    content = b"0123456789" * 10
+    await manager.upload_file(_upload(content), "range.pdf")
+
+    chunks = [c async for c in manager.stream_file("range.pdf", 15, 44)]
+    assert b"".join(chunks) == content[15:45]
+
+    response = await manager.stream_response("range.pdf", "bytes=90-")
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 90-99/100"
+    assert response.headers["content-length"] == "10"
+
+
+def test_parse_range_header():
+    """Range headers are parsed to inclusive byte positions."""
+    assert parse_range_header(None, 100) is None
+    assert parse_range_header("bytes=0-9", 100) == (0, 9)
+    assert parse_range_header("bytes=-10", 100) == (90, 99)
+    assert parse_range_header("bytes=50-500", 100) == (50, 99)
+
+    with pytest.raises(HTTPException) as exc:
+        parse_range_header("bytes=100-", 100)
+    assert exc.value.status_code == 416
@@ -0,0 +1,127 @@
+"""
+Micro-benchmark for cache serializers and compression.
+
+Reports encode/decode time and stored bytes per codec for a representative
+eligibility-style payload. Run directly for a table:
+
+    python -m tests.performance.benchmark_cache_serializers
+"""
+from datetime import datetime
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+from pydantic import BaseModel
+
+from common.cache.serializers import Codec
+
+CODECS: List[Tuple[str, Optional[str]]] = [
+    ("json", None),
+    ("json", "zstd"),
+    ("json", "lz4"),
+    ("orjson", None),
+    ("orjson", "zstd"),
+    ("orjson", "lz4"),
+    ("msgpack", None),
+    ("msgpack", "zstd"),
+    ("msgpack", "lz4"),
+]
+
+class Benefit(BaseModel):
+    """Benefit line."""
+    code: str
+    description: str
+    copay: float
+    covered: bool
+
+class CachedEligibility(BaseModel):
+    """Eligibility response as cached."""
+    subscriber_id: str
+    payer_id: str
+    checked_at: datetime
+    plan: Dict[str, str]
+    benefits: List[Benefit]
+
+def sample_payload(benefits: int = 50) -> CachedEligibility:
+    """Build a payload of roughly the size of a real eligibility response."""
+    return CachedEligibility(
+        subscriber_id="123456789A",
+        payer_id="MEDICARE",
+        checked_at=datetime(2025, 1, 15, 9, 30),
+        plan={"name": "Part B", "group": "DME", "status": "active"},
+        benefits=[
+            Benefit(
+                code=f"E{1000 + i}",
+                description=f"Durable medical equipment benefit {i}",
+                copay=20.0 + i,
+                covered=i % 3 != 0
+            )
+            for i in range(benefits)
+        ]
+    )
+
+def _available(serializer: str, compression: Optional[str]) -> Optional[Codec]:
+    try:
+        return Codec(serializer, compression, compress_threshold=256)
+    except ValueError:
+        return None
+
+def measure(codec: Codec, payload: BaseModel, iterations: int = 2000) -> Dict[str, float]:
+    """Measure median encode/decode time in microseconds and encoded size."""
+    encoded = codec.encode(payload)
+    encode_times = []
+    decode_times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        codec.encode(payload)
+        encode_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        codec.decode(encoded, type(payload))
+        decode_times.append(time.perf_counter() - start)
+
+    return {
+        "encode_us": statistics.median(encode_times) * 1e6,
+        "decode_us": statistics.median(decode_times) * 1e6,
+        "bytes": len(encoded),
+    }
+
+@pytest.mark.parametrize("serializer,compression", CODECS)
+def test_codec_round_trip(serializer, compression):
+    """Every available codec restores the model it stored."""
+    codec = _available(serializer, compression)
+    if codec is None:
+        pytest.skip(f"{serializer}/{compression} not installed")
+
+    payload = sample_payload()
+    assert codec.decode(codec.encode(payload), CachedEligibility) == payload
+
+def test_compression_reduces_stored_bytes():
+    """Compressed payloads are smaller than the plain encoding."""
+    plain = _available("json", None)
+    compressed = _available("json", "zstd") or _available("json", "lz4")
+    if compressed is None:
+        pytest.skip("no compression library installed")
+
+    payload = sample_payload()
+    assert len(compressed.encode(payload)) < len(plain.encode(payload))
+
+def main():
+    """Print a comparison table."""
+    payload = sample_payload()
+    print(f"{'codec':<18}{'encode us':>12}{'decode us':>12}{'bytes':>10}")
+    for serializer, compression in CODECS:
+        codec = _available(serializer, compression)
+        name = f"{serializer}/{compression or 'none'}"
+        if codec is None:
+            print(f"{name:<18}{'not installed':>34}")
+            continue
+        result = measure(codec, payload)
+        print(
+            f"{name:<18}{result['encode_us']:>12.1f}"
+            f"{result['decode_us']:>12.1f}{result['bytes']:>10}"
+        )
+
+if __name__ == "__main__":
+    main()
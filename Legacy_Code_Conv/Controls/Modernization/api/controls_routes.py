@@ -1,5 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from typing import Dict, List
+from ..integration.report_renderer import JobStatus
+from ..integration.reporting_system import (
+    ReportFormat,
+    ReportRequest,
+    ReportingSystemIntegration,
+    reporting_system
+)
 from ..models.address import Address
 from ..models.name import Name
 from ..services.map_service import MapService
@@ -12,6 +19,17 @@ async def get_map_service():
     # Configure providers here
     return service
 
+async def get_reporting_system() -> ReportingSystemIntegration:
+    """Dependency to get the reporting system instance"""
+    return reporting_system
+
+REPORT_MEDIA_TYPES = {
+    ReportFormat.JSON: "application/json",
+    ReportFormat.CSV: "text/csv",
+    ReportFormat.EXCEL: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ReportFormat.PDF: "application/pdf",
+}
+
 @router.post("/address/validate")
 async def validate_address(
     address: Address,
@@ -97,3 +115,64 @@ async def format_name(
         return {"formatted": formatted}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/reports", status_code=202)
+async def submit_report(
+    request: ReportRequest,
+    reporting: ReportingSystemIntegration = Depends(get_reporting_system)
+) -> Dict[str, str]:
+    """
+    Queue a report for background rendering
+    
+    Parameters:
+        request: Report parameters
+        reporting: Reporting system instance
+    
+    Returns:
+        Job id to poll for completion
+    """
+    job_id = reporting.submit_report(request)
+    return {"job_id": job_id, "status": JobStatus.QUEUED}
+
+@router.get("/reports/{job_id}")
+async def get_report_status(
+    job_id: str,
+    reporting: ReportingSystemIntegration = Depends(get_reporting_system)
+) -> Dict:
+    """
+    Get the status of a queued report
+    
+    Parameters:
+        job_id: Report job id
+        reporting: Reporting system instance
+    
+    Returns:
+        Job status, ready when the report can be downloaded
+    """
+    return reporting.get_report_job(job_id).info()
+
+@router.get("/reports/{job_id}/download")
+async def download_report(
+    job_id: str,
+    reporting: ReportingSystemIntegration = Depends(get_reporting_system)
+):
+    """
+    Download a rendered report
+    
+    Parameters:
+        job_id: Report job id
+        reporting: Reporting system instance
+    
+    Returns:
+        Rendered report
+    """
+    job = reporting.get_report_job(job_id)
+    if job.status == JobStatus.FAILED:
+        raise HTTPException(status_code=500, detail=job.error)
+    if job.status != JobStatus.READY:
+        raise HTTPException(status_code=409, detail=f"Report is {job.status.value}")
+
+    if isinstance(job.result, dict):
+        return job.result
+    format = job.metadata.get("format", ReportFormat.JSON)
+    return Response(content=job.result, media_type=REPORT_MEDIA_TYPES[format])
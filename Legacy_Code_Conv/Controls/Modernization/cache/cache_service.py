@@ -1,104 +1,282 @@
-from typing import Any, Optional, Union
-from datetime import datetime, timedelta
-import redis
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from datetime import timedelta
+import redis.asyncio as redis
+import asyncio
 import json
+import logging
+import time
+import uuid
 from functools import wraps
 
+from cache.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# One connection pool per Redis database, shared by every CacheService
+_pools: Dict[Tuple[str, int, int], redis.ConnectionPool] = {}
+
+# Deletes a lock only if it still holds our token
+_RELEASE_LOCK = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+def get_pool(host: str = 'localhost', port: int = 6379, db: int = 0, max_connections: int = 50) -> redis.ConnectionPool:
+    """Shared connection pool for a Redis database"""
+    key = (host, port, db)
+    if key not in _pools:
+        _pools[key] = redis.ConnectionPool(
+            host=host, port=port, db=db, max_connections=max_connections, decode_responses=True
+        )
+    return _pools[key]
+
+async def close_pools():
+    """Disconnect every shared pool (call on application shutdown)"""
+    for pool in list(_pools.values()):
+        await pool.disconnect()
+    _pools.clear()
+
 class CacheService:
-    def __init__(self, host: str = 'localhost', port: int = 6379, db: int = 0):
-        self.redis_client = redis.Redis(host=host, port=port, db=db, decode_responses=True)
-        self.default_ttl = timedelta(hours=1)
+    """Async Redis cache scoped to a versioned namespace
+
+    Keys are stored as ``{namespace}:{version}:{key}``. Clearing a namespace
+    increments its version, so old entries become unreachable at once and
+    expire on their own TTL; no keys are scanned or deleted. Other processes
+    pick up a new version within ``version_refresh`` seconds.
+    """
+
+    def __init__(
+        self,
+        namespace: str = 'default',
+        host: str = 'localhost',
+        port: int = 6379,
+        db: int = 0,
+        default_ttl: timedelta = timedelta(hours=1),
+        version_refresh: float = 5.0
+    ):
+        self.namespace = namespace
+        self.redis_client = redis.Redis(connection_pool=get_pool(host, port, db))
+        self.default_ttl = default_ttl
+        self.version_refresh = version_refresh
+        self._version: Optional[int] = None
+        self._version_checked = 0.0
+        self._flights = SingleFlight()
 
-    def set(self, key: str, value: Any, ttl: Optional[timedelta] = None) -> bool:
+    async def set(self, key: str, value: Any, ttl: Optional[timedelta] = None) -> bool:
         """Set a value in cache with optional TTL"""
         try:
-            serialized_value = json.dumps(value)
-            return self.redis_client.set(
-                key,
-                serialized_value,
-                ex=int(ttl.total_seconds()) if ttl else int(self.default_ttl.total_seconds())
-            )
+            return bool(await self.redis_client.set(
+                await self._key(key), json.dumps(value), ex=self._seconds(ttl)
+            ))
         except Exception as e:
-            print(f"Cache set error: {e}")
+            logger.error(f"Cache set error: {e}")
             return False
 
-    def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str) -> Optional[Any]:
         """Get a value from cache"""
         try:
-            value = self.redis_client.get(key)
+            value = await self.redis_client.get(await self._key(key))
             return json.loads(value) if value else None
         except Exception as e:
-            print(f"Cache get error: {e}")
+            logger.error(f"Cache get error: {e}")
             return None
 
-    def delete(self, key: str) -> bool:
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values in one round trip; missing keys are omitted"""
+        if not keys:
+            return {}
+        try:
+            prefix = await self._prefix()
+            values = await self.redis_client.mget([f"{prefix}{key}" for key in keys])
+            return {key: json.loads(value) for key, value in zip(keys, values) if value}
+        except Exception as e:
+            logger.error(f"Cache get_many error: {e}")
+            return {}
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[timedelta] = None) -> bool:
+        """Set several values with the same TTL in one pipeline"""
+        if not items:
+            return True
+        try:
+            prefix = await self._prefix()
+            expires = self._seconds(ttl)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(f"{prefix}{key}", json.dumps(value), ex=expires)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Cache set_many error: {e}")
+            return False
+
+    async def delete(self, key: str) -> bool:
         """Delete a value from cache"""
         try:
-            return bool(self.redis_client.delete(key))
+            return bool(await self.redis_client.delete(await self._key(key)))
         except Exception as e:
-            print(f"Cache delete error: {e}")
+            logger.error(f"Cache delete error: {e}")
             return False
 
-    def clear(self) -> bool:
-        """Clear all cache entries"""
+    async def clear(self) -> bool:
+        """Invalidate every entry in this namespace by moving to a new version"""
         try:
-            return self.redis_client.flushdb()
+            self._version = await self.redis_client.incr(self._version_key())
+            self._version_checked = time.monotonic()
+            return True
         except Exception as e:
-            print(f"Cache clear error: {e}")
+            logger.error(f"Cache clear error: {e}")
             return False
 
-def cached(ttl: Optional[timedelta] = None):
-    """Decorator for caching function results"""
+    async def get_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[timedelta] = None,
+        lock_timeout: float = 10.0
+    ) -> Any:
+        """Return the cached value, computing it at most once across callers
+
+        Concurrent misses in this process share one computation. Across
+        processes, the first caller takes a short Redis lock while it
+        computes and the others poll the cache until the value appears or
+        the lock times out.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        return await self._flights.run(
+            key, lambda: self._compute_once(key, compute, ttl, lock_timeout)
+        )
+
+    async def _compute_once(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[timedelta],
+        lock_timeout: float
+    ) -> Any:
+        lock_key = None
+        token = uuid.uuid4().hex
+        try:
+            lock_key = await self._key(f"lock:{key}")
+            locked = await self.redis_client.set(lock_key, token, nx=True, px=int(lock_timeout * 1000))
+        except Exception as e:
+            # Without Redis there is nobody to coordinate with
+            logger.error(f"Cache lock error: {e}")
+            locked = True
+
+        if not locked:
+            deadline = time.monotonic() + lock_timeout
+            delay = 0.01
+            while time.monotonic() < deadline:
+                await asyncio.sleep(delay)
+                value = await self.get(key)
+                if value is not None:
+                    return value
+                delay = min(delay * 2, 0.2)
+            logger.warning(f"Timed out waiting for cache fill of {key}; computing")
+
+        try:
+            value = await compute()
+            if value is not None:
+                await self.set(key, value, ttl)
+            return value
+        finally:
+            if locked and lock_key:
+                try:
+                    await self.redis_client.eval(_RELEASE_LOCK, 1, lock_key, token)
+                except Exception as e:
+                    logger.error(f"Cache unlock error: {e}")
+
+    async def _key(self, key: str) -> str:
+        return f"{await self._prefix()}{key}"
+
+    async def _prefix(self) -> str:
+        now = time.monotonic()
+        if self._version is None or now - self._version_checked > self.version_refresh:
+            version = await self.redis_client.get(self._version_key())
+            self._version = int(version or 0)
+            self._version_checked = now
+        return f"{self.namespace}:{self._version}:"
+
+    def _version_key(self) -> str:
+        return f"cache:version:{self.namespace}"
+
+    def _seconds(self, ttl: Optional[timedelta]) -> int:
+        return int((ttl or self.default_ttl).total_seconds())
+
+_decorator_caches: Dict[str, CacheService] = {}
+
+def cached(ttl: Optional[timedelta] = None, namespace: str = 'cached'):
+    """Decorator for caching async function results
+
+    Concurrent misses for the same arguments run the function once.
+    """
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            cache_service = CacheService()
-            
+            if namespace not in _decorator_caches:
+                _decorator_caches[namespace] = CacheService(namespace)
+            cache_service = _decorator_caches[namespace]
+
             # Create cache key from function name and arguments
             key_parts = [func.__name__]
             key_parts.extend(str(arg) for arg in args)
             key_parts.extend(f"{k}:{v}" for k, v in sorted(kwargs.items()))
             cache_key = ":".join(key_parts)
 
-            # Try to get from cache
-            cached_value = cache_service.get(cache_key)
-            if cached_value is not None:
-                return cached_value
-
-            # If not in cache, execute function and cache result
-            result = await func(*args, **kwargs)
-            cache_service.set(cache_key, result, ttl)
-            return result
+            return await cache_service.get_or_set(cache_key, lambda: func(*args, **kwargs), ttl)
         return wrapper
     return decorator
 
 class AddressCache:
     def __init__(self):
-        self.cache_service = CacheService()
+        self.cache_service = CacheService('address')
         self.address_ttl = timedelta(days=7)  # Cache addresses for 7 days
 
-    def get_cached_address(self, address_id: str) -> Optional[dict]:
-        return self.cache_service.get(f"address:{address_id}")
+    async def get_cached_address(self, address_id: str) -> Optional[dict]:
+        return await self.cache_service.get(address_id)
+
+    async def get_cached_addresses(self, address_ids: List[str]) -> Dict[str, dict]:
+        return await self.cache_service.get_many(address_ids)
+
+    async def cache_address(self, address_id: str, address_data: dict):
+        await self.cache_service.set(address_id, address_data, self.address_ttl)
 
-    def cache_address(self, address_id: str, address_data: dict):
-        self.cache_service.set(f"address:{address_id}", address_data, self.address_ttl)
+    async def cache_addresses(self, addresses: Dict[str, dict]):
+        await self.cache_service.set_many(addresses, self.address_ttl)
 
-    def invalidate_address(self, address_id: str):
-        self.cache_service.delete(f"address:{address_id}")
+    async def invalidate_address(self, address_id: str):
+        await self.cache_service.delete(address_id)
+
+    async def clear(self):
+        await self.cache_service.clear()
 
 class NameCache:
     def __init__(self):
-        self.cache_service = CacheService()
+        self.cache_service = CacheService('name')
         self.name_ttl = timedelta(days=30)  # Cache names for 30 days
 
-    def get_cached_name(self, name_id: str) -> Optional[dict]:
-        return self.cache_service.get(f"name:{name_id}")
+    async def get_cached_name(self, name_id: str) -> Optional[dict]:
+        return await self.cache_service.get(name_id)
+
+    async def get_cached_names(self, name_ids: List[str]) -> Dict[str, dict]:
+        return await self.cache_service.get_many(name_ids)
+
+    async def cache_name(self, name_id: str, name_data: dict):
+        await self.cache_service.set(name_id, name_data, self.name_ttl)
+
+    async def cache_names(self, names: Dict[str, dict]):
+        await self.cache_service.set_many(names, self.name_ttl)
 
-    def cache_name(self, name_id: str, name_data: dict):
-        self.cache_service.set(f"name:{name_id}", name_data, self.name_ttl)
+    async def invalidate_name(self, name_id: str):
+        await self.cache_service.delete(name_id)
 
-    def invalidate_name(self, name_id: str):
-        self.cache_service.delete(f"name:{name_id}")
+    async def clear(self):
+        await self.cache_service.clear()
 
 # Initialize global cache services
 address_cache = AddressCache()
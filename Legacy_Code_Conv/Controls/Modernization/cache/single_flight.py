@@ -0,0 +1,45 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable
+import asyncio
+
+class SingleFlight:
+    """Run at most one computation per key at a time
+
+    Callers that ask for a key while its computation is running wait for
+    that result (or exception) instead of starting their own. Nothing is
+    kept once the computation finishes; caching the result is up to the
+    caller.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    async def run(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return compute()'s result, sharing it with concurrent callers"""
+        future = self._inflight.get(key)
+        if future is not None:
+            # A cancelled waiter must not cancel the shared computation
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unshared failure is not logged as unhandled
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
@@ -0,0 +1,137 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+import asyncio
+import logging
+import time
+
+from cache.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+class ReportSnapshot:
+    """A computed report and when it was computed"""
+
+    def __init__(self, value: Any, computed_at: float):
+        self.value = value
+        self.computed_at = computed_at
+
+    def age(self) -> float:
+        return time.monotonic() - self.computed_at
+
+class ReportSnapshotCache:
+    """TTL cache of report snapshots with background refresh
+
+    Fresh snapshots (younger than ``ttl``) are returned as is. Stale
+    snapshots (younger than ``ttl + stale_ttl``) are returned immediately
+    while a background task recomputes them. Concurrent misses for the same
+    key share a single computation.
+    """
+
+    def __init__(self, ttl: float = 300, stale_ttl: float = 600, max_entries: int = 256):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+
+        self._snapshots: Dict[Hashable, ReportSnapshot] = {}
+        self._flights = SingleFlight()
+        self._refreshers: Dict[Hashable, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+
+    async def get(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Get the snapshot for key, computing it if missing or expired"""
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None:
+            age = snapshot.age()
+            if age < self.ttl:
+                self.hits += 1
+                return snapshot.value
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._refresh_in_background(key, compute)
+                return snapshot.value
+
+        self.misses += 1
+        return await self._compute(key, compute)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one snapshot, or all of them"""
+        if key is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(key, None)
+
+    def keep_fresh(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        interval: Optional[float] = None
+    ) -> asyncio.Task:
+        """Recompute a snapshot periodically so readers never wait"""
+        existing = self._refreshers.get(key)
+        if existing and not existing.done():
+            return existing
+
+        interval = interval or self.ttl * 0.8
+
+        async def refresh_loop():
+            while True:
+                try:
+                    await self._compute(key, compute)
+                except Exception as e:
+                    logger.error(f"Snapshot refresh failed for {key}: {e}")
+                await asyncio.sleep(interval)
+
+        task = asyncio.create_task(refresh_loop())
+        self._refreshers[key] = task
+        return task
+
+    async def close(self):
+        """Stop background refreshers"""
+        tasks = list(self._refreshers.values()) + list(self._background)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refreshers.clear()
+
+    async def _compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        async def compute_and_store():
+            value = await compute()
+            self._store(key, value)
+            return value
+
+        return await self._flights.run(key, compute_and_store)
+
+    def _refresh_in_background(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]]
+    ):
+        if key in self._flights:
+            return
+
+        async def refresh():
+            try:
+                await self._compute(key, compute)
+            except Exception as e:
+                logger.error(f"Background refresh failed for {key}: {e}")
+
+        task = asyncio.create_task(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _store(self, key: Hashable, value: Any):
+        self._snapshots.pop(key, None)
+        self._snapshots[key] = ReportSnapshot(value, time.monotonic())
+        while len(self._snapshots) > self.max_entries:
+            # Dicts keep insertion order; the first key is the oldest write
+            self._snapshots.pop(next(iter(self._snapshots)))
@@ -0,0 +1,273 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from enum import Enum
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+class ChartSpec:
+    """Data needed to draw one chart; rendering is a pure function of it"""
+
+    def __init__(self, name: str, title: str, x_label: str, y_label: str, x: List, y: List):
+        self.name = name
+        self.title = title
+        self.x_label = x_label
+        self.y_label = y_label
+        self.x = x
+        self.y = y
+
+    def payload(self) -> Dict:
+        return {
+            "title": self.title,
+            "x_label": self.x_label,
+            "y_label": self.y_label,
+            "x": self.x,
+            "y": self.y
+        }
+
+    def digest(self) -> str:
+        """Hash of everything that affects the rendered image"""
+        return hashlib.sha256(
+            json.dumps(self.payload(), sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+def render_line_chart(payload: Dict) -> str:
+    """Render a line chart to a base64 PNG (runs in a worker process)"""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    figure = plt.figure(figsize=(10, 6))
+    try:
+        plt.plot(payload["x"], payload["y"])
+        plt.title(payload["title"])
+        plt.xlabel(payload["x_label"])
+        plt.ylabel(payload["y_label"])
+        plt.xticks(rotation=45)
+
+        buf = io.BytesIO()
+        plt.savefig(buf, format='png')
+        return base64.b64encode(buf.getvalue()).decode()
+    finally:
+        plt.close(figure)
+
+def format_report(data: Dict, format: str) -> Union[Dict, str, bytes]:
+    """Format report data as json, csv or excel (runs in a worker process)"""
+    import pandas as pd
+
+    if format == "json":
+        return data
+
+    elif format == "csv":
+        # Convert nested dict to flat CSV
+        df = pd.json_normalize(data)
+        return df.to_csv(index=False)
+
+    elif format == "excel":
+        # Create Excel file with multiple sheets
+        output = io.BytesIO()
+        with pd.ExcelWriter(output, engine='openpyxl') as writer:
+            for key, value in data.items():
+                if isinstance(value, (dict, list)):
+                    df = pd.DataFrame(value)
+                    df.to_excel(writer, sheet_name=key, index=False)
+        return output.getvalue()
+
+    elif format == "pdf":
+        # This would require additional PDF generation library
+        raise NotImplementedError("PDF format not yet implemented")
+
+    raise ValueError(f"Unsupported report format: {format}")
+
+class ChartCache:
+    """LRU cache of rendered charts keyed by chart data hash"""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._images: "OrderedDict[str, str]" = OrderedDict()
+
+    def get(self, digest: str) -> Optional[str]:
+        image = self._images.get(digest)
+        if image is None:
+            self.misses += 1
+            return None
+        self._images.move_to_end(digest)
+        self.hits += 1
+        return image
+
+    def set(self, digest: str, image: str):
+        self._images[digest] = image
+        self._images.move_to_end(digest)
+        while len(self._images) > self.max_entries:
+            self._images.popitem(last=False)
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    READY = "ready"
+    FAILED = "failed"
+
+class RenderJob:
+    """A queued report render"""
+
+    def __init__(self, job_id: str, build: Callable[[], Any], metadata: Optional[Dict] = None):
+        self.job_id = job_id
+        self.build = build
+        self.metadata = metadata or {}
+        self.status = JobStatus.QUEUED
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.finished_at: Optional[datetime] = None
+
+    def info(self) -> Dict:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None
+        }
+
+class QueueFullError(Exception):
+    """Raised when the render queue has no room for another job"""
+
+class ReportRenderer:
+    """Renders charts and report files in a process pool
+
+    CPU-bound rendering runs in worker processes so the event loop stays
+    responsive. ``max_concurrent_renders`` caps how many renders use the pool
+    at once, and background jobs are taken from a bounded queue by
+    ``job_workers`` consumers so heavy reports cannot starve interactive ones.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_concurrent_renders: int = 2,
+        job_workers: int = 1,
+        max_queued_jobs: int = 50,
+        max_finished_jobs: int = 200,
+        chart_cache_size: int = 512
+    ):
+        self.max_workers = max_workers
+        self.job_workers = job_workers
+        self.max_finished_jobs = max_finished_jobs
+        self.chart_cache = ChartCache(chart_cache_size)
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._render_slots = asyncio.Semaphore(max_concurrent_renders)
+        self._queue: Optional[asyncio.Queue] = None
+        self._max_queued_jobs = max_queued_jobs
+        self._workers: List[asyncio.Task] = []
+        self._jobs: "OrderedDict[str, RenderJob]" = OrderedDict()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def run(self, func: Callable, *args) -> Any:
+        """Run a render function in the pool under the concurrency cap"""
+        async with self._render_slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    async def render_charts(self, specs: List[ChartSpec]) -> Dict[str, str]:
+        """Render charts, reusing cached images for unchanged data"""
+        charts: Dict[str, str] = {}
+        pending: List[Tuple[ChartSpec, str]] = []
+
+        for spec in specs:
+            digest = spec.digest()
+            image = self.chart_cache.get(digest)
+            if image is not None:
+                charts[spec.name] = image
+            else:
+                pending.append((spec, digest))
+
+        images = await asyncio.gather(*(
+            self.run(render_line_chart, spec.payload()) for spec, _ in pending
+        ), return_exceptions=True)
+
+        for (spec, digest), image in zip(pending, images):
+            if isinstance(image, Exception):
+                logger.error(f"Failed to render chart {spec.name}: {image}")
+                continue
+            self.chart_cache.set(digest, image)
+            charts[spec.name] = image
+        return charts
+
+    async def format(self, data: Dict, format: str) -> Union[Dict, str, bytes]:
+        """Format a report in the pool (JSON needs no rendering)"""
+        if format == "json":
+            return data
+        return await self.run(format_report, data, format)
+
+    def submit(self, build: Callable[[], Any], metadata: Optional[Dict] = None) -> str:
+        """Queue a report build; returns a job id to poll"""
+        self._ensure_workers()
+        job = RenderJob(uuid.uuid4().hex, build, metadata)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFullError("Report render queue is full")
+        self._jobs[job.job_id] = job
+        self._prune_jobs()
+        return job.job_id
+
+    def get_job(self, job_id: str) -> Optional[RenderJob]:
+        return self._jobs.get(job_id)
+
+    async def close(self):
+        """Stop job workers and shut down the process pool"""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _ensure_workers(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queued_jobs)
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self.job_workers:
+            self._workers.append(asyncio.create_task(self._work()))
+
+    async def _work(self):
+        while True:
+            job = await self._queue.get()
+            job.status = JobStatus.RUNNING
+            try:
+                job.result = await job.build()
+                job.status = JobStatus.READY
+            except Exception as e:
+                logger.error(f"Report job {job.job_id} failed: {e}")
+                job.error = str(e)
+                job.status = JobStatus.FAILED
+            finally:
+                job.build = None
+                job.finished_at = datetime.utcnow()
+                self._queue.task_done()
+
+    def _prune_jobs(self):
+        """Forget the oldest finished jobs beyond the retention limit"""
+        finished = [
+            job_id for job_id, job in self._jobs.items()
+            if job.status in (JobStatus.READY, JobStatus.FAILED)
+        ]
+        for job_id in finished[:max(len(finished) - self.max_finished_jobs, 0)]:
+            del self._jobs[job_id]
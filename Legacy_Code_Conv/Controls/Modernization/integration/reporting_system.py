@@ -1,8 +1,10 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime, date
 from decimal import Decimal
 from pydantic import BaseModel
+import asyncio
 import httpx
+import io
 import logging
 import pandas as pd
 from fastapi import HTTPException
@@ -11,6 +13,9 @@ from sqlalchemy.orm import sessionmaker
 import json
 from enum import Enum
 
+from .report_cache import ReportSnapshotCache
+from .report_renderer import ChartSpec, QueueFullError, RenderJob, ReportRenderer
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -45,8 +50,40 @@ class ReportRequest(BaseModel):
     format: ReportFormat = ReportFormat.JSON
     include_charts: bool = False
 
+# Source data fetched for each report type: key -> API path
+REPORT_SOURCES: Dict[ReportType, Dict[str, str]] = {
+    ReportType.FINANCIAL: {
+        "transactions": "/billing/transactions",
+        "revenue": "/billing/revenue",
+    },
+    ReportType.OPERATIONAL: {
+        "patients": "/patients",
+        "providers": "/providers",
+    },
+    ReportType.CLINICAL: {
+        "treatments": "/clinical/treatments",
+        "outcomes": "/clinical/outcomes",
+    },
+    ReportType.COMPLIANCE: {
+        "audits": "/compliance/audits",
+        "incidents": "/compliance/incidents",
+    },
+}
+
 class ReportingSystemIntegration:
-    def __init__(self, db_url: str, api_base_url: str, api_key: str):
+    def __init__(
+        self,
+        db_url: str,
+        api_base_url: str,
+        api_key: str,
+        cache_ttl: float = 300,
+        stale_ttl: float = 600,
+        max_connections: int = 20,
+        timeout: float = 30.0,
+        render_workers: int = 2,
+        max_concurrent_renders: int = 2,
+        max_queued_reports: int = 50
+    ):
         # Database setup
         self.engine = create_engine(db_url)
         self.Session = sessionmaker(bind=self.engine)
@@ -59,26 +96,82 @@ class ReportingSystemIntegration:
             "Content-Type": "application/json"
         }
 
+        # Shared pooled client for all source calls
+        self.client = httpx.AsyncClient(
+            base_url=api_base_url,
+            headers=self.headers,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+
+        # Processed report data keyed by (report type, period, dates, filters)
+        self.snapshots = ReportSnapshotCache(ttl=cache_ttl, stale_ttl=stale_ttl)
+
+        # Charts and files render in worker processes; one job worker leaves
+        # render capacity free for interactive requests
+        self.renderer = ReportRenderer(
+            max_workers=render_workers,
+            max_concurrent_renders=max_concurrent_renders,
+            job_workers=1,
+            max_queued_jobs=max_queued_reports
+        )
+
+    async def aclose(self):
+        """Stop snapshot refreshers, render workers and the pooled client"""
+        await self.snapshots.close()
+        await self.renderer.close()
+        await self.client.aclose()
+
+    @staticmethod
+    def report_cache_key(request: ReportRequest) -> Tuple:
+        """Cache key for the data behind a report"""
+        return (
+            request.report_type.value,
+            request.period.value,
+            request.start_date.isoformat(),
+            request.end_date.isoformat(),
+            json.dumps(request.filters or {}, sort_keys=True, default=str)
+        )
+
+    async def get_report_data(self, request: ReportRequest) -> Dict:
+        """Get processed report data, served from a snapshot when available"""
+        return await self.snapshots.get(
+            self.report_cache_key(request),
+            lambda: self._build_report_data(request)
+        )
+
+    def keep_report_fresh(self, request: ReportRequest, interval: Optional[float] = None):
+        """Precompute a dashboard report and refresh it in the background"""
+        return self.snapshots.keep_fresh(
+            self.report_cache_key(request),
+            lambda: self._build_report_data(request),
+            interval
+        )
+
+    async def _build_report_data(self, request: ReportRequest) -> Dict:
+        raw_data = await self._gather_report_data(request)
+        return self._process_report_data(raw_data, request)
+
     async def generate_report(self, request: ReportRequest) -> Dict:
         """Generate a report based on the request parameters"""
         try:
-            # Get data from appropriate sources
-            raw_data = await self._gather_report_data(request)
-
-            # Process and format the data
-            processed_data = self._process_report_data(raw_data, request)
+            # Get processed data, from cache when possible
+            processed_data = dict(await self.get_report_data(request))
 
             # Generate charts if requested
             if request.include_charts:
-                charts = self._generate_charts(processed_data, request)
+                charts = await self._generate_charts(processed_data, request)
                 processed_data["charts"] = charts
 
             # Format the report
-            formatted_report = self._format_report(processed_data, request.format)
+            formatted_report = await self._format_report(processed_data, request.format)
 
             # Track report generation
-            from services.analytics_service import analytics_service
-            await analytics_service.track_action(
+            from services.analytics_service import analytics_service, UserAction
+            analytics_service.track_action(
                 action=UserAction(
                     timestamp=datetime.utcnow(),
                     component="reporting",
@@ -101,46 +194,37 @@ class ReportingSystemIntegration:
             )
 
     async def _gather_report_data(self, request: ReportRequest) -> Dict:
-        """Gather data from various sources for the report"""
-        data = {}
-        
-        if request.report_type == ReportType.FINANCIAL:
-            data["transactions"] = await self._get_billing_data(request)
-            data["revenue"] = await self._get_revenue_data(request)
-            
-        elif request.report_type == ReportType.OPERATIONAL:
-            data["patients"] = await self._get_patient_data(request)
-            data["providers"] = await self._get_provider_data(request)
-            
-        elif request.report_type == ReportType.CLINICAL:
-            data["treatments"] = await self._get_treatment_data(request)
-            data["outcomes"] = await self._get_outcome_data(request)
-            
-        elif request.report_type == ReportType.COMPLIANCE:
-            data["audits"] = await self._get_audit_data(request)
-            data["incidents"] = await self._get_incident_data(request)
-
-        return data
+        """Gather data from all sources for the report concurrently"""
+        sources = REPORT_SOURCES.get(request.report_type, {})
+        results = await asyncio.gather(*(
+            self._fetch_source(path, request) for path in sources.values()
+        ))
+        return dict(zip(sources.keys(), results))
 
-    async def _get_billing_data(self, request: ReportRequest) -> List[Dict]:
-        """Get billing data from the billing system"""
+    async def _fetch_source(self, path: str, request: ReportRequest) -> List[Dict]:
+        """Fetch one source's records for the report period"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.api_base_url}/billing/transactions",
-                    headers=self.headers,
-                    params={
-                        "start_date": request.start_date.isoformat(),
-                        "end_date": request.end_date.isoformat(),
-                        **request.filters or {}
-                    }
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self.client.get(
+                path,
+                params={
+                    "start_date": request.start_date.isoformat(),
+                    "end_date": request.end_date.isoformat(),
+                    **(request.filters or {})
+                }
+            )
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
-            logger.error(f"Failed to get billing data: {e}")
+            logger.error(f"Failed to get report data from {path}: {e}")
             raise
 
+    async def _get_billing_data(self, request: ReportRequest) -> List[Dict]:
+        """Get billing data from the billing system"""
+        return await self._fetch_source(
+            REPORT_SOURCES[ReportType.FINANCIAL]["transactions"],
+            request
+        )
+
     def _process_report_data(self, raw_data: Dict, request: ReportRequest) -> Dict:
         """Process raw data into report format"""
         processed_data = {"metadata": {
@@ -189,66 +273,53 @@ class ReportingSystemIntegration:
 
         return result
 
-    def _generate_charts(self, data: Dict, request: ReportRequest) -> Dict:
+    def _chart_specs(self, data: Dict, request: ReportRequest) -> List[ChartSpec]:
+        """Describe the charts for a report"""
+        specs = []
+
+        if request.report_type == ReportType.FINANCIAL:
+            # Revenue trend chart
+            if "trends" in data and "daily_revenue" in data["trends"]:
+                specs.append(ChartSpec(
+                    name="revenue_trend",
+                    title="Daily Revenue Trend",
+                    x_label="Date",
+                    y_label="Revenue",
+                    x=[str(day) for day in data["trends"]["daily_revenue"].keys()],
+                    y=list(data["trends"]["daily_revenue"].values())
+                ))
+
+        return specs
+
+    async def _generate_charts(self, data: Dict, request: ReportRequest) -> Dict:
         """Generate charts for the report"""
-        charts = {}
-        
         try:
-            import matplotlib.pyplot as plt
-            import seaborn as sns
-            
-            if request.report_type == ReportType.FINANCIAL:
-                # Revenue trend chart
-                if "trends" in data and "daily_revenue" in data["trends"]:
-                    plt.figure(figsize=(10, 6))
-                    dates = list(data["trends"]["daily_revenue"].keys())
-                    revenues = list(data["trends"]["daily_revenue"].values())
-                    plt.plot(dates, revenues)
-                    plt.title("Daily Revenue Trend")
-                    plt.xlabel("Date")
-                    plt.ylabel("Revenue")
-                    plt.xticks(rotation=45)
-                    
-                    # Save to bytes
-                    import io
-                    buf = io.BytesIO()
-                    plt.savefig(buf, format='png')
-                    buf.seek(0)
-                    import base64
-                    charts["revenue_trend"] = base64.b64encode(buf.read()).decode()
-                    plt.close()
-
+            return await self.renderer.render_charts(self._chart_specs(data, request))
         except Exception as e:
             logger.error(f"Failed to generate charts: {e}")
             # Continue without charts if there's an error
-            pass
+            return {}
 
-        return charts
-
-    def _format_report(self, data: Dict, format: ReportFormat) -> Union[Dict, bytes]:
+    async def _format_report(self, data: Dict, format: ReportFormat) -> Union[Dict, str, bytes]:
         """Format the report in the requested format"""
-        if format == ReportFormat.JSON:
-            return data
-        
-        elif format == ReportFormat.CSV:
-            # Convert nested dict to flat CSV
-            df = pd.json_normalize(data)
-            return df.to_csv(index=False)
-        
-        elif format == ReportFormat.EXCEL:
-            # Create Excel file with multiple sheets
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                for key, value in data.items():
-                    if isinstance(value, (dict, list)):
-                        df = pd.DataFrame(value)
-                        df.to_excel(writer, sheet_name=key, index=False)
-            return output.getvalue()
-        
-        elif format == ReportFormat.PDF:
-            # Generate PDF report
-            # This would require additional PDF generation library
-            raise NotImplementedError("PDF format not yet implemented")
+        return await self.renderer.format(data, format.value)
+
+    def submit_report(self, request: ReportRequest) -> str:
+        """Queue a report for background rendering; returns a job id"""
+        try:
+            return self.renderer.submit(
+                lambda: self.generate_report(request),
+                metadata={"format": request.format}
+            )
+        except QueueFullError as e:
+            raise HTTPException(status_code=429, detail=str(e))
+
+    def get_report_job(self, job_id: str) -> RenderJob:
+        """Get a queued report job"""
+        job = self.renderer.get_job(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Report job not found")
+        return job
 
     async def schedule_report(
         self,
@@ -257,17 +328,15 @@ class ReportingSystemIntegration:
     ) -> Dict:
         """Schedule a report for periodic generation"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.api_base_url}/reports/schedule",
-                    headers=self.headers,
-                    json={
-                        "report_request": request.dict(),
-                        "schedule": schedule
-                    }
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self.client.post(
+                "/reports/schedule",
+                json={
+                    "report_request": json.loads(request.json()),
+                    "schedule": schedule
+                }
+            )
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             logger.error(f"Failed to schedule report: {e}")
             raise HTTPException(
@@ -278,13 +347,9 @@ class ReportingSystemIntegration:
     async def get_scheduled_reports(self) -> List[Dict]:
         """Get list of scheduled reports"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.api_base_url}/reports/schedule",
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self.client.get("/reports/schedule")
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
             logger.error(f"Failed to get scheduled reports: {e}")
             raise HTTPException(
@@ -25,7 +25,11 @@ def cli():
 @click.option('--backup-dir', required=True, help='Directory for backup files')
 @click.option('--validate/--no-validate', default=True, help='Validate migration after completion')
 @click.option('--dry-run/--no-dry-run', default=False, help='Perform a dry run without making changes')
-def migrate(source_db, target_db, batch_size, timeout, backup_dir, validate, dry_run):
+@click.option('--bulk/--no-bulk', default=False, help='Keyset-paged batch copy with concurrent tables')
+@click.option('--max-concurrency', default=4, help='Tables copied or backed up at once in bulk mode')
+@click.option('--backup-format', type=click.Choice(['csv', 'parquet']), default='csv', help='Backup file format')
+def migrate(source_db, target_db, batch_size, timeout, backup_dir, validate, dry_run,
+            bulk, max_concurrency, backup_format):
     """Run the data migration process"""
     try:
         config = MigrationConfig(
@@ -35,7 +39,10 @@ def migrate(source_db, target_db, batch_size, timeout, backup_dir, validate, dry
             timeout=timeout,
             backup_dir=backup_dir,
             validate=validate,
-            dry_run=dry_run
+            dry_run=dry_run,
+            bulk_mode=bulk,
+            max_concurrency=max_concurrency,
+            backup_format=backup_format
         )
 
         manager = MigrationManager(config)
@@ -60,13 +67,15 @@ def validate(backup_dir, report_file):
 @cli.command()
 @click.option('--source-db', required=True, help='Source database URL')
 @click.option('--backup-dir', required=True, help='Directory to store backup files')
-def backup(source_db, backup_dir):
+@click.option('--backup-format', type=click.Choice(['csv', 'parquet']), default='csv', help='Backup file format')
+def backup(source_db, backup_dir, backup_format):
     """Create a backup of the source database"""
     try:
         config = MigrationConfig(
             source_db_url=source_db,
             target_db_url="dummy",  # Not needed for backup
-            backup_dir=backup_dir
+            backup_dir=backup_dir,
+            backup_format=backup_format
         )
         
         manager = MigrationManager(config)
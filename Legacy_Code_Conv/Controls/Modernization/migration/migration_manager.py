@@ -1,10 +1,13 @@
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import logging
 import json
 import csv
+import io
 from pathlib import Path
 import asyncio
+import threading
+import time
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from pydantic import BaseModel
@@ -26,6 +29,12 @@ class MigrationConfig(BaseModel):
     backup_dir: str
     validate: bool = True
     dry_run: bool = False
+    # High-throughput mode: keyset paging, batch writes, concurrent tables
+    bulk_mode: bool = False
+    max_concurrency: int = 4
+    use_copy: bool = True
+    backup_format: str = "csv"  # csv (CSV + JSON) or parquet
+    backup_compression: str = "zstd"
 
 class MigrationStats(BaseModel):
     started_at: datetime
@@ -37,6 +46,187 @@ class MigrationStats(BaseModel):
     warnings: List[str]
     errors: List[str]
 
+class TargetTable:
+    """A target table written from a transformed batch"""
+
+    def __init__(
+        self,
+        name: str,
+        columns: List[str],
+        transform: Callable[[pd.DataFrame], pd.DataFrame],
+        key: str = "id"
+    ):
+        self.name = name
+        self.columns = columns
+        self.transform = transform
+        # Column holding the source entity id, used to isolate failed rows
+        self.key = key
+
+class TableCopy:
+    """Keyset-paged copy of one source entity into one or more target tables
+
+    ``source_query`` selects a page of rows with ``id > :after`` (or from the
+    start when ``:after`` is NULL) ordered by ``id`` and limited to ``:limit``
+    source entities; the key column of the result must be named ``id``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        source_table: str,
+        source_query: str,
+        targets: List[TargetTable]
+    ):
+        self.name = name
+        self.source_table = source_table
+        self.source_query = source_query
+        self.targets = targets
+
+def _columns(*names: str) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    return lambda df: df[list(names)].drop_duplicates("id")
+
+BULK_COPY_PLAN: List[List[TableCopy]] = [
+    # Tables in a phase are independent and copied concurrently
+    [
+        TableCopy(
+            "providers",
+            "providers",
+            """
+                WITH page AS (
+                    SELECT id, status, created_at, updated_at
+                    FROM providers
+                    WHERE (:after IS NULL OR id > :after)
+                    ORDER BY id
+                    LIMIT :limit
+                )
+                SELECT p.id, p.status, p.created_at, p.updated_at,
+                       n.provider_id AS name_provider_id,
+                       n.first_name, n.last_name, n.credentials
+                FROM page p
+                LEFT JOIN provider_names n ON p.id = n.provider_id
+                ORDER BY p.id
+            """,
+            [
+                TargetTable(
+                    "providers",
+                    ["id", "status", "created_at", "updated_at"],
+                    _columns("id", "status", "created_at", "updated_at")
+                ),
+                TargetTable(
+                    "provider_names",
+                    ["provider_id", "name_type", "first_name", "last_name", "credentials"],
+                    lambda df: df[df["name_provider_id"].notna()].assign(
+                        provider_id=lambda d: d["id"],
+                        name_type="legal"
+                    )[["provider_id", "name_type", "first_name", "last_name", "credentials"]],
+                    key="provider_id"
+                )
+            ]
+        ),
+        TableCopy(
+            "patients",
+            "patients",
+            """
+                WITH page AS (
+                    SELECT id, status, created_at, updated_at
+                    FROM patients
+                    WHERE (:after IS NULL OR id > :after)
+                    ORDER BY id
+                    LIMIT :limit
+                )
+                SELECT p.id, p.status, p.created_at, p.updated_at,
+                       a.patient_id AS address_patient_id, a.address_type, a.street_address,
+                       a.city, a.state, a.postal_code, a.country
+                FROM page p
+                LEFT JOIN addresses a ON p.id = a.patient_id
+                ORDER BY p.id
+            """,
+            [
+                TargetTable(
+                    "patients",
+                    ["id", "status", "created_at", "updated_at"],
+                    _columns("id", "status", "created_at", "updated_at")
+                ),
+                TargetTable(
+                    "patient_addresses",
+                    ["patient_id", "address_type", "street_address", "city",
+                     "state", "postal_code", "country"],
+                    lambda df: df[df["address_patient_id"].notna()].assign(
+                        patient_id=lambda d: d["id"]
+                    )[["patient_id", "address_type", "street_address", "city",
+                       "state", "postal_code", "country"]],
+                    key="patient_id"
+                )
+            ]
+        ),
+        TableCopy(
+            "audit_logs",
+            "audit_logs",
+            """
+                SELECT id, event_type, user_id, details, created_at
+                FROM audit_logs
+                WHERE (:after IS NULL OR id > :after)
+                ORDER BY id
+                LIMIT :limit
+            """,
+            [
+                TargetTable(
+                    "audit_logs",
+                    ["id", "event_type", "user_id", "details", "created_at"],
+                    _columns("id", "event_type", "user_id", "details", "created_at")
+                )
+            ]
+        ),
+    ],
+    # Billing references providers and patients
+    [
+        TableCopy(
+            "billing_transactions",
+            "billing_transactions",
+            """
+                SELECT id, patient_id, provider_id, amount, status, created_at
+                FROM billing_transactions
+                WHERE (:after IS NULL OR id > :after)
+                ORDER BY id
+                LIMIT :limit
+            """,
+            [
+                TargetTable(
+                    "billing_transactions",
+                    ["id", "patient_id", "provider_id", "amount", "status", "created_at"],
+                    _columns("id", "patient_id", "provider_id", "amount", "status", "created_at")
+                )
+            ]
+        ),
+    ],
+]
+
+class CopyProgress:
+    """Thread-safe row counter reporting throughput"""
+
+    def __init__(self, table: str, total: int):
+        self.table = table
+        self.total = total
+        self.rows = 0
+        self.started = time.monotonic()
+        self.bar = tqdm(total=total, desc=table, unit="rows")
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def advance(self, rows: int):
+        self.rows += rows
+        self.bar.update(rows)
+
+    def finish(self):
+        self.bar.close()
+        logger.info(
+            f"Copied {self.rows}/{self.total} {self.table} rows "
+            f"in {time.monotonic() - self.started:.1f}s ({self.rows_per_second:.0f} rows/s)"
+        )
+
 class MigrationManager:
     def __init__(self, config: MigrationConfig):
         self.config = config
@@ -47,6 +237,7 @@ class MigrationManager:
         self.backup_path = Path(config.backup_dir)
         self.backup_path.mkdir(parents=True, exist_ok=True)
         self.stats = {}
+        self._stats_lock = threading.Lock()
 
     async def run_migration(self):
         """Run the complete migration process"""
@@ -62,22 +253,26 @@ class MigrationManager:
                 "failed_records": 0,
                 "validation_errors": 0,
                 "warnings": [],
-                "errors": []
+                "errors": [],
+                "throughput": {}
             }
 
             # Create backup
             await self.create_backup()
 
-            # Run migrations in order
-            migration_order = [
-                self.migrate_provider_data,
-                self.migrate_patient_data,
-                self.migrate_billing_data,
-                self.migrate_audit_data
-            ]
+            if self.config.bulk_mode:
+                await self.run_bulk_copy()
+            else:
+                # Run migrations in order
+                migration_order = [
+                    self.migrate_provider_data,
+                    self.migrate_patient_data,
+                    self.migrate_billing_data,
+                    self.migrate_audit_data
+                ]
 
-            for migration_func in migration_order:
-                await migration_func()
+                for migration_func in migration_order:
+                    await migration_func()
 
             # Validate migration
             if self.config.validate:
@@ -108,6 +303,16 @@ class MigrationManager:
             "audit_logs"
         ]
 
+        if self.config.backup_format == "parquet":
+            semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+            async def backup_table(table: str):
+                async with semaphore:
+                    await asyncio.to_thread(self._stream_backup, table, backup_time)
+
+            await asyncio.gather(*(backup_table(table) for table in tables))
+            return
+
         source_session = self.Source_Session()
         try:
             for table in tables:
@@ -125,6 +330,168 @@ class MigrationManager:
         finally:
             source_session.close()
 
+    def _stream_backup(self, table: str, backup_time: str):
+        """Write one table to a compressed Parquet file chunk by chunk"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        logger.info(f"Backing up table: {table}")
+        backup_file = self.backup_path / f"{table}_{backup_time}.parquet"
+        writer = None
+        rows = 0
+        started = time.monotonic()
+
+        with self.source_engine.connect() as connection:
+            connection = connection.execution_options(stream_results=True)
+            try:
+                for chunk in pd.read_sql(
+                    text(f"SELECT * FROM {table}"),
+                    connection,
+                    chunksize=self.config.batch_size
+                ):
+                    batch = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(
+                            backup_file,
+                            batch.schema,
+                            compression=self.config.backup_compression
+                        )
+                    else:
+                        batch = batch.cast(writer.schema)
+                    writer.write_table(batch)
+                    rows += len(chunk)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+        elapsed = time.monotonic() - started
+        logger.info(
+            f"Backed up {rows} {table} rows in {elapsed:.1f}s "
+            f"({rows / elapsed if elapsed > 0 else 0:.0f} rows/s)"
+        )
+
+    async def run_bulk_copy(self):
+        """Copy all tables in keyset-paged batches, independent tables concurrently"""
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def copy(spec: TableCopy):
+            async with semaphore:
+                await asyncio.to_thread(self._copy_table, spec)
+
+        for phase in BULK_COPY_PLAN:
+            await asyncio.gather(*(copy(spec) for spec in phase))
+
+    def _copy_table(self, spec: TableCopy):
+        """Copy one entity by primary-key pages"""
+        logger.info(f"Bulk copying {spec.name}")
+
+        with self.source_engine.connect() as source:
+            total = source.execute(
+                text(f"SELECT COUNT(*) FROM {spec.source_table}")
+            ).scalar()
+            progress = CopyProgress(spec.name, total)
+            query = text(spec.source_query)
+            after = None
+
+            try:
+                while True:
+                    df = pd.read_sql(
+                        query,
+                        source,
+                        params={"after": after, "limit": self.config.batch_size}
+                    )
+                    if df.empty:
+                        break
+                    # Nullable dtypes keep integer keys from LEFT JOINs as integers
+                    df = df.convert_dtypes()
+
+                    entities = df["id"].nunique()
+                    frames = [(target, target.transform(df)) for target in spec.targets]
+                    if not self.config.dry_run:
+                        failed = self._write_frames(spec, frames)
+                    else:
+                        failed = 0
+
+                    with self._stats_lock:
+                        self.stats["migrated_records"] += entities - failed
+                        self.stats["failed_records"] += failed
+                    progress.advance(entities)
+                    after = df["id"].max()
+                    after = after.item() if hasattr(after, "item") else after
+                    if entities < self.config.batch_size:
+                        break
+            finally:
+                progress.finish()
+
+        with self._stats_lock:
+            self.stats["total_records"] += total
+            self.stats["throughput"][spec.name] = round(progress.rows_per_second, 1)
+
+    def _write_frames(
+        self,
+        spec: TableCopy,
+        frames: List[Tuple[TargetTable, pd.DataFrame]]
+    ) -> int:
+        """Write a transformed batch in one transaction; returns failed entity count"""
+        try:
+            with self.target_engine.begin() as connection:
+                for target, frame in frames:
+                    self._bulk_insert(connection, target, frame)
+            return 0
+        except Exception as e:
+            logger.warning(f"Batch write for {spec.name} failed, retrying row by row: {e}")
+
+        # Isolate bad rows: one transaction per entity
+        failed = 0
+        for entity_id in frames[0][1]["id"].unique():
+            try:
+                with self.target_engine.begin() as connection:
+                    for target, frame in frames:
+                        self._bulk_insert(connection, target, frame[frame[target.key] == entity_id])
+            except Exception as e:
+                failed += 1
+                logger.error(f"Failed to migrate {spec.name} {entity_id}: {e}")
+                with self._stats_lock:
+                    self.stats["errors"].append(f"{spec.name} {entity_id}: {str(e)}")
+        return failed
+
+    def _bulk_insert(self, connection, target: TargetTable, frame: pd.DataFrame):
+        """Insert a frame with COPY on PostgreSQL, executemany elsewhere"""
+        if frame.empty:
+            return
+
+        frame = frame[target.columns].copy()
+        column_list = ", ".join(target.columns)
+
+        # JSON columns arrive as dicts/lists
+        for column in frame.columns:
+            if frame[column].dtype == object:
+                frame[column] = frame[column].map(
+                    lambda value: json.dumps(value, default=str)
+                    if isinstance(value, (dict, list)) else value
+                )
+
+        if self.config.use_copy and connection.dialect.driver == "psycopg2":
+            buffer = io.StringIO()
+            frame.to_csv(buffer, index=False, header=False, na_rep="\\N")
+            buffer.seek(0)
+            cursor = connection.connection.cursor()
+            try:
+                cursor.copy_expert(
+                    f"COPY {target.name} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                    buffer
+                )
+            finally:
+                cursor.close()
+            return
+
+        placeholders = ", ".join(f":{column}" for column in target.columns)
+        records = frame.astype(object).where(frame.notna(), None).to_dict("records")
+        connection.execute(
+            text(f"INSERT INTO {target.name} ({column_list}) VALUES ({placeholders})"),
+            records
+        )
+
     async def migrate_provider_data(self):
         """Migrate provider data"""
         logger.info("Migrating provider data")
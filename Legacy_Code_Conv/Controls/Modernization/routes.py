@@ -5,7 +5,7 @@ from typing import List, Optional
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 from .models import Address, NameFormat, ChangeTracker, ValidationResult
-from .services import AddressService, NameFormatService, ChangeTrackingService
+from .control_services import AddressService, NameFormatService, ChangeTrackingService
 from ..Core.monitoring.logger import Logger
 from ..Config.config_manager import ConfigManager
 
@@ -0,0 +1,90 @@
+from typing import NamedTuple, Optional
+import re
+
+# USPS Publication 28 abbreviations (Appendix C1 suffixes, C2 units, B directionals)
+STREET_SUFFIXES = {
+    "ALLEY": "ALY", "AVENUE": "AVE", "AV": "AVE", "AVEN": "AVE", "BOULEVARD": "BLVD",
+    "BOUL": "BLVD", "BYPASS": "BYP", "CENTER": "CTR", "CENTRE": "CTR", "CIRCLE": "CIR",
+    "COURT": "CT", "COVE": "CV", "CRESCENT": "CRES", "CROSSING": "XING", "DRIVE": "DR",
+    "DRV": "DR", "EXPRESSWAY": "EXPY", "EXTENSION": "EXT", "FREEWAY": "FWY",
+    "GARDENS": "GDNS", "HEIGHTS": "HTS", "HIGHWAY": "HWY", "HIWAY": "HWY", "JUNCTION": "JCT",
+    "LANE": "LN", "LOOP": "LOOP", "MOTORWAY": "MTWY", "PARKWAY": "PKWY", "PARKWY": "PKWY",
+    "PIKE": "PIKE", "PLACE": "PL", "PLAZA": "PLZ", "POINT": "PT", "ROAD": "RD",
+    "ROUTE": "RTE", "SQUARE": "SQ", "STREET": "ST", "STR": "ST", "TERRACE": "TER",
+    "TRAIL": "TRL", "TURNPIKE": "TPKE", "WAY": "WAY",
+}
+
+DIRECTIONALS = {
+    "NORTH": "N", "SOUTH": "S", "EAST": "E", "WEST": "W",
+    "NORTHEAST": "NE", "NORTHWEST": "NW", "SOUTHEAST": "SE", "SOUTHWEST": "SW",
+}
+
+UNIT_DESIGNATORS = {
+    "APARTMENT": "APT", "BUILDING": "BLDG", "DEPARTMENT": "DEPT", "FLOOR": "FL",
+    "HANGAR": "HNGR", "LOT": "LOT", "OFFICE": "OFC", "ROOM": "RM", "SPACE": "SPC",
+    "SUITE": "STE", "TRAILER": "TRLR", "UNIT": "UNIT",
+}
+
+STATES = {
+    "ALABAMA": "AL", "ALASKA": "AK", "ARIZONA": "AZ", "ARKANSAS": "AR", "CALIFORNIA": "CA",
+    "COLORADO": "CO", "CONNECTICUT": "CT", "DELAWARE": "DE", "DISTRICT OF COLUMBIA": "DC",
+    "FLORIDA": "FL", "GEORGIA": "GA", "HAWAII": "HI", "IDAHO": "ID", "ILLINOIS": "IL",
+    "INDIANA": "IN", "IOWA": "IA", "KANSAS": "KS", "KENTUCKY": "KY", "LOUISIANA": "LA",
+    "MAINE": "ME", "MARYLAND": "MD", "MASSACHUSETTS": "MA", "MICHIGAN": "MI",
+    "MINNESOTA": "MN", "MISSISSIPPI": "MS", "MISSOURI": "MO", "MONTANA": "MT",
+    "NEBRASKA": "NE", "NEVADA": "NV", "NEW HAMPSHIRE": "NH", "NEW JERSEY": "NJ",
+    "NEW MEXICO": "NM", "NEW YORK": "NY", "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND",
+    "OHIO": "OH", "OKLAHOMA": "OK", "OREGON": "OR", "PENNSYLVANIA": "PA",
+    "PUERTO RICO": "PR", "RHODE ISLAND": "RI", "SOUTH CAROLINA": "SC", "SOUTH DAKOTA": "SD",
+    "TENNESSEE": "TN", "TEXAS": "TX", "UTAH": "UT", "VERMONT": "VT", "VIRGINIA": "VA",
+    "WASHINGTON": "WA", "WEST VIRGINIA": "WV", "WISCONSIN": "WI", "WYOMING": "WY",
+}
+
+_ZIP_RE = re.compile(r"\s(\d{5})(?:\s?-?\s?\d{4})?$")
+_STATE_RE = re.compile(
+    r"\b(" + "|".join(sorted(STATES, key=len, reverse=True)) + r")$"
+)
+_PO_BOX_RE = re.compile(r"\bP\s?O\s+BOX\b|\bPOST\s+OFFICE\s+BOX\b")
+
+class NormalizedAddress(NamedTuple):
+    """Canonical form of a free-text address"""
+    text: str
+    zip5: Optional[str]
+
+    @property
+    def key(self) -> str:
+        return self.text
+
+def normalize_address(address: str) -> NormalizedAddress:
+    """Canonicalize an address the way USPS does, so spellings of one place share a key
+
+    Uppercases, strips punctuation, abbreviates suffixes, directionals, unit
+    designators and state names, and truncates ZIP+4 to the five-digit ZIP.
+    """
+    text = address.upper().replace(".", "")
+    text = re.sub(r"#\s*", " # ", text)
+    text = re.sub(r"[^A-Z0-9#/\- ]", " ", text)
+    text = " " + " ".join(text.split())
+
+    zip5 = None
+    match = _ZIP_RE.search(text)
+    if match:
+        zip5 = match.group(1)
+        text = text[:match.start()]
+
+    text = _STATE_RE.sub(lambda m: STATES[m.group(1)], text.strip())
+    text = _PO_BOX_RE.sub("PO BOX", text)
+
+    tokens = []
+    for token in text.split():
+        token = (
+            STREET_SUFFIXES.get(token)
+            or DIRECTIONALS.get(token)
+            or UNIT_DESIGNATORS.get(token)
+            or token
+        )
+        tokens.append(token)
+
+    if zip5:
+        tokens.append(zip5)
+    return NormalizedAddress(" ".join(tokens), zip5)
@@ -1,10 +1,14 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+import asyncio
 import httpx
 from pydantic import BaseModel
 import logging
 from cache.cache_service import CacheService
 from datetime import timedelta
 
+from .address_normalizer import normalize_address
+from .rate_limiter import RateLimiter
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -26,39 +30,61 @@ class VerifiedAddress(BaseModel):
     verification_status: str
 
 class AddressVerificationService:
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 10, requests_per_second: float = 25.0):
         self.cache = CacheService()
         self.smarty_streets_api_key = "your-smarty-streets-api-key"  # Move to env
         self.usps_api_key = "your-usps-api-key"  # Move to env
         self.cache_ttl = timedelta(days=30)
+        self._provider_slots = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = RateLimiter(requests_per_second)
 
     async def verify_address(self, address: str) -> Optional[VerifiedAddress]:
         """Verify address using multiple services with fallback"""
-        # Check cache first
-        cached_result = self.cache.get(f"verified_address:{address}")
-        if cached_result:
-            return VerifiedAddress(**cached_result)
+        return (await self.verify_batch([address]))[0]
+
+    async def verify_batch(self, addresses: List[str]) -> List[Optional[VerifiedAddress]]:
+        """Verify many addresses, in input order
+
+        Each normalized address is looked up in the cache once and only the
+        misses are sent to the verification services, concurrently and under
+        the rate limit.
+        """
+        keys = [f"verified_address:{normalize_address(address).key}" for address in addresses]
+        unique = dict(zip(keys, addresses))
+        found = await self.cache.get_many(list(unique))
 
+        missing = [key for key in unique if key not in found]
+        verified = await asyncio.gather(*(self._verify_uncached(unique[key]) for key in missing))
+        fresh = {key: result.dict() for key, result in zip(missing, verified) if result}
+        await self.cache.set_many(fresh, self.cache_ttl)
+        found.update(fresh)
+
+        return [VerifiedAddress(**found[key]) if key in found else None for key in keys]
+
+    async def _verify_uncached(self, address: str) -> Optional[VerifiedAddress]:
         # Try primary service (SmartyStreets)
         try:
-            result = await self._verify_with_smarty_streets(address)
+            result = await self._limited(self._verify_with_smarty_streets, address)
             if result:
-                self.cache.set(f"verified_address:{address}", result.dict(), self.cache_ttl)
                 return result
         except Exception as e:
             logger.error(f"SmartyStreets verification failed: {e}")
 
         # Fallback to USPS
         try:
-            result = await self._verify_with_usps(address)
+            result = await self._limited(self._verify_with_usps, address)
             if result:
-                self.cache.set(f"verified_address:{address}", result.dict(), self.cache_ttl)
                 return result
         except Exception as e:
             logger.error(f"USPS verification failed: {e}")
 
         return None
 
+    async def _limited(self, verify, address: str) -> Optional[VerifiedAddress]:
+        async with self._provider_slots:
+            await self._rate_limiter.acquire()
+            return await verify(address)
+
     async def _verify_with_smarty_streets(self, address: str) -> Optional[VerifiedAddress]:
         """Verify address using SmartyStreets API"""
         async with httpx.AsyncClient() as client:
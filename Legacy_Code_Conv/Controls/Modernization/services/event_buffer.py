@@ -0,0 +1,181 @@
+from typing import Callable, Dict, List, Optional
+from collections import deque
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+class EventBuffer:
+    """Bounded in-memory buffer drained by a background writer thread.
+
+    Producers call ``put``, which only appends to a deque under a lock. The
+    writer hands batches of up to ``batch_size`` items to ``writer`` when the
+    batch is full or ``flush_interval`` seconds have passed, whichever comes
+    first. ``close`` drains whatever is left.
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[List[Dict]], None],
+        max_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        overflow: str = "drop_oldest",
+        block_timeout: float = 0.05,
+        retry_attempts: int = 2,
+        name: str = "event-buffer"
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unsupported overflow policy: {overflow}")
+
+        self.writer = writer
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.retry_attempts = retry_attempts
+        self.name = name
+
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+
+        self._items: deque = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._flushed = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def start(self):
+        """Start the writer thread"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._closed = False
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def put(self, item: Dict) -> bool:
+        """Queue an item; returns False if it was dropped"""
+        with self._lock:
+            if self._closed:
+                self.dropped += 1
+                return False
+
+            if len(self._items) >= self.max_size:
+                if self.overflow == "drop_newest":
+                    self.dropped += 1
+                    return False
+                if self.overflow == "drop_oldest":
+                    self._items.popleft()
+                    self.dropped += 1
+                else:
+                    # Backpressure: wait briefly for the writer, then drop
+                    self._not_full.wait_for(
+                        lambda: len(self._items) < self.max_size or self._closed,
+                        timeout=self.block_timeout
+                    )
+                    if len(self._items) >= self.max_size or self._closed:
+                        self.dropped += 1
+                        return False
+
+            self._items.append(item)
+            if len(self._items) >= self.batch_size:
+                self._not_empty.notify()
+            return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write everything queued so far; returns False on timeout"""
+        if not self._thread or not self._thread.is_alive():
+            self._drain()
+            return True
+
+        with self._lock:
+            self._flush_requested = True
+            self._not_empty.notify()
+            return self._flushed.wait_for(
+                lambda: not self._items and self._in_flight == 0,
+                timeout=timeout
+            )
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Stop accepting items, flush the remainder and stop the writer"""
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify()
+            self._not_full.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self._drain()
+
+    def _take_batch(self) -> List[Dict]:
+        count = min(self.batch_size, len(self._items))
+        batch = [self._items.popleft() for _ in range(count)]
+        self._in_flight += len(batch)
+        self._not_full.notify_all()
+        return batch
+
+    def _run(self):
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            with self._lock:
+                self._not_empty.wait_for(
+                    lambda: (
+                        len(self._items) >= self.batch_size
+                        or self._flush_requested
+                        or self._closed
+                    ),
+                    timeout=max(deadline - time.monotonic(), 0)
+                )
+                if self._closed:
+                    return
+                batch = self._take_batch() if self._items else []
+                if not self._items:
+                    self._flush_requested = False
+
+            if batch:
+                self._write(batch)
+            if time.monotonic() >= deadline or not batch:
+                deadline = time.monotonic() + self.flush_interval
+
+            with self._lock:
+                if not self._items and self._in_flight == 0:
+                    self._flushed.notify_all()
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                if not self._items:
+                    self._flushed.notify_all()
+                    return
+                batch = self._take_batch()
+            self._write(batch)
+
+    def _write(self, batch: List[Dict]):
+        try:
+            for attempt in range(self.retry_attempts + 1):
+                try:
+                    self.writer(batch)
+                    self.written += len(batch)
+                    return
+                except Exception as e:
+                    if attempt == self.retry_attempts:
+                        self.failed += len(batch)
+                        logger.error(f"Failed to write {len(batch)} buffered events: {e}")
+                        return
+                    time.sleep(0.1 * (2 ** attempt))
+        finally:
+            with self._lock:
+                self._in_flight -= len(batch)
@@ -0,0 +1,150 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import datetime
+import csv
+import logging
+from sqlalchemy import create_engine, select, Column, Float, String, DateTime, JSON
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+
+logger = logging.getLogger(__name__)
+
+Base = declarative_base()
+
+class GeocodeRecord(Base):
+    """Provider geocode for one normalized address"""
+    __tablename__ = 'geocodes'
+
+    address_key = Column(String, primary_key=True)
+    formatted_address = Column(String, nullable=False)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    confidence_score = Column(Float, nullable=False)
+    place_id = Column(String, nullable=False)
+    components = Column(JSON, nullable=True)
+    source = Column(String, nullable=True)
+    updated_at = Column(DateTime, nullable=False)
+
+class ZipCentroid(Base):
+    """Center point of a five-digit ZIP code"""
+    __tablename__ = 'zip_centroids'
+
+    zip_code = Column(String(5), primary_key=True)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+
+GEOCODE_FIELDS = ['formatted_address', 'latitude', 'longitude', 'confidence_score', 'place_id', 'components']
+
+class GeocodeStore:
+    """Local table of geocodes so each address is sent to a provider once"""
+
+    def __init__(self, db_url: str = "sqlite:///geocodes.db", batch_size: int = 500):
+        self.engine = create_engine(db_url)
+        self.Session = sessionmaker(bind=self.engine)
+        self.batch_size = batch_size
+        self._schema_ready = False
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        """Stored geocodes for the given address keys"""
+        self._ensure_schema()
+        keys = list(keys)
+        found = {}
+        with self.Session() as session:
+            for chunk in self._chunks(keys):
+                rows = session.execute(
+                    select(GeocodeRecord).where(GeocodeRecord.address_key.in_(chunk))
+                ).scalars()
+                for row in rows:
+                    found[row.address_key] = {
+                        field: getattr(row, field) for field in GEOCODE_FIELDS
+                    }
+        return found
+
+    def put_many(self, geocodes: Dict[str, Dict], source: Optional[str] = None):
+        """Insert or refresh geocodes keyed by address key"""
+        if not geocodes:
+            return
+        self._ensure_schema()
+        now = datetime.utcnow()
+        rows = [
+            {
+                "address_key": key,
+                **{field: geocode.get(field) for field in GEOCODE_FIELDS},
+                "source": source,
+                "updated_at": now
+            }
+            for key, geocode in geocodes.items()
+        ]
+        self._upsert(GeocodeRecord, rows, ["address_key"])
+
+    def zip_centroids(self, zip_codes: Iterable[str]) -> Dict[str, Tuple[float, float]]:
+        """(latitude, longitude) for each known ZIP code"""
+        self._ensure_schema()
+        zip_codes = list(set(zip_codes))
+        found = {}
+        with self.Session() as session:
+            for chunk in self._chunks(zip_codes):
+                rows = session.execute(
+                    select(ZipCentroid).where(ZipCentroid.zip_code.in_(chunk))
+                ).scalars()
+                for row in rows:
+                    found[row.zip_code] = (row.latitude, row.longitude)
+        return found
+
+    def load_zip_centroids(self, centroids: Iterable[Tuple[str, float, float]]) -> int:
+        """Insert or refresh (zip_code, latitude, longitude) rows"""
+        self._ensure_schema()
+        loaded = 0
+        batch = []
+        for zip_code, latitude, longitude in centroids:
+            batch.append({"zip_code": zip_code, "latitude": latitude, "longitude": longitude})
+            if len(batch) >= self.batch_size:
+                self._upsert(ZipCentroid, batch, ["zip_code"])
+                loaded += len(batch)
+                batch = []
+        if batch:
+            self._upsert(ZipCentroid, batch, ["zip_code"])
+            loaded += len(batch)
+        return loaded
+
+    def load_zip_centroids_file(self, path: str) -> int:
+        """Load a Census ZCTA gazetteer file (tab separated GEOID, INTPTLAT, INTPTLONG)"""
+        with open(path, newline='') as f:
+            reader = csv.DictReader(f, delimiter='\t')
+            reader.fieldnames = [name.strip() for name in reader.fieldnames]
+            loaded = self.load_zip_centroids(
+                (row["GEOID"], float(row["INTPTLAT"]), float(row["INTPTLONG"]))
+                for row in reader
+            )
+        logger.info(f"Loaded {loaded} ZIP centroids from {path}")
+        return loaded
+
+    def _upsert(self, table, rows: List[Dict], key_columns: List[str]):
+        dialect = self.engine.dialect.name
+        with self.Session() as session:
+            if dialect in ("postgresql", "sqlite"):
+                insert = pg_insert if dialect == "postgresql" else sqlite_insert
+                for chunk in self._chunks(rows):
+                    stmt = insert(table).values(chunk)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=key_columns,
+                        set_={
+                            column: stmt.excluded[column]
+                            for column in chunk[0] if column not in key_columns
+                        }
+                    )
+                    session.execute(stmt)
+            else:
+                for row in rows:
+                    session.merge(table(**row))
+            session.commit()
+
+    def _chunks(self, items: List) -> Iterable[List]:
+        for start in range(0, len(items), self.batch_size):
+            yield items[start:start + self.batch_size]
+
+    def _ensure_schema(self):
+        if not self._schema_ready:
+            Base.metadata.create_all(self.engine)
+            self._schema_ready = True
@@ -1,10 +1,15 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
 import httpx
 from pydantic import BaseModel
 import logging
 from cache.cache_service import CacheService
 from datetime import timedelta
 
+from .address_normalizer import NormalizedAddress, normalize_address
+from .geocode_store import GeocodeStore
+from .rate_limiter import RateLimiter
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -21,48 +26,140 @@ class GeocodeResponse(BaseModel):
     results: List[GeocodingResult]
     status: str
 
+# (name, geocode function) tried in order until one returns a result
+GeocodeProvider = Tuple[str, Callable[[str], Awaitable[Optional[GeocodingResult]]]]
+
+ZIP_CENTROID_CONFIDENCE = 0.3
+
 class GeocodingService:
-    def __init__(self):
-        self.cache = CacheService()
+    def __init__(
+        self,
+        providers: Optional[List[GeocodeProvider]] = None,
+        store: Optional[GeocodeStore] = None,
+        cache: Optional[CacheService] = None,
+        max_concurrency: int = 10,
+        requests_per_second: float = 25.0
+    ):
+        self.cache = cache or CacheService()
+        self.store = store or GeocodeStore()
         self.google_api_key = "your-google-api-key"  # Move to env
         self.here_api_key = "your-here-api-key"  # Move to env
         self.cache_ttl = timedelta(days=30)
+        self.providers = providers or [
+            ("google", self._geocode_google),
+            ("here", self._geocode_here)
+        ]
+        self._provider_slots = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = RateLimiter(requests_per_second)
+        self._client: Optional[httpx.AsyncClient] = None
 
     async def geocode_address(self, address: str) -> Optional[GeocodingResult]:
         """Geocode address using multiple services with fallback"""
-        cache_key = f"geocode:{address}"
-        
-        # Check cache first
-        cached_result = self.cache.get(cache_key)
-        if cached_result:
-            return GeocodingResult(**cached_result)
+        return (await self.geocode_batch([address]))[0]
 
-        # Try Google Maps first
-        try:
-            result = await self._geocode_google(address)
-            if result:
-                self.cache.set(cache_key, result.dict(), self.cache_ttl)
-                return result
-        except Exception as e:
-            logger.error(f"Google geocoding failed: {e}")
+    async def geocode_batch(self, addresses: List[str]) -> List[Optional[GeocodingResult]]:
+        """Geocode many addresses, in input order
 
-        # Fallback to HERE Maps
-        try:
-            result = await self._geocode_here(address)
-            if result:
-                self.cache.set(cache_key, result.dict(), self.cache_ttl)
-                return result
-        except Exception as e:
-            logger.error(f"HERE geocoding failed: {e}")
+        Addresses are normalized so different spellings of one place are looked
+        up once. Each unique address is served from Redis, then the local
+        geocode table, and only then sent to a provider; provider calls run
+        concurrently under the rate limit. Addresses no provider can place fall
+        back to their ZIP centroid.
+        """
+        normalized = [normalize_address(address) for address in addresses]
+        unique: Dict[str, NormalizedAddress] = {n.key: n for n in normalized}
+        found: Dict[str, Dict] = {}
 
-        return None
+        cached = await self.cache.get_many([f"geocode:{key}" for key in unique])
+        for key in unique:
+            if f"geocode:{key}" in cached:
+                found[key] = cached[f"geocode:{key}"]
+
+        missing = [key for key in unique if key not in found]
+        if missing:
+            stored = await asyncio.to_thread(self.store.get_many, missing)
+            found.update(stored)
+            await self.cache.set_many(
+                {f"geocode:{key}": value for key, value in stored.items()}, self.cache_ttl
+            )
+
+        missing = [key for key in unique if key not in found]
+        if missing:
+            geocoded = await asyncio.gather(*(
+                self._geocode_with_providers(unique[key].text) for key in missing
+            ))
+            by_source: Dict[str, Dict[str, Dict]] = {}
+            for key, (source, result) in zip(missing, geocoded):
+                if result is not None:
+                    found[key] = result.dict()
+                    by_source.setdefault(source, {})[key] = found[key]
+            for source, results in by_source.items():
+                await asyncio.to_thread(self.store.put_many, results, source)
+                await self.cache.set_many(
+                    {f"geocode:{key}": value for key, value in results.items()}, self.cache_ttl
+                )
+
+        missing = [key for key in unique if key not in found]
+        if missing:
+            found.update(await self._zip_centroid_results([unique[key] for key in missing]))
+
+        return [
+            GeocodingResult(**found[n.key]) if n.key in found else None
+            for n in normalized
+        ]
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _geocode_with_providers(self, address: str) -> Tuple[Optional[str], Optional[GeocodingResult]]:
+        """Try each provider in order under the concurrency and rate limits"""
+        for name, geocode in self.providers:
+            try:
+                async with self._provider_slots:
+                    await self._rate_limiter.acquire()
+                    result = await geocode(address)
+                if result:
+                    return name, result
+            except Exception as e:
+                logger.error(f"{name} geocoding failed: {e}")
+        return None, None
+
+    async def _zip_centroid_results(self, addresses: List[NormalizedAddress]) -> Dict[str, Dict]:
+        """Approximate results at the ZIP centroid (not cached, so providers are retried)"""
+        zip_codes = {n.zip5 for n in addresses if n.zip5}
+        if not zip_codes:
+            return {}
+        centroids = await asyncio.to_thread(self.store.zip_centroids, zip_codes)
+
+        results = {}
+        for n in addresses:
+            if n.zip5 not in centroids:
+                continue
+            latitude, longitude = centroids[n.zip5]
+            results[n.key] = GeocodingResult(
+                formatted_address=n.text,
+                latitude=latitude,
+                longitude=longitude,
+                confidence_score=ZIP_CENTROID_CONFIDENCE,
+                place_id=f"zip:{n.zip5}",
+                components={"postal_code": n.zip5}
+            ).dict()
+        return results
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=10.0)
+        return self._client
 
     async def reverse_geocode(self, lat: float, lng: float) -> Optional[GeocodingResult]:
         """Reverse geocode coordinates to address"""
         cache_key = f"reverse_geocode:{lat},{lng}"
         
         # Check cache first
-        cached_result = self.cache.get(cache_key)
+        cached_result = await self.cache.get(cache_key)
         if cached_result:
             return GeocodingResult(**cached_result)
 
@@ -70,7 +167,7 @@ class GeocodingService:
         try:
             result = await self._reverse_geocode_google(lat, lng)
             if result:
-                self.cache.set(cache_key, result.dict(), self.cache_ttl)
+                await self.cache.set(cache_key, result.dict(), self.cache_ttl)
                 return result
         except Exception as e:
             logger.error(f"Google reverse geocoding failed: {e}")
@@ -79,7 +176,7 @@ class GeocodingService:
         try:
             result = await self._reverse_geocode_here(lat, lng)
             if result:
-                self.cache.set(cache_key, result.dict(), self.cache_ttl)
+                await self.cache.set(cache_key, result.dict(), self.cache_ttl)
                 return result
         except Exception as e:
             logger.error(f"HERE reverse geocoding failed: {e}")
@@ -88,60 +185,60 @@ class GeocodingService:
 
     async def _geocode_google(self, address: str) -> Optional[GeocodingResult]:
         """Geocode using Google Maps API"""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    "https://maps.googleapis.com/maps/api/geocode/json",
-                    params={
-                        "address": address,
-                        "key": self.google_api_key
-                    }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data["status"] == "OK":
-                        result = data["results"][0]
-                        return GeocodingResult(
-                            formatted_address=result["formatted_address"],
-                            latitude=result["geometry"]["location"]["lat"],
-                            longitude=result["geometry"]["location"]["lng"],
-                            confidence_score=self._calculate_google_confidence(result),
-                            place_id=result["place_id"],
-                            components=self._extract_google_components(result)
-                        )
-            except Exception as e:
-                logger.error(f"Google Maps API error: {e}")
-                return None
+        client = self._http()
+        try:
+            response = await client.get(
+                "https://maps.googleapis.com/maps/api/geocode/json",
+                params={
+                    "address": address,
+                    "key": self.google_api_key
+                }
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                if data["status"] == "OK":
+                    result = data["results"][0]
+                    return GeocodingResult(
+                        formatted_address=result["formatted_address"],
+                        latitude=result["geometry"]["location"]["lat"],
+                        longitude=result["geometry"]["location"]["lng"],
+                        confidence_score=self._calculate_google_confidence(result),
+                        place_id=result["place_id"],
+                        components=self._extract_google_components(result)
+                    )
+        except Exception as e:
+            logger.error(f"Google Maps API error: {e}")
+            return None
 
     async def _geocode_here(self, address: str) -> Optional[GeocodingResult]:
         """Geocode using HERE Maps API"""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    "https://geocoder.ls.hereapi.com/6.2/geocode.json",
-                    params={
-                        "searchtext": address,
-                        "apiKey": self.here_api_key,
-                        "gen": "9"
-                    }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if "Response" in data:
-                        result = data["Response"]["View"][0]["Result"][0]
-                        return GeocodingResult(
-                            formatted_address=result["Location"]["Address"]["Label"],
-                            latitude=result["Location"]["DisplayPosition"]["Latitude"],
-                            longitude=result["Location"]["DisplayPosition"]["Longitude"],
-                            confidence_score=self._calculate_here_confidence(result),
-                            place_id=result["Location"]["LocationId"],
-                            components=self._extract_here_components(result)
-                        )
-            except Exception as e:
-                logger.error(f"HERE Maps API error: {e}")
-                return None
+        client = self._http()
+        try:
+            response = await client.get(
+                "https://geocoder.ls.hereapi.com/6.2/geocode.json",
+                params={
+                    "searchtext": address,
+                    "apiKey": self.here_api_key,
+                    "gen": "9"
+                }
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                if "Response" in data:
+                    result = data["Response"]["View"][0]["Result"][0]
+                    return GeocodingResult(
+                        formatted_address=result["Location"]["Address"]["Label"],
+                        latitude=result["Location"]["DisplayPosition"]["Latitude"],
+                        longitude=result["Location"]["DisplayPosition"]["Longitude"],
+                        confidence_score=self._calculate_here_confidence(result),
+                        place_id=result["Location"]["LocationId"],
+                        components=self._extract_here_components(result)
+                    )
+        except Exception as e:
+            logger.error(f"HERE Maps API error: {e}")
+            return None
 
     def _calculate_google_confidence(self, result: Dict) -> float:
         """Calculate confidence score for Google geocoding result"""
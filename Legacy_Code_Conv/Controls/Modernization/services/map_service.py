@@ -1,8 +1,10 @@
-from typing import List, Optional, Dict
+from typing import Hashable, List, Optional, Dict, Tuple
 from abc import ABC, abstractmethod
 from fastapi import HTTPException
 import aiohttp
 from ..models.address import Address
+from .route_planner import RoutePlan, plan_route
+from .spatial_index import GridIndex, Neighbor
 
 class MapProvider(ABC):
     """Abstract base class for map providers"""
@@ -76,8 +78,10 @@ class GoogleMapsProvider(MapProvider):
 class MapService:
     """Service for managing map providers and operations"""
     
-    def __init__(self):
+    def __init__(self, geocoder=None, cell_size_miles: float = 5.0):
         self.providers: Dict[str, MapProvider] = {}
+        self.geocoder = geocoder
+        self.spatial_index = GridIndex(cell_size_miles)
     
     def register_provider(self, name: str, provider: MapProvider) -> None:
         """Register a new map provider"""
@@ -113,3 +117,51 @@ class MapService:
             except:
                 continue
         return False
+
+    async def index_addresses(
+        self,
+        addresses: Dict[Hashable, str],
+        kind: Optional[str] = None
+    ) -> List[Hashable]:
+        """
+        Geocode addresses in one batch and add them to the spatial index.
+        Returns the ids that could not be geocoded.
+        """
+        geocoder = self.geocoder
+        if geocoder is None:
+            from .geocoding_service import geocoding_service as geocoder
+
+        ids = list(addresses)
+        results = await geocoder.geocode_batch([addresses[item_id] for item_id in ids])
+        unplaced = []
+        for item_id, result in zip(ids, results):
+            if result is None:
+                unplaced.append(item_id)
+            else:
+                self.spatial_index.add(item_id, result.latitude, result.longitude, kind)
+        return unplaced
+
+    def find_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_miles: float,
+        kind: Optional[str] = None
+    ) -> List[Neighbor]:
+        """Indexed points within radius_miles, nearest first"""
+        return self.spatial_index.within(latitude, longitude, radius_miles, kind)
+
+    def plan_delivery_route(
+        self,
+        start: Tuple[float, float],
+        stop_ids: List[Hashable],
+        return_to_start: bool = False
+    ) -> RoutePlan:
+        """Order indexed stops for a driver leaving from start"""
+        stops = []
+        for stop_id in stop_ids:
+            location = self.spatial_index.location(stop_id)
+            if location is None:
+                raise ValueError(f"Stop '{stop_id}' is not in the spatial index")
+            stops.append((stop_id, *location))
+        return plan_route(start, stops, return_to_depot=return_to_start)
@@ -0,0 +1,120 @@
+from typing import Hashable, List, NamedTuple, Sequence, Tuple
+import numpy as np
+
+from .spatial_index import _haversine, to_radians
+
+class RoutePlan(NamedTuple):
+    stop_ids: List[Hashable]
+    distance_miles: float
+
+def route_distance(points: Sequence[Tuple[float, float]], closed: bool = False) -> float:
+    """Miles along points in order, back to the first when closed"""
+    coords = to_radians(points)
+    if len(coords) < 2:
+        return 0.0
+    if closed:
+        coords = np.vstack([coords, coords[:1]])
+    return float(_haversine(coords[:-1, 0], coords[:-1, 1], coords[1:, 0], coords[1:, 1]).sum())
+
+def nearest_neighbor_order(points: Sequence[Tuple[float, float]], start: int = 0) -> List[int]:
+    """Greedy tour from start, always visiting the closest unvisited point
+
+    The closest point on the sphere has the largest dot product of unit
+    vectors, so each step is one matrix-vector product with no trigonometry,
+    and memory stays linear in the number of points.
+    """
+    coords = to_radians(points)
+    n = len(coords)
+    if n == 0:
+        return []
+    cos_lat = np.cos(coords[:, 0])
+    vectors = np.column_stack([
+        cos_lat * np.cos(coords[:, 1]),
+        cos_lat * np.sin(coords[:, 1]),
+        np.sin(coords[:, 0])
+    ])
+    visited = np.zeros(n, dtype=bool)
+    order = [start]
+    visited[start] = True
+    current = start
+    for _ in range(n - 1):
+        closeness = vectors @ vectors[current]
+        closeness[visited] = -np.inf
+        current = int(np.argmax(closeness))
+        visited[current] = True
+        order.append(current)
+    return order
+
+def two_opt(
+    points: Sequence[Tuple[float, float]],
+    order: List[int],
+    closed: bool = False,
+    max_passes: int = 10
+) -> List[int]:
+    """Improve a tour by reversing segments while that shortens it
+
+    The first stop stays first. For each edge (a, b) every candidate edge
+    (c, d) further along is scored in one vectorized step and the best
+    reversal of b..c is applied. Stops after ``max_passes`` full passes or
+    when no reversal helps.
+    """
+    n = len(order)
+    if n < 4:
+        return list(order)
+    order = np.asarray(order)
+    path = to_radians(points)[order]
+    lat, lon = path[:, 0], path[:, 1]
+    # edges[j] joins position j to j + 1; the last entry closes the tour
+    edges = np.append(
+        _haversine(lat[:-1], lon[:-1], lat[1:], lon[1:]),
+        _haversine(lat[-1], lon[-1], lat[0], lon[0]) if closed else 0.0
+    )
+
+    for _ in range(max_passes):
+        improved = False
+        for i in range(n - 2):
+            # Candidates c = path[j] for j in i+2..n-1, d = path[j+1]
+            a_to_c = _haversine(lat[i], lon[i], lat[i + 2:], lon[i + 2:])
+            b_to_d = _haversine(lat[i + 1], lon[i + 1], lat[i + 3:], lon[i + 3:])
+            if closed:
+                b_to_d = np.append(b_to_d, _haversine(lat[i + 1], lon[i + 1], lat[0], lon[0]))
+            else:
+                b_to_d = np.append(b_to_d, 0.0)
+
+            delta = a_to_c + b_to_d - edges[i] - edges[i + 2:]
+            k = int(np.argmin(delta))
+            if delta[k] >= -1e-9:
+                continue
+
+            j = i + 2 + k
+            order[i + 1:j + 1] = order[i + 1:j + 1][::-1].copy()
+            lat[i + 1:j + 1] = lat[i + 1:j + 1][::-1].copy()
+            lon[i + 1:j + 1] = lon[i + 1:j + 1][::-1].copy()
+            edges[i + 1:j] = edges[i + 1:j][::-1].copy()
+            edges[i] = a_to_c[k]
+            edges[j] = b_to_d[k]
+            improved = True
+        if not improved:
+            break
+    return order.tolist()
+
+def plan_route(
+    depot: Tuple[float, float],
+    stops: Sequence[Tuple[Hashable, float, float]],
+    return_to_depot: bool = False,
+    max_passes: int = 10
+) -> RoutePlan:
+    """Order (stop_id, latitude, longitude) stops starting from the depot
+
+    Builds a nearest-neighbor tour and tightens it with 2-opt. This is a
+    heuristic: routes are good, not guaranteed optimal.
+    """
+    if not stops:
+        return RoutePlan([], 0.0)
+    points = [tuple(depot)] + [(lat, lon) for _, lat, lon in stops]
+    order = nearest_neighbor_order(points, start=0)
+    order = two_opt(points, order, closed=return_to_depot, max_passes=max_passes)
+    return RoutePlan(
+        [stops[i - 1][0] for i in order[1:]],
+        route_distance([points[i] for i in order], closed=return_to_depot)
+    )
@@ -0,0 +1,185 @@
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+import math
+import numpy as np
+
+EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE = EARTH_RADIUS_MILES * math.pi / 180
+
+def _haversine(lat1, lon1, lat2, lon2):
+    """Great-circle miles between points given in radians (broadcasts)"""
+    h = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+
+def to_radians(points: Sequence[Tuple[float, float]]) -> np.ndarray:
+    """(n, 2) array of (latitude, longitude) radians"""
+    return np.radians(np.asarray(points, dtype=float).reshape(-1, 2))
+
+def haversine_distances(origin: Tuple[float, float], points: Sequence[Tuple[float, float]]) -> np.ndarray:
+    """Miles from one (latitude, longitude) to each of points"""
+    lat, lon = np.radians(origin)
+    coords = to_radians(points)
+    return _haversine(lat, lon, coords[:, 0], coords[:, 1])
+
+def haversine_matrix(
+    origins: Sequence[Tuple[float, float]],
+    destinations: Optional[Sequence[Tuple[float, float]]] = None
+) -> np.ndarray:
+    """Miles between every origin (rows) and destination (columns)
+
+    Destinations default to the origins. The matrix is n x m floats, so
+    callers with many thousands of points on both sides should query the
+    index or go row by row instead.
+    """
+    a = to_radians(origins)
+    b = a if destinations is None else to_radians(destinations)
+    return _haversine(a[:, 0, None], a[:, 1, None], b[None, :, 0], b[None, :, 1])
+
+class Neighbor(NamedTuple):
+    item_id: Hashable
+    distance_miles: float
+
+class GridIndex:
+    """In-memory grid index over geocoded points for radius and nearest queries
+
+    Points are bucketed into square cells of ``cell_size_miles`` (in degrees
+    of latitude). A query only measures points in the cells overlapping its
+    bounding box, and measures them in one vectorized haversine call. Points
+    carry an optional kind (e.g. "patient", "warehouse") to filter on.
+    """
+
+    def __init__(self, cell_size_miles: float = 5.0):
+        self.cell_size_miles = cell_size_miles
+        self._cell_degrees = cell_size_miles / MILES_PER_DEGREE
+        self._ids: List[Optional[Hashable]] = []
+        self._lats: List[float] = []
+        self._lons: List[float] = []
+        self._slots: Dict[Hashable, Tuple[Optional[str], Tuple[int, int], int]] = {}
+        self._cells: Dict[Optional[str], Dict[Tuple[int, int], List[int]]] = {}
+        self._radians: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, item_id: Hashable) -> bool:
+        return item_id in self._slots
+
+    def add(self, item_id: Hashable, latitude: float, longitude: float, kind: Optional[str] = None):
+        """Index a point, replacing any earlier location for the same id"""
+        if item_id in self._slots:
+            self.remove(item_id)
+        slot = len(self._ids)
+        self._ids.append(item_id)
+        self._lats.append(latitude)
+        self._lons.append(longitude)
+        cell = self._cell(latitude, longitude)
+        self._cells.setdefault(kind, {}).setdefault(cell, []).append(slot)
+        self._slots[item_id] = (kind, cell, slot)
+        self._radians = None
+
+    def add_many(self, points: Iterable[Tuple[Hashable, float, float]], kind: Optional[str] = None):
+        for item_id, latitude, longitude in points:
+            self.add(item_id, latitude, longitude, kind)
+
+    def remove(self, item_id: Hashable) -> bool:
+        entry = self._slots.pop(item_id, None)
+        if entry is None:
+            return False
+        kind, cell, slot = entry
+        self._cells[kind][cell].remove(slot)
+        if not self._cells[kind][cell]:
+            del self._cells[kind][cell]
+        self._ids[slot] = None
+        return True
+
+    def location(self, item_id: Hashable) -> Optional[Tuple[float, float]]:
+        entry = self._slots.get(item_id)
+        if entry is None:
+            return None
+        slot = entry[2]
+        return self._lats[slot], self._lons[slot]
+
+    def within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_miles: float,
+        kind: Optional[str] = None
+    ) -> List[Neighbor]:
+        """Points within radius_miles, nearest first"""
+        slots = self._candidates(latitude, longitude, radius_miles, kind)
+        if not slots:
+            return []
+        slots = np.fromiter(slots, dtype=np.int64, count=len(slots))
+        coords = self._coordinates()[slots]
+        lat, lon = math.radians(latitude), math.radians(longitude)
+        distances = _haversine(lat, lon, coords[:, 0], coords[:, 1])
+
+        inside = distances <= radius_miles
+        slots, distances = slots[inside], distances[inside]
+        order = np.argsort(distances, kind="stable")
+        return [Neighbor(self._ids[slots[i]], float(distances[i])) for i in order]
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 1,
+        kind: Optional[str] = None
+    ) -> List[Neighbor]:
+        """The k closest points, nearest first"""
+        radius = self.cell_size_miles
+        # Half the earth's circumference covers every point
+        limit = math.pi * EARTH_RADIUS_MILES
+        while True:
+            found = self.within(latitude, longitude, min(radius, limit), kind)
+            if len(found) >= k or radius >= limit:
+                return found[:k]
+            radius *= 2
+
+    def _cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return (
+            math.floor(latitude / self._cell_degrees),
+            math.floor(longitude / self._cell_degrees)
+        )
+
+    def _coordinates(self) -> np.ndarray:
+        if self._radians is None:
+            self._radians = np.radians(np.column_stack([self._lats, self._lons]))
+        return self._radians
+
+    def _candidates(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_miles: float,
+        kind: Optional[str]
+    ) -> List[int]:
+        """Slots in cells overlapping the query's bounding box"""
+        lat_span = radius_miles / MILES_PER_DEGREE
+        # Longitude degrees shrink toward the poles; use the widest span in the band
+        widest = min(abs(latitude) + lat_span, 89.9)
+        lon_span = radius_miles / (MILES_PER_DEGREE * math.cos(math.radians(widest)))
+
+        low_row, low_col = self._cell(latitude - lat_span, longitude - lon_span)
+        high_row, high_col = self._cell(latitude + lat_span, longitude + lon_span)
+        wraps = lon_span >= 180 or not -180 <= longitude - lon_span <= longitude + lon_span <= 180
+        box_cells = (high_row - low_row + 1) * (high_col - low_col + 1)
+
+        grids = self._cells.values() if kind is None else [self._cells.get(kind, {})]
+        slots: List[int] = []
+        for grid in grids:
+            if wraps or box_cells > len(grid):
+                # Fewer occupied cells than cells in the box: scan them instead
+                for (row, col), members in grid.items():
+                    if low_row <= row <= high_row and (wraps or low_col <= col <= high_col):
+                        slots.extend(members)
+            else:
+                for row in range(low_row, high_row + 1):
+                    for col in range(low_col, high_col + 1):
+                        members = grid.get((row, col))
+                        if members:
+                            slots.extend(members)
+        return slots
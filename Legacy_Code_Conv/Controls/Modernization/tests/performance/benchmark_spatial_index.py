@@ -0,0 +1,97 @@
+"""
+Benchmark for the spatial index and route planner at metro scale.
+
+The pytest cases only check results on 10,000 points; timings are printed
+by running the module directly:
+
+    python -m tests.performance.benchmark_spatial_index
+"""
+import pytest
+import random
+import time
+from services.route_planner import nearest_neighbor_order, plan_route
+from services.spatial_index import GridIndex, haversine_distances, haversine_matrix
+
+POINTS = 10000
+
+def sample_points(count=POINTS):
+    # Roughly a metro delivery area, 100 x 80 miles
+    rng = random.Random(42)
+    return [(f"p{i}", rng.uniform(39.5, 41.0), rng.uniform(-75.8, -74.3)) for i in range(count)]
+
+def build_index(points):
+    index = GridIndex(cell_size_miles=5)
+    index.add_many(points, kind="patient")
+    return index
+
+@pytest.fixture(scope="module")
+def points():
+    return sample_points()
+
+@pytest.fixture(scope="module")
+def index(points):
+    return build_index(points)
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def test_radius_query_matches_full_scan(index, points):
+    coords = [(lat, lon) for _, lat, lon in points]
+    distances = haversine_distances((40.2, -75.0), coords)
+    expected = {points[i][0] for i, distance in enumerate(distances) if distance <= 10}
+
+    found = {neighbor.item_id for neighbor in index.within(40.2, -75.0, 10)}
+
+    assert found
+    assert found == expected
+
+def test_nearest_queries(index):
+    rng = random.Random(1)
+    for _ in range(100):
+        assert len(index.nearest(rng.uniform(39.5, 41.0), rng.uniform(-75.8, -74.3), k=5)) == 5
+
+def test_distance_matrix_to_depots(points):
+    coords = [(lat, lon) for _, lat, lon in points]
+    matrix = haversine_matrix(coords, coords[:50])
+
+    assert matrix.shape == (POINTS, 50)
+
+def test_nearest_neighbor_order(points):
+    coords = [(lat, lon) for _, lat, lon in points]
+    order = nearest_neighbor_order(coords)
+
+    assert sorted(order) == list(range(POINTS))
+
+def test_daily_route_plan(points):
+    plan = plan_route((40.2, -75.0), points[:500], return_to_depot=True)
+
+    assert sorted(plan.stop_ids) == sorted(point_id for point_id, _, _ in points[:500])
+
+def main():
+    """Print timings for each operation."""
+    points = sample_points()
+    coords = [(lat, lon) for _, lat, lon in points]
+    index = build_index(points)
+    rng = random.Random(1)
+
+    cases = [
+        ("index build", lambda: build_index(points)),
+        ("20 radius scans", lambda: [haversine_distances((40.2, -75.0), coords) for _ in range(20)]),
+        ("20 radius queries", lambda: [index.within(40.2, -75.0, 10) for _ in range(20)]),
+        ("1000 nearest queries", lambda: [
+            index.nearest(rng.uniform(39.5, 41.0), rng.uniform(-75.8, -74.3), k=5)
+            for _ in range(1000)
+        ]),
+        ("distance matrix x50", lambda: haversine_matrix(coords, coords[:50])),
+        ("nearest neighbor order", lambda: nearest_neighbor_order(coords)),
+        ("route plan, 500 stops", lambda: plan_route((40.2, -75.0), points[:500], return_to_depot=True)),
+    ]
+    print(f"{'operation':<26}{'seconds':>10}")
+    for name, func in cases:
+        _, elapsed = timed(func)
+        print(f"{name:<26}{elapsed:>10.3f}")
+
+if __name__ == "__main__":
+    main()
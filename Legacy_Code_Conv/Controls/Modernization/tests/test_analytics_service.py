@@ -0,0 +1,182 @@
+import pytest
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from sqlalchemy import insert, select
+from services.analytics_service import (
+    AnalyticsEvent,
+    AnalyticsHourlyRollup,
+    AnalyticsHourlyUser,
+    AnalyticsService,
+    Base,
+    UserAction
+)
+
+# The service relies on PostgreSQL upserts, FILTER and advisory locks
+DATABASE_URL = os.environ.get("ANALYTICS_TEST_DATABASE_URL")
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason="ANALYTICS_TEST_DATABASE_URL not set")
+
+def at(hour, minute=0):
+    return datetime(2025, 3, 10, hour, minute)
+
+EVENTS = [
+    # (timestamp, user, action, duration)
+    (at(9, 10), "u1", "click", 1.0),   # before the range
+    (at(9, 30), "u1", "click", 2.0),   # leading partial hour
+    (at(10, 15), "u2", "error", None), # whole hours
+    (at(10, 45), "u2", "click", 4.0),
+    (at(11, 45), "u3", "click", 6.0),
+    (at(12, 10), "u4", "error", 8.0),  # trailing partial hour
+    (at(12, 40), "u5", "click", 1.0),  # after the range
+]
+
+@pytest.fixture
+def service():
+    service = AnalyticsService(DATABASE_URL, flush_interval=0.05, backfill=False)
+    Base.metadata.drop_all(service.engine)
+    Base.metadata.create_all(service.engine)
+    yield service
+    service.close()
+    service.engine.dispose()
+
+def track(service, events, component="address"):
+    for timestamp, user_id, action, duration in events:
+        service.track_action(UserAction(
+            timestamp=timestamp,
+            user_id=user_id,
+            component=component,
+            action=action,
+            data={"duration": duration} if duration is not None else None
+        ))
+    assert service.flush(timeout=5)
+
+def rollups(service, component="address"):
+    session = service.Session()
+    try:
+        return [
+            (row.hour, row.total_actions, row.error_count, row.duration_sum, row.duration_count)
+            for row in session.execute(
+                select(AnalyticsHourlyRollup)
+                .where(AnalyticsHourlyRollup.component == component)
+                .order_by(AnalyticsHourlyRollup.hour)
+            ).scalars()
+        ]
+    finally:
+        session.close()
+
+def test_rollup_upsert_adds_batches(service):
+    track(service, [(at(10, 5), "u1", "click", 2.0), (at(10, 6), "u1", "error", None)])
+    track(service, [(at(10, 50), "u2", "click", 4.0), (at(11, 1), None, "click", None)])
+
+    assert rollups(service) == [
+        (at(10), 3, 1, 6.0, 2),
+        (at(11), 1, 0, 0.0, 0),
+    ]
+    session = service.Session()
+    try:
+        users = session.execute(
+            select(AnalyticsHourlyUser.hour, AnalyticsHourlyUser.user_id)
+            .order_by(AnalyticsHourlyUser.hour, AnalyticsHourlyUser.user_id)
+        ).all()
+    finally:
+        session.close()
+    assert [tuple(row) for row in users] == [(at(10), "u1"), (at(10), "u2")]
+
+def test_usage_combines_partial_hours_and_rollups(service):
+    service.backfill_rollups()
+    track(service, EVENTS)
+    track(service, [(at(10, 20), "u9", "click", 1.0)], component="name")
+
+    usage = service.get_component_usage("address", at(9, 20), at(12, 30))
+
+    assert usage.total_actions == 5
+    assert usage.unique_users == 4
+    assert usage.average_duration == pytest.approx((2.0 + 4.0 + 6.0 + 8.0) / 4)
+    assert usage.error_rate == pytest.approx(2 / 5)
+
+def test_usage_matches_raw_aggregation(service):
+    service.backfill_rollups()
+    track(service, EVENTS)
+    session = service.Session()
+    try:
+        raw = service._aggregate_raw(session, "address", at(9, 20), at(12, 30))
+    finally:
+        session.close()
+
+    assert service.get_component_usage("address", at(9, 20), at(12, 30)) == raw
+
+def test_backfill_covers_events_written_before_rollups(service):
+    session = service.Session()
+    try:
+        session.execute(insert(AnalyticsEvent), [
+            {"timestamp": timestamp, "event_type": "user_action", "user_id": user_id,
+             "component": "address", "action": action,
+             "data": {"duration": duration} if duration is not None else None}
+            for timestamp, user_id, action, duration in EVENTS
+        ])
+        session.commit()
+    finally:
+        session.close()
+
+    # Before the backfill, usage comes from raw events
+    assert not service.rollups_ready()
+    assert service.get_component_usage("address", at(9, 20), at(12, 30)).total_actions == 5
+
+    service.backfill_rollups()
+    track(service, [(at(11, 30), "u6", "click", None)])
+
+    assert service.rollups_ready()
+    assert [(hour, total) for hour, total, *_ in rollups(service)] == [
+        (at(9), 2), (at(10), 2), (at(11), 2), (at(12), 2)
+    ]
+    assert service.get_component_usage("address", at(9, 20), at(12, 30)).total_actions == 6
+
+def test_rebuild_is_idempotent(service):
+    track(service, EVENTS)
+    before = rollups(service)
+
+    service.rebuild_rollups(at(9), at(12, 59))
+    service.rebuild_rollups(at(9), at(12, 59))
+
+    assert rollups(service) == before
+
+def test_export_ndjson(service):
+    track(service, EVENTS[:3])
+
+    lines = "".join(service.export_analytics(at(9), at(11), "ndjson", batch_size=2)).splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {"timestamp": "2025-03-10T09:10:00", "event_type": "user_action", "user_id": "u1",
+         "component": "address", "action": "click", "data": {"duration": 1.0}},
+        {"timestamp": "2025-03-10T09:30:00", "event_type": "user_action", "user_id": "u1",
+         "component": "address", "action": "click", "data": {"duration": 2.0}},
+        {"timestamp": "2025-03-10T10:15:00", "event_type": "user_action", "user_id": "u2",
+         "component": "address", "action": "error", "data": None},
+    ]
+
+def test_export_csv(service):
+    track(service, EVENTS[:3])
+
+    rows = list(csv.reader(io.StringIO("".join(service.export_analytics(at(9), at(11), "csv", batch_size=2)))))
+
+    assert rows == [
+        ["timestamp", "event_type", "user_id", "component", "action", "data"],
+        ["2025-03-10T09:10:00", "user_action", "u1", "address", "click", '{"duration": 1.0}'],
+        ["2025-03-10T09:30:00", "user_action", "u1", "address", "click", '{"duration": 2.0}'],
+        ["2025-03-10T10:15:00", "user_action", "u2", "address", "error", ""],
+    ]
+
+def test_export_json_is_one_array(service):
+    track(service, EVENTS[:3])
+
+    exported = json.loads("".join(service.export_analytics(at(9), at(11), "json", batch_size=2)))
+
+    assert [event["timestamp"] for event in exported] == [
+        "2025-03-10T09:10:00", "2025-03-10T09:30:00", "2025-03-10T10:15:00"
+    ]
+
+def test_export_rejects_unknown_format(service):
+    with pytest.raises(ValueError):
+        service.export_analytics(at(9), at(11), "xml")
@@ -0,0 +1,103 @@
+import pytest
+import asyncio
+from cache import cache_service
+from cache.cache_service import CacheService, cached
+
+fakeredis = pytest.importorskip("fakeredis")
+# Lock release runs a Lua script
+pytest.importorskip("lupa")
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+def make_cache(server, namespace="test"):
+    cache = CacheService(namespace)
+    cache.redis_client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    return cache
+
+@pytest.mark.asyncio
+async def test_batch_get_and_set(server):
+    cache = make_cache(server)
+    assert await cache.set_many({"a": 1, "b": {"x": 2}})
+
+    assert await cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": {"x": 2}}
+    assert await cache.get("b") == {"x": 2}
+
+@pytest.mark.asyncio
+async def test_clear_only_affects_its_namespace(server):
+    addresses = make_cache(server, "address")
+    names = make_cache(server, "name")
+    await addresses.set("1", {"city": "Camden"})
+    await names.set("1", {"last": "Smith"})
+
+    assert await addresses.clear()
+
+    assert await addresses.get("1") is None
+    assert await names.get("1") == {"last": "Smith"}
+    await addresses.set("1", {"city": "Trenton"})
+    assert await addresses.get("1") == {"city": "Trenton"}
+
+@pytest.mark.asyncio
+async def test_clear_reaches_other_instances(server):
+    writer = make_cache(server, "address")
+    reader = make_cache(server, "address")
+    reader.version_refresh = 0
+    await writer.set("1", {"city": "Camden"})
+    assert await reader.get("1") == {"city": "Camden"}
+
+    await writer.clear()
+
+    assert await reader.get("1") is None
+
+@pytest.mark.asyncio
+async def test_get_or_set_computes_once_across_instances(server):
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"value": calls}
+
+    # Two instances stand in for two worker processes
+    first, second = make_cache(server), make_cache(server)
+    results = await asyncio.gather(*(
+        cache.get_or_set("report", compute) for cache in [first, second] * 5
+    ))
+
+    assert calls == 1
+    assert all(result == {"value": 1} for result in results)
+
+@pytest.mark.asyncio
+async def test_cached_decorator_single_flight(server, monkeypatch):
+    monkeypatch.setitem(cache_service._decorator_caches, "lookups", make_cache(server, "lookups"))
+    calls = []
+
+    @cached(namespace="lookups")
+    async def lookup(item_id):
+        calls.append(item_id)
+        await asyncio.sleep(0.01)
+        return {"id": item_id}
+
+    results = await asyncio.gather(*(lookup(7) for _ in range(20)))
+
+    assert calls == [7]
+    assert results == [{"id": 7}] * 20
+    assert await lookup(7) == {"id": 7}
+    assert calls == [7]
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached(server):
+    cache = make_cache(server)
+
+    async def failing():
+        raise ValueError("upstream down")
+
+    with pytest.raises(ValueError):
+        await cache.get_or_set("key", failing)
+
+    async def working():
+        return 1
+
+    assert await cache.get_or_set("key", working) == 1
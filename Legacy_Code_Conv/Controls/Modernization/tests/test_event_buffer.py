@@ -0,0 +1,95 @@
+import pytest
+import threading
+import time
+from services.event_buffer import EventBuffer
+
+class RecordingWriter:
+    """Collects written batches"""
+    def __init__(self, fail_times: int = 0):
+        self.batches = []
+        self.fail_times = fail_times
+        self.lock = threading.Lock()
+
+    def __call__(self, batch):
+        with self.lock:
+            if self.fail_times:
+                self.fail_times -= 1
+                raise IOError("database unavailable")
+            self.batches.append(list(batch))
+
+    @property
+    def items(self):
+        return [item for batch in self.batches for item in batch]
+
+def test_flushes_full_batches():
+    writer = RecordingWriter()
+    buffer = EventBuffer(writer, batch_size=10, flush_interval=60)
+    buffer.start()
+
+    for i in range(25):
+        assert buffer.put({"i": i})
+    assert buffer.flush(timeout=5)
+    buffer.close()
+
+    assert [item["i"] for item in writer.items] == list(range(25))
+    assert max(len(batch) for batch in writer.batches) <= 10
+
+def test_flushes_partial_batch_after_interval():
+    writer = RecordingWriter()
+    buffer = EventBuffer(writer, batch_size=100, flush_interval=0.05)
+    buffer.start()
+
+    buffer.put({"i": 1})
+    deadline = time.monotonic() + 2
+    while not writer.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    buffer.close()
+
+    assert writer.batches == [[{"i": 1}]]
+
+@pytest.mark.parametrize("overflow,expected", [
+    ("drop_oldest", [2, 3, 4]),
+    ("drop_newest", [0, 1, 2]),
+    ("block", [0, 1, 2]),
+])
+def test_overflow_policies(overflow, expected):
+    writer = RecordingWriter()
+    buffer = EventBuffer(writer, max_size=3, batch_size=10, overflow=overflow, block_timeout=0.01)
+
+    for i in range(5):
+        buffer.put({"i": i})
+    buffer.close()
+
+    assert [item["i"] for item in writer.items] == expected
+    assert buffer.dropped == 2
+
+def test_close_drains_and_rejects_new_items():
+    writer = RecordingWriter()
+    buffer = EventBuffer(writer, batch_size=1000, flush_interval=60)
+    buffer.start()
+
+    for i in range(5):
+        buffer.put({"i": i})
+    buffer.close()
+
+    assert len(writer.items) == 5
+    assert not buffer.put({"i": 99})
+
+def test_retries_failed_writes():
+    writer = RecordingWriter(fail_times=1)
+    buffer = EventBuffer(writer, retry_attempts=1)
+
+    buffer.put({"i": 1})
+    buffer.close()
+
+    assert writer.items == [{"i": 1}]
+    assert buffer.failed == 0
+
+def test_put_is_cheap():
+    buffer = EventBuffer(lambda batch: None, max_size=100000, batch_size=100000)
+    start = time.perf_counter()
+    for i in range(10000):
+        buffer.put({"i": i})
+    per_put = (time.perf_counter() - start) / 10000
+
+    assert per_put < 50e-6
@@ -0,0 +1,120 @@
+import pytest
+import asyncio
+from services.address_normalizer import normalize_address
+from services.geocode_store import GeocodeStore
+from services.geocoding_service import GeocodingResult, GeocodingService
+from services.rate_limiter import RateLimiter
+
+class DictCache:
+    """In-memory stand-in for CacheService"""
+    def __init__(self):
+        self.values = {}
+
+    async def get_many(self, keys):
+        return {key: self.values[key] for key in keys if key in self.values}
+
+    async def set_many(self, items, ttl=None):
+        self.values.update(items)
+        return True
+
+class StubProvider:
+    """Geocodes every address except the ones listed as unknown"""
+    def __init__(self, unknown=()):
+        self.calls = []
+        self.unknown = set(unknown)
+
+    async def __call__(self, address):
+        self.calls.append(address)
+        await asyncio.sleep(0)
+        if address in self.unknown:
+            return None
+        return GeocodingResult(
+            formatted_address=address,
+            latitude=40.0 + len(self.calls),
+            longitude=-75.0,
+            confidence_score=0.9,
+            place_id=f"stub:{address}",
+            components={}
+        )
+
+@pytest.fixture
+def store(tmp_path):
+    # A file database, since lookups run in worker threads
+    return GeocodeStore(f"sqlite:///{tmp_path / 'geocodes.db'}")
+
+def make_service(provider, store, cache=None):
+    return GeocodingService(
+        providers=[("stub", provider)],
+        store=store,
+        cache=cache or DictCache(),
+        requests_per_second=1000
+    )
+
+@pytest.mark.parametrize("a,b", [
+    ("123 North Main Street, Apt. 4, Springfield, Illinois 62704-1234",
+     "123 N. Main St Apt 4 Springfield IL 62704"),
+    ("P.O. Box 12, Charleston, West Virginia 25301", "PO BOX 12 CHARLESTON WV 25301"),
+    ("500 Oak Avenue Suite 200, Raleigh, NC", "500 oak ave ste 200 raleigh nc"),
+])
+def test_normalization_merges_spellings(a, b):
+    assert normalize_address(a) == normalize_address(b)
+
+def test_normalization_keeps_zip5():
+    normalized = normalize_address("1 Elm Road, Dover, DE 19901-0001")
+    assert normalized.text == "1 ELM RD DOVER DE 19901"
+    assert normalized.zip5 == "19901"
+
+@pytest.mark.asyncio
+async def test_batch_calls_provider_once_per_normalized_address(store):
+    provider = StubProvider()
+    service = make_service(provider, store)
+
+    results = await service.geocode_batch([
+        "10 Market Street, Camden, NJ 08102",
+        "10 Market St., Camden, New Jersey 08102",
+        "20 Cooper Street, Camden, NJ 08102",
+    ])
+
+    assert len(provider.calls) == 2
+    assert results[0] == results[1]
+    assert results[2].place_id == "stub:20 COOPER ST CAMDEN NJ 08102"
+
+@pytest.mark.asyncio
+async def test_store_persists_across_service_instances(store):
+    first = StubProvider()
+    await make_service(first, store=store).geocode_batch(["10 Market St Camden NJ 08102"])
+
+    second = StubProvider()
+    result = await make_service(second, store=store).geocode_address("10 Market Street, Camden NJ 08102")
+
+    assert second.calls == []
+    assert result.place_id == "stub:10 MARKET ST CAMDEN NJ 08102"
+
+@pytest.mark.asyncio
+async def test_zip_centroid_fallback(store):
+    store.load_zip_centroids([("08102", 39.95, -75.12)])
+    provider = StubProvider(unknown={"999 NOWHERE LN CAMDEN NJ 08102"})
+    cache = DictCache()
+
+    result = await make_service(provider, store=store, cache=cache).geocode_address(
+        "999 Nowhere Lane, Camden, NJ 08102"
+    )
+
+    assert (result.latitude, result.longitude) == (39.95, -75.12)
+    assert result.place_id == "zip:08102"
+    assert cache.values == {}
+
+@pytest.mark.asyncio
+async def test_unplaceable_address_returns_none(store):
+    service = make_service(StubProvider(unknown={"NOWHERE"}), store)
+    assert await service.geocode_batch(["nowhere"]) == [None]
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_calls():
+    limiter = RateLimiter(rate=100, burst=1)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for _ in range(5):
+        await limiter.acquire()
+
+    assert loop.time() - start >= 0.035
@@ -0,0 +1,138 @@
+import pytest
+import json
+import pandas as pd
+from sqlalchemy import create_engine, text
+from migration.migration_manager import BULK_COPY_PLAN, MigrationConfig, MigrationManager, TargetTable
+
+PROVIDERS = BULK_COPY_PLAN[0][0]
+
+SOURCE_SCHEMA = [
+    "CREATE TABLE providers (id INTEGER PRIMARY KEY, status TEXT, created_at TEXT, updated_at TEXT)",
+    "CREATE TABLE provider_names (provider_id INTEGER, first_name TEXT, last_name TEXT, credentials TEXT)",
+]
+
+TARGET_SCHEMA = [
+    "CREATE TABLE providers (id INTEGER PRIMARY KEY, status TEXT, created_at TEXT, updated_at TEXT)",
+    "CREATE TABLE provider_names (provider_id INTEGER, name_type TEXT, first_name TEXT, "
+    "last_name TEXT, credentials TEXT)",
+    "CREATE TABLE audit_logs (id INTEGER PRIMARY KEY, event_type TEXT, user_id INTEGER, "
+    "details TEXT, created_at TEXT)",
+]
+
+def make_manager(tmp_path, batch_size=2):
+    config = MigrationConfig(
+        source_db_url=f"sqlite:///{tmp_path / 'source.db'}",
+        target_db_url=f"sqlite:///{tmp_path / 'target.db'}",
+        backup_dir=str(tmp_path / "backup"),
+        batch_size=batch_size,
+        bulk_mode=True
+    )
+    manager = MigrationManager(config)
+    manager.stats = {
+        "total_records": 0,
+        "migrated_records": 0,
+        "failed_records": 0,
+        "errors": [],
+        "throughput": {}
+    }
+    for engine, schema in ((manager.source_engine, SOURCE_SCHEMA), (manager.target_engine, TARGET_SCHEMA)):
+        with engine.begin() as connection:
+            for statement in schema:
+                connection.execute(text(statement))
+    return manager
+
+def seed_providers(manager, count=5):
+    """Providers 1..count; provider 2 has two names, provider 4 has none"""
+    with manager.source_engine.begin() as connection:
+        connection.execute(
+            text("INSERT INTO providers VALUES (:id, 'active', '2024-01-01', '2024-01-02')"),
+            [{"id": i} for i in range(1, count + 1)]
+        )
+        names = [{"id": i, "first": f"First{i}"} for i in range(1, count + 1) if i != 4]
+        names.append({"id": 2, "first": "Alias2"})
+        connection.execute(
+            text("INSERT INTO provider_names VALUES (:id, :first, 'Last', 'MD')"),
+            names
+        )
+
+def rows(manager, query):
+    with manager.target_engine.connect() as connection:
+        return [tuple(row) for row in connection.execute(text(query))]
+
+def test_copy_table_pages_and_splits_providers(tmp_path):
+    manager = make_manager(tmp_path, batch_size=2)
+    seed_providers(manager)
+
+    manager._copy_table(PROVIDERS)
+
+    assert rows(manager, "SELECT id FROM providers ORDER BY id") == [(1,), (2,), (3,), (4,), (5,)]
+    assert rows(manager, "SELECT provider_id, first_name FROM provider_names ORDER BY provider_id, first_name") == [
+        (1, "First1"), (2, "Alias2"), (2, "First2"), (3, "First3"), (5, "First5")
+    ]
+    assert rows(manager, "SELECT DISTINCT name_type FROM provider_names") == [("legal",)]
+    assert manager.stats["total_records"] == 5
+    assert manager.stats["migrated_records"] == 5
+    assert manager.stats["failed_records"] == 0
+
+def test_page_boundary_keeps_all_names(tmp_path):
+    # Provider 2's two names must not be split across pages
+    manager = make_manager(tmp_path, batch_size=1)
+    seed_providers(manager, count=3)
+
+    manager._copy_table(PROVIDERS)
+
+    assert rows(manager, "SELECT COUNT(*) FROM providers") == [(3,)]
+    assert rows(manager, "SELECT COUNT(*) FROM provider_names WHERE provider_id = 2") == [(2,)]
+
+def test_failed_batch_falls_back_to_entities(tmp_path):
+    manager = make_manager(tmp_path, batch_size=5)
+    seed_providers(manager)
+    with manager.target_engine.begin() as connection:
+        connection.execute(text("INSERT INTO providers VALUES (3, 'existing', NULL, NULL)"))
+
+    manager._copy_table(PROVIDERS)
+
+    assert rows(manager, "SELECT id, status FROM providers ORDER BY id") == [
+        (1, "active"), (2, "active"), (3, "existing"), (4, "active"), (5, "active")
+    ]
+    # The failed entity's names are rolled back with it
+    assert rows(manager, "SELECT DISTINCT provider_id FROM provider_names ORDER BY provider_id") == [
+        (1,), (2,), (5,)
+    ]
+    assert manager.stats["migrated_records"] == 4
+    assert manager.stats["failed_records"] == 1
+    assert manager.stats["errors"][0].startswith("providers 3:")
+
+def test_bulk_insert_encodes_json_and_nulls(tmp_path):
+    manager = make_manager(tmp_path)
+    target = TargetTable("audit_logs", ["id", "event_type", "user_id", "details", "created_at"], lambda df: df)
+    frame = pd.DataFrame({
+        "id": [1, 2, 3],
+        "event_type": ["login", "export", None],
+        "user_id": pd.array([7, None, 9], dtype="Int64"),
+        "details": [{"ip": "10.0.0.1"}, ["a", "b"], None],
+        "created_at": ["2024-01-01", None, "2024-01-03"],
+    })
+
+    with manager.target_engine.begin() as connection:
+        manager._bulk_insert(connection, target, frame)
+
+    stored = rows(manager, "SELECT id, event_type, user_id, details, created_at FROM audit_logs ORDER BY id")
+    assert stored == [
+        (1, "login", 7, json.dumps({"ip": "10.0.0.1"}), "2024-01-01"),
+        (2, "export", None, json.dumps(["a", "b"]), None),
+        (3, None, 9, None, "2024-01-03"),
+    ]
+
+@pytest.mark.asyncio
+async def test_run_bulk_copy_dry_run_writes_nothing(tmp_path, monkeypatch):
+    manager = make_manager(tmp_path)
+    manager.config.dry_run = True
+    seed_providers(manager)
+    monkeypatch.setattr("migration.migration_manager.BULK_COPY_PLAN", [[PROVIDERS]])
+
+    await manager.run_bulk_copy()
+
+    assert rows(manager, "SELECT COUNT(*) FROM providers") == [(0,)]
+    assert manager.stats["migrated_records"] == 5
+    assert "providers" in manager.stats["throughput"]
@@ -0,0 +1,74 @@
+import pytest
+import asyncio
+from integration.report_cache import ReportSnapshotCache
+
+class CountingSource:
+    """Async report builder that counts calls"""
+    def __init__(self, delay: float = 0.01):
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"version": self.calls}
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_computation():
+    cache = ReportSnapshotCache(ttl=60)
+    source = CountingSource()
+
+    results = await asyncio.gather(*[cache.get("financial", source) for _ in range(10)])
+
+    assert source.calls == 1
+    assert all(result == {"version": 1} for result in results)
+    assert await cache.get("financial", source) == {"version": 1}
+    assert cache.hits == 1
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_served_while_refreshing():
+    cache = ReportSnapshotCache(ttl=0.05, stale_ttl=1)
+    source = CountingSource()
+
+    await cache.get("dashboard", source)
+    await asyncio.sleep(0.06)
+
+    assert await cache.get("dashboard", source) == {"version": 1}
+    await asyncio.sleep(0.05)
+    assert await cache.get("dashboard", source) == {"version": 2}
+    assert cache.stale_hits == 1
+
+@pytest.mark.asyncio
+async def test_expired_snapshot_is_recomputed():
+    cache = ReportSnapshotCache(ttl=0.01, stale_ttl=0.01)
+    source = CountingSource()
+
+    await cache.get("clinical", source)
+    await asyncio.sleep(0.03)
+
+    assert await cache.get("clinical", source) == {"version": 2}
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached():
+    cache = ReportSnapshotCache(ttl=60)
+
+    async def failing():
+        raise ValueError("source unavailable")
+
+    with pytest.raises(ValueError):
+        await cache.get("compliance", failing)
+
+    source = CountingSource()
+    assert await cache.get("compliance", source) == {"version": 1}
+
+@pytest.mark.asyncio
+async def test_keep_fresh_precomputes_snapshot():
+    cache = ReportSnapshotCache(ttl=60)
+    source = CountingSource(delay=0)
+
+    cache.keep_fresh("dashboard", source, interval=0.01)
+    await asyncio.sleep(0.05)
+    await cache.close()
+
+    assert source.calls >= 2
+    assert await cache.get("dashboard", source) == {"version": source.calls}
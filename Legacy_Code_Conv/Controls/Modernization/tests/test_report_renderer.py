@@ -0,0 +1,98 @@
+import pytest
+import asyncio
+from integration.report_renderer import (
+    ChartCache,
+    ChartSpec,
+    JobStatus,
+    QueueFullError,
+    ReportRenderer
+)
+
+def revenue_chart(values):
+    return ChartSpec(
+        name="revenue_trend",
+        title="Daily Revenue Trend",
+        x_label="Date",
+        y_label="Revenue",
+        x=["2025-01-01", "2025-01-02"],
+        y=values
+    )
+
+def test_chart_digest_tracks_data():
+    assert revenue_chart([1, 2]).digest() == revenue_chart([1, 2]).digest()
+    assert revenue_chart([1, 2]).digest() != revenue_chart([1, 3]).digest()
+
+def test_chart_cache_evicts_least_recently_used():
+    cache = ChartCache(max_entries=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.get("a")
+    cache.set("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+
+@pytest.mark.asyncio
+async def test_cached_charts_skip_rendering():
+    renderer = ReportRenderer()
+    spec = revenue_chart([1, 2])
+    renderer.chart_cache.set(spec.digest(), "cached-image")
+
+    charts = await renderer.render_charts([spec])
+
+    assert charts == {"revenue_trend": "cached-image"}
+    assert renderer._executor is None
+    await renderer.close()
+
+@pytest.mark.asyncio
+async def test_run_uses_process_pool():
+    renderer = ReportRenderer(max_workers=1)
+    assert await renderer.run(sum, [1, 2, 3]) == 6
+    await renderer.close()
+
+@pytest.mark.asyncio
+async def test_jobs_report_ready_and_failed():
+    renderer = ReportRenderer()
+
+    async def build():
+        return b"report"
+
+    async def broken():
+        raise ValueError("source unavailable")
+
+    ready_id = renderer.submit(build, metadata={"format": "csv"})
+    failed_id = renderer.submit(broken)
+    assert renderer.get_job(ready_id).status == JobStatus.QUEUED
+
+    for _ in range(100):
+        if all(renderer.get_job(job_id).finished_at for job_id in (ready_id, failed_id)):
+            break
+        await asyncio.sleep(0.01)
+
+    ready = renderer.get_job(ready_id)
+    assert ready.status == JobStatus.READY
+    assert ready.result == b"report"
+    assert ready.metadata == {"format": "csv"}
+
+    failed = renderer.get_job(failed_id)
+    assert failed.status == JobStatus.FAILED
+    assert failed.error == "source unavailable"
+    await renderer.close()
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded():
+    renderer = ReportRenderer(max_queued_jobs=1)
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+
+    renderer.submit(slow)
+    await asyncio.sleep(0)
+    renderer.submit(slow)
+    with pytest.raises(QueueFullError):
+        renderer.submit(slow)
+
+    release.set()
+    await renderer.close()
@@ -0,0 +1,52 @@
+import pytest
+import asyncio
+from cache.single_flight import SingleFlight
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_computation():
+    flights = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    results = await asyncio.gather(*[flights.run("key", compute) for _ in range(5)])
+
+    assert results == [1] * 5
+    assert "key" not in flights
+    assert await flights.run("key", compute) == 2
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_waiter():
+    flights = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*[flights.run("key", compute) for _ in range(3)], return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert "key" not in flights
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_computation_running():
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def compute():
+        await release.wait()
+        return "done"
+
+    owner = asyncio.create_task(flights.run("key", compute))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(flights.run("key", compute))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    release.set()
+
+    assert await owner == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
@@ -0,0 +1,76 @@
+import pytest
+import random
+from services.route_planner import nearest_neighbor_order, plan_route, route_distance, two_opt
+from services.spatial_index import GridIndex, haversine_distances, haversine_matrix
+
+def random_points(n, seed=7):
+    rng = random.Random(seed)
+    return [(i, rng.uniform(39.5, 40.5), rng.uniform(-75.8, -74.8)) for i in range(n)]
+
+def test_haversine_known_distance():
+    # Philadelphia City Hall to the Empire State Building is about 83 miles
+    miles = haversine_distances((39.9526, -75.1652), [(40.7484, -73.9857)])[0]
+    assert miles == pytest.approx(83, abs=1)
+
+def test_matrix_is_symmetric_with_zero_diagonal():
+    points = [(lat, lon) for _, lat, lon in random_points(20)]
+    matrix = haversine_matrix(points)
+
+    assert matrix.shape == (20, 20)
+    assert (matrix.diagonal() == 0).all()
+    assert (abs(matrix - matrix.T) < 1e-9).all()
+
+@pytest.mark.parametrize("radius", [1, 5, 12, 40])
+def test_within_matches_brute_force(radius):
+    points = random_points(2000)
+    index = GridIndex(cell_size_miles=2)
+    index.add_many(points)
+    center = (40.0, -75.3)
+
+    distances = haversine_distances(center, [(lat, lon) for _, lat, lon in points])
+    expected = {points[i][0] for i, d in enumerate(distances) if d <= radius}
+    found = index.within(*center, radius)
+
+    assert {n.item_id for n in found} == expected
+    assert [n.distance_miles for n in found] == sorted(n.distance_miles for n in found)
+
+def test_nearest_and_kind_filter():
+    index = GridIndex(cell_size_miles=1)
+    index.add("warehouse", 40.0, -75.0, kind="warehouse")
+    index.add("near", 40.01, -75.0, kind="patient")
+    index.add("far", 41.0, -75.0, kind="patient")
+
+    assert [n.item_id for n in index.nearest(40.0, -75.0, k=2, kind="patient")] == ["near", "far"]
+    assert [n.item_id for n in index.nearest(40.0, -75.0)] == ["warehouse"]
+
+def test_readd_moves_and_remove_forgets():
+    index = GridIndex()
+    index.add("p1", 40.0, -75.0)
+    index.add("p1", 35.0, -80.0)
+
+    assert len(index) == 1
+    assert index.within(40.0, -75.0, 10) == []
+    assert index.remove("p1")
+    assert index.within(35.0, -80.0, 10) == []
+
+def test_two_opt_never_lengthens_route():
+    points = [(lat, lon) for _, lat, lon in random_points(200)]
+    greedy = nearest_neighbor_order(points)
+    improved = two_opt(points, greedy)
+
+    assert improved[0] == 0
+    assert sorted(improved) == list(range(200))
+    assert route_distance([points[i] for i in improved]) < route_distance([points[i] for i in greedy])
+
+def test_two_opt_untangles_crossing():
+    # Visiting the corners of a square diagonally crosses itself
+    points = [(0.0, 0.0), (0.0, 1.0), (1.0, 0.0), (1.0, 1.0)]
+    assert two_opt(points, [0, 1, 2, 3], closed=True) == [0, 1, 3, 2]
+
+def test_plan_route_visits_every_stop():
+    stops = random_points(50)
+    plan = plan_route((40.0, -75.3), stops, return_to_depot=True)
+
+    assert sorted(plan.stop_ids) == [stop_id for stop_id, _, _ in stops]
+    assert plan.distance_miles > 0
+    assert plan_route((40.0, -75.3), []).stop_ids == []
@@ -1,10 +1,12 @@
 """
 Price calculation module using modern calculation engine.
 """
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple, Iterable
+from bisect import bisect_right
 from decimal import Decimal
 from datetime import datetime
-from pydantic import BaseModel, validator
+import time
+from pydantic import BaseModel, Field, validator
 from fastapi import HTTPException
 from ...repositories.price_repository import PriceRepository
 from ...repositories.models import PriceList, PriceListItem
@@ -42,18 +44,86 @@ class PriceCalculation(BaseModel):
     original_price: Decimal
     quantity: int
     subtotal: Decimal
-    discounts: List[Dict[str, Decimal]]
+    discounts: List[Dict[str, Any]]
     total_discount: Decimal
     final_price: Decimal
     unit_price: Decimal
     effective_discount_percentage: Decimal
 
+class PriceLine(BaseModel):
+    """Order line to price."""
+    item_code: str
+    quantity: int = Field(..., gt=0)
+
+class QuantityBreakTable:
+    """Quantity breaks of one item, sorted by minimum quantity."""
+
+    def __init__(self, breaks: Iterable):
+        # Reversed first so equal minimums are scanned in their original order
+        ordered = sorted(reversed(list(breaks)), key=lambda x: x.min_quantity)
+        self.min_quantities = [break_.min_quantity for break_ in ordered]
+        self.max_quantities = [break_.max_quantity for break_ in ordered]
+        self.amounts = [break_.discount_amount for break_ in ordered]
+
+    def discount_for(self, quantity: int) -> Decimal:
+        """Discount of the highest break the quantity qualifies for."""
+        index = bisect_right(self.min_quantities, quantity)
+        while index > 0:
+            index -= 1
+            maximum = self.max_quantities[index]
+            if not maximum or quantity <= maximum:
+                return self.amounts[index]
+        return Decimal('0')
+
+class QuantityBreakCache:
+    """Per-price-list cache of quantity break tables by item id.
+
+    Entries expire after ttl seconds so changes made by other processes
+    are picked up; call invalidate after changing breaks in this one.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._tables: Dict[int, Tuple[float, Dict[int, QuantityBreakTable]]] = {}
+
+    def get(self, price_list_id: int) -> Dict[int, QuantityBreakTable]:
+        """Cached tables for a price list (empty when expired)."""
+        entry = self._tables.get(price_list_id)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            entry = (time.monotonic(), {})
+            self._tables[price_list_id] = entry
+        return entry[1]
+
+    def invalidate(self, price_list_id: Optional[int] = None):
+        """Drop cached tables for one price list, or for all of them."""
+        if price_list_id is None:
+            self._tables.clear()
+        else:
+            self._tables.pop(price_list_id, None)
+
+# Shared by every calculator in this process
+quantity_break_cache = QuantityBreakCache()
+
 class PriceCalculator:
     """Handle price calculations with discounts and quantity breaks."""
     
-    def __init__(self, database: Database):
+    def __init__(self, database: Database, break_cache: Optional[QuantityBreakCache] = None):
         self.database = database
         self.price_repository = PriceRepository(database)
+        self.break_cache = break_cache or quantity_break_cache
+
+    def validate_quantity(self, item: PriceListItem, quantity: int):
+        """Check quantity against the item's limits."""
+        if quantity < item.minimum_quantity:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Minimum quantity is {item.minimum_quantity}"
+            )
+        if item.maximum_quantity and quantity > item.maximum_quantity:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Maximum quantity is {item.maximum_quantity}"
+            )
 
     async def get_base_price(
         self,
@@ -74,16 +144,7 @@ class PriceCalculator:
             )
 
         # Validate quantity
-        if quantity < item.minimum_quantity:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Minimum quantity is {item.minimum_quantity}"
-            )
-        if item.maximum_quantity and quantity > item.maximum_quantity:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Maximum quantity is {item.maximum_quantity}"
-            )
+        self.validate_quantity(item, quantity)
 
         return item
 
@@ -93,19 +154,28 @@ class PriceCalculator:
         quantity: int
     ) -> Decimal:
         """Apply quantity break discounts."""
-        # Get quantity breaks for item
-        quantity_breaks = await self.price_repository.get_quantity_breaks(item.id)
-        
-        # Sort by minimum quantity descending
-        quantity_breaks.sort(key=lambda x: x.min_quantity, reverse=True)
-        
-        # Find applicable quantity break
-        for break_ in quantity_breaks:
-            if quantity >= break_.min_quantity:
-                if not break_.max_quantity or quantity <= break_.max_quantity:
-                    return break_.discount_amount
-                
-        return Decimal('0')
+        tables = self.break_cache.get(item.price_list_id)
+        if item.id not in tables:
+            quantity_breaks = await self.price_repository.get_quantity_breaks(item.id)
+            tables[item.id] = QuantityBreakTable(quantity_breaks)
+        return tables[item.id].discount_for(quantity)
+
+    async def get_break_tables(
+        self,
+        price_list_id: int,
+        item_ids: List[int]
+    ) -> Dict[int, QuantityBreakTable]:
+        """Get quantity break tables, loading uncached items in one query."""
+        tables = self.break_cache.get(price_list_id)
+        missing = [item_id for item_id in set(item_ids) if item_id not in tables]
+        if missing:
+            grouped = {item_id: [] for item_id in missing}
+            breaks = await self.price_repository.get_quantity_breaks_for_items(missing)
+            for break_ in breaks:
+                grouped[break_.item_id].append(break_)
+            for item_id, item_breaks in grouped.items():
+                tables[item_id] = QuantityBreakTable(item_breaks)
+        return {item_id: tables[item_id] for item_id in item_ids}
 
     async def apply_customer_discounts(
         self,
@@ -155,8 +225,80 @@ class PriceCalculator:
         customer_type: Optional[str] = None
     ) -> PriceCalculation:
         """Calculate final price with all applicable discounts."""
-        # Get base price
         item = await self.get_base_price(price_list_id, item_code, quantity)
+        quantity_discount = await self.apply_quantity_breaks(item, quantity)
+        customer_discounts = []
+        if customer_type:
+            customer_discounts = await self.apply_customer_discounts(
+                price_list_id,
+                customer_type
+            )
+        return self.build_calculation(
+            item,
+            quantity,
+            quantity_discount,
+            customer_discounts
+        )
+
+    async def calculate_prices(
+        self,
+        price_list_id: int,
+        lines: List[PriceLine],
+        customer_type: Optional[str] = None
+    ) -> List[PriceCalculation]:
+        """Calculate every line of an order.
+
+        Items, quantity breaks and customer discounts are each loaded with
+        one query for the whole order; quantity breaks come from the cache
+        when present.
+        """
+        # Get base prices
+        codes = list({line.item_code for line in lines})
+        items = {
+            item.item_code: item
+            for item in await self.price_repository.get_items_by_codes(
+                price_list_id,
+                codes
+            )
+        }
+        missing = [code for code in codes if code not in items]
+        if missing:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Price list items not found: {', '.join(sorted(missing))}"
+            )
+        for line in lines:
+            self.validate_quantity(items[line.item_code], line.quantity)
+
+        tables = await self.get_break_tables(
+            price_list_id,
+            [item.id for item in items.values()]
+        )
+        customer_discounts = []
+        if customer_type:
+            customer_discounts = await self.apply_customer_discounts(
+                price_list_id,
+                customer_type
+            )
+
+        return [
+            self.build_calculation(
+                items[line.item_code],
+                line.quantity,
+                tables[items[line.item_code].id].discount_for(line.quantity),
+                customer_discounts
+            )
+            for line in lines
+        ]
+
+    def build_calculation(
+        self,
+        item: PriceListItem,
+        quantity: int,
+        quantity_discount: Decimal,
+        customer_discounts: List[DiscountRule]
+    ) -> PriceCalculation:
+        """Apply discounts to one line."""
         base_price = item.unit_price
         subtotal = base_price * quantity
 
@@ -165,7 +307,6 @@ class PriceCalculator:
         total_discount = Decimal('0')
 
         # Apply quantity breaks
-        quantity_discount = await self.apply_quantity_breaks(item, quantity)
         if quantity_discount > 0:
             discounts.append({
                 'type': 'quantity_break',
@@ -174,23 +315,18 @@ class PriceCalculator:
             total_discount += quantity_discount
 
         # Apply customer discounts
-        if customer_type:
-            customer_discounts = await self.apply_customer_discounts(
-                price_list_id,
-                customer_type
+        for discount in customer_discounts:
+            amount = self.calculate_discount_amount(
+                base_price,
+                quantity,
+                discount
             )
-            for discount in customer_discounts:
-                amount = self.calculate_discount_amount(
-                    base_price,
-                    quantity,
-                    discount
-                )
-                if amount > 0:
-                    discounts.append({
-                        'type': discount.type,
-                        'amount': amount
-                    })
-                    total_discount += amount
+            if amount > 0:
+                discounts.append({
+                    'type': discount.type,
+                    'amount': amount
+                })
+                total_discount += amount
 
         # Calculate final prices
         final_total = subtotal - total_discount
@@ -6,7 +6,7 @@ from fastapi.responses import JSONResponse
 from typing import Optional, List
 from decimal import Decimal
 from datetime import datetime
-from .price_calculator import PriceCalculator, PriceCalculation
+from .price_calculator import PriceCalculator, PriceCalculation, PriceLine
 from ...auth.login_form import LoginManager
 from ...core.database import get_database
 
@@ -41,6 +41,22 @@ async def calculate_price(
     
     return calculation
 
+@router.post("/calculate/{price_list_id}")
+async def calculate_prices(
+    price_list_id: int,
+    lines: List[PriceLine],
+    customer_type: Optional[str] = None,
+    current_user = Depends(LoginManager.check_active_user),
+    db = Depends(get_database)
+) -> List[PriceCalculation]:
+    """Quote every line of an order in one request."""
+    calculator = PriceCalculator(db)
+    return await calculator.calculate_prices(
+        price_list_id,
+        lines,
+        customer_type
+    )
+
 @router.get("/history/{price_list_id}/{item_code}")
 async def get_price_history(
     price_list_id: int,
@@ -78,13 +94,15 @@ async def add_quantity_break(
     item = await calculator.get_base_price(price_list_id, item_code, min_quantity)
     
     # Add quantity break
-    return await calculator.price_repository.create_quantity_break(
+    quantity_break = await calculator.price_repository.create_quantity_break(
         item_id=item.id,
         min_quantity=min_quantity,
         max_quantity=max_quantity,
         discount_amount=discount_amount,
         created_by=current_user.username
     )
+    calculator.break_cache.invalidate(price_list_id)
+    return quantity_break
 
 @router.post("/customer-discounts/{price_list_id}")
 async def add_customer_discount(
@@ -6,6 +6,7 @@ from decimal import Decimal
 from datetime import date
 from pydantic import BaseModel, validator, Field
 from fastapi import Form, HTTPException, Depends
+from sqlalchemy import text
 from ...repositories.price_repository import PriceRepository
 from ...repositories.models import PriceList, PriceListItem
 
@@ -115,6 +116,92 @@ class BulkPriceUpdateForm(BaseModel):
             raise ValueError('Fixed adjustment must be positive')
         return v
 
+class AdjustedPrice(BaseModel):
+    """Price list item after a bulk adjustment."""
+    item_id: int
+    item_code: str
+    previous_price: Decimal
+    unit_price: Decimal
+
+# New price for a row of price_list_items under the requested adjustment,
+# rounded to cents so validation sees the price that will be stored
+ADJUSTED_PRICE = """
+    round(
+        CASE WHEN :adjustment_type = 'percentage'
+             THEN {price} + {price} * CAST(:adjustment_value AS numeric) / 100
+             ELSE {price} + CAST(:adjustment_value AS numeric)
+        END,
+        2
+    )
+"""
+
+# Locks the affected items and checks every resulting price at once
+VALIDATE_ADJUSTMENT = text(f"""
+    SELECT count(*) AS matched,
+           coalesce(
+               array_agg(item_code ORDER BY item_code)
+                   FILTER (WHERE new_price <= 0),
+               '{{}}'
+           ) AS invalid_codes
+    FROM (
+        SELECT item_code,
+               {ADJUSTED_PRICE.format(price="unit_price")} AS new_price
+        FROM price_list_items
+        WHERE price_list_id = :price_list_id
+          AND item_code = ANY(CAST(:item_codes AS text[]))
+        FOR UPDATE
+    ) adjusted
+""")
+
+# Updates every item and records its price change in one statement
+APPLY_ADJUSTMENT = text(f"""
+    WITH previous AS (
+        SELECT id, unit_price
+        FROM price_list_items
+        WHERE price_list_id = :price_list_id
+          AND item_code = ANY(CAST(:item_codes AS text[]))
+    ),
+    updated AS (
+        UPDATE price_list_items AS item
+        SET unit_price = {ADJUSTED_PRICE.format(price="previous.unit_price")},
+            updated_by = :updated_by,
+            updated_at = now()
+        FROM previous
+        WHERE item.id = previous.id
+        RETURNING item.id AS item_id,
+                  item.price_list_id,
+                  item.item_code,
+                  previous.unit_price AS previous_price,
+                  item.unit_price
+    ),
+    history AS (
+        INSERT INTO price_list_item_history (
+            price_list_item_id,
+            price_list_id,
+            item_code,
+            previous_price,
+            new_price,
+            adjustment_type,
+            adjustment_value,
+            changed_by,
+            changed_at
+        )
+        SELECT item_id,
+               price_list_id,
+               item_code,
+               previous_price,
+               unit_price,
+               :adjustment_type,
+               CAST(:adjustment_value AS numeric),
+               :updated_by,
+               now()
+        FROM updated
+    )
+    SELECT item_id, item_code, previous_price, unit_price
+    FROM updated
+    ORDER BY item_code
+""")
+
 class PriceManager:
     """Handle price management operations."""
     
@@ -255,38 +342,47 @@ class PriceManager:
         self,
         form_data: BulkPriceUpdateForm,
         updated_by: str
-    ) -> List[PriceListItem]:
-        """Bulk update prices in a price list."""
+    ) -> List[AdjustedPrice]:
+        """Bulk update prices in a price list.
+
+        All items are adjusted in one transaction: the resulting prices are
+        validated together, then updated and written to price history with
+        one statement. Item codes not in the price list are skipped.
+        """
         # Check if price list exists
         price_list = await self.price_repository.get_price_list(form_data.price_list_id)
         if not price_list:
             raise HTTPException(status_code=404, detail="Price list not found")
 
-        updated_items = []
-        for item_code, new_price in form_data.items.items():
-            item = await self.price_repository.get_item_by_code(
-                form_data.price_list_id,
-                item_code
-            )
-            if item:
-                # Calculate new price based on adjustment type
-                if form_data.adjustment_type == 'percentage':
-                    adjustment = (item.unit_price * form_data.adjustment_value) / 100
-                else:
-                    adjustment = form_data.adjustment_value
-
-                new_price = item.unit_price + adjustment
-                if new_price <= 0:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Adjustment would result in zero or negative price for item {item_code}"
-                    )
+        item_codes = sorted({code for entry in form_data.items for code in entry})
+        if not item_codes:
+            return []
 
-                updated_item = await self.price_repository.update_price_list_item(
-                    item_id=item.id,
-                    unit_price=new_price,
-                    updated_by=updated_by
+        params = {
+            'price_list_id': form_data.price_list_id,
+            'item_codes': item_codes,
+            'adjustment_type': form_data.adjustment_type,
+            'adjustment_value': form_data.adjustment_value,
+            'updated_by': updated_by
+        }
+        # One transaction: rolled back if validation or the update fails
+        async with self.database.session() as session, session.begin():
+            # Validate every resulting price before changing any
+            check = (await session.execute(VALIDATE_ADJUSTMENT, params)).one()
+            if check.invalid_codes:
+                shown = ', '.join(check.invalid_codes[:20])
+                more = len(check.invalid_codes) - 20
+                raise HTTPException(
+                    status_code=400,
+                    detail=(
+                        f"Adjustment would result in zero or negative price for items {shown}"
+                        + (f" and {more} more" if more > 0 else "")
+                    )
                 )
-                updated_items.append(updated_item)
+            if not check.matched:
+                return []
+
+            result = await session.execute(APPLY_ADJUSTMENT, params)
+            updated_items = [AdjustedPrice(**row) for row in result.mappings()]
 
         return updated_items
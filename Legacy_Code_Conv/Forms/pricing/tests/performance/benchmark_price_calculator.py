@@ -0,0 +1,168 @@
+"""
+Benchmark for order-level price calculation.
+
+Prices a 40-line order against an in-memory repository that sleeps for a
+fixed latency on every query, comparing one calculate_price call per line
+with a single calculate_prices call. Run directly for a table:
+
+    python -m pricing.tests.performance.benchmark_price_calculator
+"""
+import asyncio
+import random
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+
+from ...calculations.price_calculator import (
+    PriceCalculator,
+    PriceLine,
+    QuantityBreakCache
+)
+
+PRICE_LIST_ID = 1
+ORDER_LINES = 40
+
+class Discount(SimpleNamespace):
+    """Customer discount row."""
+    def dict(self):
+        return dict(self.__dict__)
+
+class FakePriceRepository:
+    """In-memory price repository that counts queries."""
+
+    def __init__(self, latency: float = 0.001, items: int = 200, seed: int = 1):
+        rng = random.Random(seed)
+        self.latency = latency
+        self.queries = 0
+        self.items = {
+            f"I{i}": SimpleNamespace(
+                id=i,
+                price_list_id=PRICE_LIST_ID,
+                item_code=f"I{i}",
+                unit_price=Decimal(rng.randint(100, 9999)) / 100,
+                minimum_quantity=1,
+                maximum_quantity=None
+            )
+            for i in range(items)
+        }
+        self.breaks = [
+            SimpleNamespace(
+                item_id=i,
+                min_quantity=minimum,
+                max_quantity=minimum * 3 if rng.random() < 0.3 else None,
+                discount_amount=Decimal(minimum) / 10
+            )
+            for i in range(items)
+            for minimum in rng.sample(range(2, 60), 5)
+        ]
+        self.discounts = [
+            Discount(type='percentage', value=Decimal('5'), min_quantity=None,
+                     max_quantity=None, start_date=None, end_date=None,
+                     customer_type='gold'),
+            Discount(type='quantity_break', value=Decimal('0.5'), min_quantity=10,
+                     max_quantity=None, start_date=None, end_date=None,
+                     customer_type='gold')
+        ]
+
+    async def _query(self):
+        self.queries += 1
+        await asyncio.sleep(self.latency)
+
+    async def get_item_by_code(self, price_list_id, item_code):
+        await self._query()
+        return self.items.get(item_code)
+
+    async def get_items_by_codes(self, price_list_id, item_codes):
+        await self._query()
+        return [self.items[code] for code in item_codes if code in self.items]
+
+    async def get_quantity_breaks(self, item_id):
+        await self._query()
+        return [break_ for break_ in self.breaks if break_.item_id == item_id]
+
+    async def get_quantity_breaks_for_items(self, item_ids):
+        await self._query()
+        wanted = set(item_ids)
+        return [break_ for break_ in self.breaks if break_.item_id in wanted]
+
+    async def get_customer_discounts(self, price_list_id, customer_type):
+        await self._query()
+        return self.discounts
+
+def make_calculator(repository: FakePriceRepository) -> PriceCalculator:
+    """Calculator with its own cache, reading from the fake repository."""
+    calculator = PriceCalculator(None, break_cache=QuantityBreakCache())
+    calculator.price_repository = repository
+    return calculator
+
+def sample_order(lines: int = ORDER_LINES, seed: int = 2) -> List[PriceLine]:
+    """Order lines with random items and quantities."""
+    rng = random.Random(seed)
+    return [
+        PriceLine(item_code=f"I{rng.randrange(200)}", quantity=rng.randint(1, 100))
+        for _ in range(lines)
+    ]
+
+async def price_per_line(calculator: PriceCalculator, lines: List[PriceLine]):
+    return [
+        await calculator.calculate_price(PRICE_LIST_ID, line.item_code, line.quantity, 'gold')
+        for line in lines
+    ]
+
+async def measure(latency: float = 0.001) -> Dict[str, Dict[str, float]]:
+    """Queries and milliseconds for each way of pricing the order."""
+    lines = sample_order()
+    results = {}
+
+    repository = FakePriceRepository(latency)
+    calculator = make_calculator(repository)
+    start = time.perf_counter()
+    await price_per_line(calculator, lines)
+    results["per line"] = {
+        "queries": repository.queries,
+        "ms": (time.perf_counter() - start) * 1000
+    }
+
+    repository = FakePriceRepository(latency)
+    calculator = make_calculator(repository)
+    for name in ("order, cold cache", "order, warm cache"):
+        repository.queries = 0
+        start = time.perf_counter()
+        await calculator.calculate_prices(PRICE_LIST_ID, lines, 'gold')
+        results[name] = {
+            "queries": repository.queries,
+            "ms": (time.perf_counter() - start) * 1000
+        }
+    return results
+
+@pytest.mark.asyncio
+async def test_order_matches_per_line_pricing():
+    """Order pricing returns exactly what pricing each line would."""
+    lines = sample_order()
+    expected = await price_per_line(make_calculator(FakePriceRepository(0)), lines)
+    calculator = make_calculator(FakePriceRepository(0))
+
+    assert await calculator.calculate_prices(PRICE_LIST_ID, lines, 'gold') == expected
+
+@pytest.mark.asyncio
+async def test_order_query_count():
+    """Three queries per order, two once quantity breaks are cached."""
+    results = await measure(latency=0)
+    distinct_items = len({line.item_code for line in sample_order()})
+
+    assert results["per line"]["queries"] == 2 * ORDER_LINES + distinct_items
+    assert results["order, cold cache"]["queries"] == 3
+    assert results["order, warm cache"]["queries"] == 2
+
+def main():
+    """Print a comparison table."""
+    results = asyncio.run(measure())
+    print(f"{'path':<20}{'queries':>10}{'ms':>10}")
+    for name, result in results.items():
+        print(f"{name:<20}{result['queries']:>10}{result['ms']:>10.1f}")
+
+if __name__ == "__main__":
+    main()
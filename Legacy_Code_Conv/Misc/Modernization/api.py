@@ -2,7 +2,7 @@
 API router for misc module.
 """
 from fastapi import APIRouter, Depends, HTTPException, Request
-from typing import List
+from typing import List, Optional
 from .deposits.models import (
     Deposit,
     DepositCreate,
@@ -10,7 +10,10 @@ from .deposits.models import (
 )
 from .voids.models import (
     Void,
+    VoidBatchProcess,
+    VoidBatchResult,
     VoidCreate,
+    VoidPage,
     VoidUpdate
 )
 from .purchase_orders.models import (
@@ -23,7 +26,7 @@ from .auth.dependencies import (
     get_current_active_user,
     check_permission
 )
-from .audit import AuditLogger
+from .audit import AuditLogger, start_audit_writer, stop_audit_writer
 from .deposits.services import DepositService
 from .voids.services import VoidService
 from .purchase_orders.services import PurchaseOrderService
@@ -80,7 +83,13 @@ alert_manager.add_rule(
 # Start resource monitoring
 resource_monitor.start()
 
-router = APIRouter(prefix="/api/v1/misc", dependencies=[Depends(MonitoringMiddleware())])
+router = APIRouter(
+    prefix="/api/v1/misc",
+    dependencies=[Depends(MonitoringMiddleware())],
+    # Audit events are batched on a dedicated engine; shutdown flushes them
+    on_startup=[start_audit_writer],
+    on_shutdown=[stop_audit_writer]
+)
 
 
 # Deposit endpoints
@@ -316,6 +325,75 @@ async def create_void(
         )
 
 
+@router.post(
+    "/voids/process",
+    response_model=VoidBatchResult,
+    tags=["voids"]
+)
+async def process_voids(
+    batch: VoidBatchProcess,
+    request: Request,
+    current_user = Depends(
+        check_permission(Permission.VOID_PROCESS)
+    ),
+    db = None  # Add your DB dependency
+):
+    """Process voids in bulk."""
+    try:
+        # Process voids
+        service = VoidService(db)
+        result = await service.process_voids(
+            batch,
+            current_user.username
+        )
+        
+        # Log one audit event for the batch
+        audit = AuditLogger(db)
+        await audit.log_event(
+            user=current_user.username,
+            action="bulk_process",
+            resource="void",
+            details=result.audit_summary(),
+            request=request
+        )
+        
+        return result
+        
+    except HTTPException:
+        raise
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=str(e)
+        )
+
+
+@router.get(
+    "/voids/pending",
+    response_model=VoidPage,
+    tags=["voids"]
+)
+async def get_pending_voids(
+    after_id: Optional[int] = None,
+    limit: int = 100,
+    current_user = Depends(
+        check_permission(Permission.VOID_READ)
+    ),
+    db = None  # Add your DB dependency
+):
+    """Get pending voids, oldest first."""
+    try:
+        service = VoidService(db)
+        return await service.get_pending_voids(after_id, min(limit, 1000))
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=str(e)
+        )
+
+
 @router.get(
     "/voids/{void_id}",
     response_model=Void,
@@ -1,27 +1,53 @@
 """
 Audit logging implementation.
 """
+import asyncio
+import json
+import logging
+import os
 from datetime import datetime
-from typing import Any, Dict, Optional
+from enum import Enum
+from typing import Any, Dict, List, Optional, Set, Tuple
 from fastapi import Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine
+)
 from .database import Base
 from sqlalchemy import (
+    BigInteger,
     Column,
-    Integer,
     String,
     DateTime,
-    JSON
+    JSON,
+    Index,
+    event,
+    func,
+    insert,
+    select,
+    text
 )
 
 
+logger = logging.getLogger(__name__)
+
+
 class AuditLog(Base):
-    """Audit log database model."""
+    """Audit log database model.
+    
+    On PostgreSQL the table is range-partitioned by month on timestamp.
+    Creating it also creates the default and current-month partitions;
+    later months are added by ensure_month_partition as events arrive.
+    Existing unpartitioned tables are converted with convert_audit_logs.
+    """
     __tablename__ = "audit_logs"
-
-    id = Column(Integer, primary_key=True, index=True)
+    
+    # The partition key must be part of the primary key
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     timestamp = Column(
         DateTime,
+        primary_key=True,
         nullable=False,
         default=datetime.utcnow
     )
@@ -32,18 +58,459 @@ class AuditLog(Base):
     details = Column(JSON)
     ip_address = Column(String(50))
     user_agent = Column(String(200))
+    
+    __table_args__ = (
+        Index("ix_audit_logs_user_timestamp", "user", "timestamp"),
+        Index(
+            "ix_audit_logs_resource_timestamp",
+            "resource",
+            "resource_id",
+            "timestamp"
+        ),
+        {"postgresql_partition_by": "RANGE (timestamp)"}
+    )
+
+
+def _month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(value: datetime) -> datetime:
+    if value.month == 12:
+        return value.replace(year=value.year + 1, month=1)
+    return value.replace(month=value.month + 1)
+
+
+def _partition_name(month: datetime) -> str:
+    return f"audit_logs_{month:%Y_%m}"
+
+
+def audit_partition_ddl(start: datetime, months: int = 2) -> List[str]:
+    """Build DDL for the default and monthly audit log partitions.
+    
+    Args:
+        start: Any time in the first month to cover
+        months: Number of consecutive months
+        
+    Returns:
+        CREATE TABLE IF NOT EXISTS statements
+    """
+    statements = [
+        "CREATE TABLE IF NOT EXISTS audit_logs_default "
+        "PARTITION OF audit_logs DEFAULT"
+    ]
+    month = _month_start(start)
+    for _ in range(months):
+        following = _next_month(month)
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS {_partition_name(month)} "
+            f"PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month.isoformat()}') "
+            f"TO ('{following.isoformat()}')"
+        )
+        month = following
+    return statements
+
+
+async def ensure_audit_partitions(
+    conn,
+    start: datetime,
+    months: int = 2
+) -> List[str]:
+    """Create monthly audit log partitions if missing.
+    
+    Args:
+        conn: Async connection to a PostgreSQL database
+        start: Any time in the first month to cover
+        months: Number of consecutive months
+        
+    Returns:
+        Names of the partitions covered
+    """
+    for statement in audit_partition_ddl(start, months):
+        await conn.execute(text(statement))
+    names = []
+    month = _month_start(start)
+    for _ in range(months):
+        names.append(_partition_name(month))
+        month = _next_month(month)
+    return names
+
+
+@event.listens_for(AuditLog.__table__, "after_create")
+def _create_initial_partitions(target, connection, **kw):
+    """Give a newly created audit_logs table somewhere to put rows."""
+    if connection.dialect.name != "postgresql":
+        return
+    for statement in audit_partition_ddl(datetime.utcnow(), 2):
+        connection.execute(text(statement))
+
+
+# Partitions known to exist, or months of a table that is not partitioned
+_ready_months: Set[Tuple[int, int]] = set()
+
+
+async def ensure_month_partition(conn, when: datetime):
+    """Make sure audit rows for a month have a partition to go to.
+    
+    A no-op on other databases and on an audit_logs table that has not
+    been converted to partitions yet. Months are only remembered once
+    their partition is visible, so DDL rolled back with the caller's
+    transaction is retried on the next event.
+    
+    Args:
+        conn: Async connection
+        when: Any time in the month
+    """
+    month = (when.year, when.month)
+    if month in _ready_months or conn.dialect.name != "postgresql":
+        return
+    row = (await conn.execute(
+        text(
+            "SELECT (SELECT relkind::text FROM pg_class "
+            "WHERE oid = to_regclass('audit_logs')) AS relkind, "
+            "to_regclass(:name) IS NOT NULL AS present"
+        ),
+        {"name": _partition_name(_month_start(when))}
+    )).one()
+    if row.relkind == "p" and not row.present:
+        await ensure_audit_partitions(conn, when, 1)
+        return
+    _ready_months.add(month)
+
+
+async def convert_audit_logs(conn) -> int:
+    """Convert an existing unpartitioned audit_logs table to partitions.
+    
+    Run once, in a transaction, before starting the partitioned writer.
+    The old table is renamed, the partitioned table is created with
+    monthly partitions covering its rows, the rows are copied and the
+    id sequence continues after the highest copied id.
+    
+    Args:
+        conn: Async connection to a PostgreSQL database, in a transaction
+        
+    Returns:
+        Number of rows copied (0 if already partitioned or missing)
+    """
+    relkind = await conn.scalar(text(
+        "SELECT relkind::text FROM pg_class "
+        "WHERE oid = to_regclass('audit_logs')"
+    ))
+    if relkind != "r":
+        return 0
+        
+    await conn.execute(text("ALTER TABLE audit_logs RENAME TO audit_logs_legacy"))
+    # Free the index, constraint and sequence names for the new table
+    indexes = await conn.scalars(text(
+        "SELECT indexname FROM pg_indexes WHERE tablename = 'audit_logs_legacy'"
+    ))
+    for index in list(indexes):
+        await conn.execute(text(f'ALTER INDEX "{index}" RENAME TO "{index}_legacy"'))
+    sequence = await conn.scalar(text(
+        "SELECT pg_get_serial_sequence('audit_logs_legacy', 'id')"
+    ))
+    if sequence:
+        await conn.execute(text(
+            f"ALTER SEQUENCE {sequence} RENAME TO audit_logs_legacy_id_seq"
+        ))
+        
+    await conn.run_sync(AuditLog.__table__.create)
+    first, last = (await conn.execute(text(
+        "SELECT min(timestamp), max(timestamp) FROM audit_logs_legacy"
+    ))).one()
+    if first is not None:
+        months = (last.year - first.year) * 12 + last.month - first.month + 1
+        await ensure_audit_partitions(conn, first, months)
+        
+    result = await conn.execute(text(
+        'INSERT INTO audit_logs (id, timestamp, "user", action, resource, '
+        "resource_id, details, ip_address, user_agent) "
+        "SELECT id, COALESCE(timestamp, now() AT TIME ZONE 'utc'), "
+        '"user", action, resource, resource_id, details, ip_address, '
+        "user_agent FROM audit_logs_legacy"
+    ))
+    await conn.execute(text(
+        "SELECT setval(pg_get_serial_sequence('audit_logs', 'id'), "
+        "COALESCE((SELECT max(id) FROM audit_logs), 0) + 1, false)"
+    ))
+    await conn.execute(text("DROP TABLE audit_logs_legacy"))
+    _ready_months.clear()
+    return result.rowcount
+
+
+class Durability(str, Enum):
+    """How long log_event waits for an audit record to be stored."""
+    SYNC = "sync"    # Written and committed before log_event returns
+    ASYNC = "async"  # Queued and written with the next batch
+
+
+# Resources whose changes must be on disk before the request completes
+FINANCIAL_RESOURCES = {"deposit", "void", "purchase_order"}
+READ_ACTIONS = {"read", "view", "list", "search", "export"}
+
+
+def default_durability(action: str, resource: str) -> Durability:
+    """Pick durability for an event.
+    
+    Args:
+        action: Action performed
+        resource: Resource type
+        
+    Returns:
+        SYNC for changes to financial resources, ASYNC otherwise
+    """
+    if resource in FINANCIAL_RESOURCES and action not in READ_ACTIONS:
+        return Durability.SYNC
+    return Durability.ASYNC
+
+
+class AuditWriter:
+    """Append-only audit pipeline.
+    
+    Events are written on the writer's own engine, outside the caller's
+    transaction. Asynchronous events are buffered in-process and inserted
+    in batches of up to batch_size rows, at least every flush_interval
+    seconds. The buffer is bounded: when it is full, enqueue waits rather
+    than dropping audit records. Batches that still fail after retries are
+    appended to a dead-letter file for replay_dead_letters.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_queue: int = 10000,
+        retry_attempts: int = 3,
+        partitioned: Optional[bool] = None,
+        dead_letter_path: str = "audit_dead_letter.jsonl"
+    ):
+        """Initialize writer.
+        
+        Args:
+            engine: Engine used only for audit writes
+            batch_size: Maximum rows per insert
+            flush_interval: Maximum seconds an event waits in the buffer
+            max_queue: Maximum buffered events
+            retry_attempts: Retries for a failed batch
+            partitioned: Maintain monthly partitions (default: on PostgreSQL)
+            dead_letter_path: JSON lines file for batches that cannot be written
+        """
+        self.engine = engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_attempts = retry_attempts
+        self.partitioned = (
+            engine.dialect.name == "postgresql"
+            if partitioned is None else partitioned
+        )
+        self.dead_letter_path = dead_letter_path
+        self.failed = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background flush task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def enqueue(self, entry: Dict[str, Any]):
+        """Buffer an event for the next batch.
+        
+        Args:
+            entry: AuditLog column values
+        """
+        self.start()
+        await self._queue.put(entry)
+
+    async def write(self, entries: List[Dict[str, Any]]):
+        """Insert events now and commit.
+        
+        Args:
+            entries: AuditLog column values
+            
+        Raises:
+            Exception: If the insert fails after retries
+        """
+        if not entries:
+            return
+        for attempt in range(self.retry_attempts + 1):
+            try:
+                async with self.engine.begin() as conn:
+                    await self._ensure_partitions(conn, entries)
+                    await conn.execute(insert(AuditLog), entries)
+                return
+            except Exception as e:
+                if attempt == self.retry_attempts:
+                    raise
+                logger.warning(f"Audit write failed, retrying: {e}")
+                await asyncio.sleep(0.1 * 2 ** attempt)
+
+    async def flush(self):
+        """Wait until every buffered event is written."""
+        if self._task is not None and not self._task.done():
+            await self._queue.join()
+
+    async def close(self):
+        """Write buffered events and stop the flush task."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = asyncio.get_running_loop().time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self.write(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                await self._dead_letter(batch, e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _dead_letter(self, batch: List[Dict[str, Any]], error: Exception):
+        """Keep a failed batch on disk; audit payloads stay out of the log."""
+        lines = "".join(
+            json.dumps(entry, default=str) + "\n" for entry in batch
+        )
+        try:
+            await asyncio.to_thread(self._append, lines)
+            logger.error(
+                f"Audit batch of {len(batch)} events not written to the "
+                f"database ({type(error).__name__}); saved to "
+                f"{self.dead_letter_path}"
+            )
+        except OSError as e:
+            logger.critical(
+                f"Audit batch of {len(batch)} events lost: database write "
+                f"failed ({type(error).__name__}) and dead-letter write "
+                f"failed ({e})"
+            )
+
+    def _append(self, lines: str):
+        with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    async def replay_dead_letters(self) -> int:
+        """Write events saved in the dead-letter file, then empty it.
+        
+        Returns:
+            Number of events written
+            
+        Raises:
+            Exception: If the insert fails; the file is left in place
+        """
+        if not os.path.exists(self.dead_letter_path):
+            return 0
+        with open(self.dead_letter_path, encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        for entry in entries:
+            entry["timestamp"] = datetime.fromisoformat(entry["timestamp"])
+        for start in range(0, len(entries), self.batch_size):
+            await self.write(entries[start:start + self.batch_size])
+        os.remove(self.dead_letter_path)
+        return len(entries)
+
+    async def _ensure_partitions(self, conn, entries: List[Dict[str, Any]]):
+        if not self.partitioned:
+            return
+        months = {
+            (entry["timestamp"].year, entry["timestamp"].month)
+            for entry in entries
+        }
+        for year, month in sorted(months):
+            await ensure_month_partition(conn, datetime(year, month, 1))
+
+
+_audit_writer: Optional[AuditWriter] = None
+
+
+def configure_audit_writer(engine: AsyncEngine, **options) -> AuditWriter:
+    """Install the process-wide audit writer.
+    
+    Args:
+        engine: Engine used only for audit writes
+        **options: AuditWriter options
+        
+    Returns:
+        The writer
+    """
+    global _audit_writer
+    _audit_writer = AuditWriter(engine, **options)
+    return _audit_writer
+
+
+def get_audit_writer() -> Optional[AuditWriter]:
+    """Get the process-wide audit writer, if configured."""
+    return _audit_writer
+
+
+async def start_audit_writer(
+    database_url: Optional[str] = None,
+    **options
+) -> Optional[AuditWriter]:
+    """Start the audit pipeline on its own engine (application startup).
+    
+    Args:
+        database_url: Async database URL (default: AUDIT_DATABASE_URL)
+        **options: AuditWriter options
+        
+    Returns:
+        The writer, or None when no database URL is set
+    """
+    database_url = database_url or os.environ.get("AUDIT_DATABASE_URL")
+    if not database_url:
+        logger.warning(
+            "AUDIT_DATABASE_URL not set; audit events are written in the "
+            "caller's transaction"
+        )
+        return None
+    engine = create_async_engine(database_url, pool_size=2, max_overflow=0)
+    writer = configure_audit_writer(engine, **options)
+    writer.start()
+    return writer
+
+
+async def stop_audit_writer():
+    """Write buffered audit events and release the engine (shutdown)."""
+    global _audit_writer
+    writer, _audit_writer = _audit_writer, None
+    if writer is not None:
+        await writer.close()
+        await writer.engine.dispose()
 
 
 class AuditLogger:
     """Service for audit logging."""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: AsyncSession,
+        writer: Optional[AuditWriter] = None
+    ):
         """Initialize logger.
         
         Args:
             db: Database session
+            writer: Audit writer (default: the configured one)
         """
         self.db = db
+        self.writer = writer or get_audit_writer()
 
     async def log_event(
         self,
@@ -52,7 +519,8 @@ class AuditLogger:
         resource: str,
         resource_id: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
-        request: Optional[Request] = None
+        request: Optional[Request] = None,
+        durability: Optional[Durability] = None
     ):
         """Log audit event.
         
@@ -63,33 +531,48 @@ class AuditLogger:
             resource_id: Resource identifier
             details: Additional details
             request: HTTP request
+            durability: Wait for the write (default by resource and action)
             
         Raises:
             Exception: If logging fails
         """
-        try:
-            # Create log entry
-            log_entry = AuditLog(
-                user=user,
-                action=action,
-                resource=resource,
-                resource_id=resource_id,
-                details=details
-            )
+        # Create log entry
+        entry = {
+            "timestamp": datetime.utcnow(),
+            "user": user,
+            "action": action,
+            "resource": resource,
+            "resource_id": resource_id,
+            "details": details,
+            "ip_address": None,
+            "user_agent": None
+        }
+        
+        # Add request info if available
+        if request:
+            entry["ip_address"] = request.client.host
+            entry["user_agent"] = request.headers.get("user-agent")
             
-            # Add request info if available
-            if request:
-                log_entry.ip_address = request.client.host
-                log_entry.user_agent = request.headers.get(
-                    "user-agent"
+        try:
+            if self.writer is None:
+                # No pipeline configured: write in the caller's transaction
+                await ensure_month_partition(
+                    await self.db.connection(),
+                    entry["timestamp"]
                 )
+                self.db.add(AuditLog(**entry))
+                await self.db.flush()
+                return
+                
+            durability = durability or default_durability(action, resource)
+            if durability == Durability.SYNC:
+                await self.writer.write([entry])
+            else:
+                await self.writer.enqueue(entry)
                 
-            # Save to database
-            self.db.add(log_entry)
-            await self.db.flush()
-            
         except Exception as e:
-            self.db.rollback()
+            if self.writer is None:
+                await self.db.rollback()
             raise Exception(f"Audit logging failed: {str(e)}")
 
     async def get_logs(
@@ -105,6 +588,10 @@ class AuditLogger:
     ) -> List[AuditLog]:
         """Get audit logs.
         
+        Filtering by user or by resource uses the (user, timestamp) and
+        (resource, resource_id, timestamp) indexes, and a date range limits
+        the scan to the matching monthly partitions.
+        
         Args:
             user: Filter by username
             action: Filter by action
@@ -119,29 +606,29 @@ class AuditLogger:
             List of audit logs
         """
         # Build query
-        query = self.db.query(AuditLog)
+        query = select(AuditLog)
         
         if user:
-            query = query.filter(AuditLog.user == user)
+            query = query.where(AuditLog.user == user)
             
         if action:
-            query = query.filter(AuditLog.action == action)
+            query = query.where(AuditLog.action == action)
             
         if resource:
-            query = query.filter(AuditLog.resource == resource)
+            query = query.where(AuditLog.resource == resource)
             
         if resource_id:
-            query = query.filter(
+            query = query.where(
                 AuditLog.resource_id == resource_id
             )
             
         if start_date:
-            query = query.filter(
+            query = query.where(
                 AuditLog.timestamp >= start_date
             )
             
         if end_date:
-            query = query.filter(
+            query = query.where(
                 AuditLog.timestamp <= end_date
             )
             
@@ -149,7 +636,8 @@ class AuditLogger:
         query = query.order_by(AuditLog.timestamp.desc())
         
         # Apply pagination
-        return await query.offset(skip).limit(limit).all()
+        result = await self.db.execute(query.offset(skip).limit(limit))
+        return list(result.scalars().all())
 
     async def get_user_activity(
         self,
@@ -168,20 +656,20 @@ class AuditLogger:
             Activity counts by action
         """
         # Build query
-        query = self.db.query(
+        query = select(
             AuditLog.action,
-            func.count(AuditLog.id)
-        ).filter(
+            func.count()
+        ).where(
             AuditLog.user == user
         )
         
         if start_date:
-            query = query.filter(
+            query = query.where(
                 AuditLog.timestamp >= start_date
             )
             
         if end_date:
-            query = query.filter(
+            query = query.where(
                 AuditLog.timestamp <= end_date
             )
             
@@ -189,9 +677,9 @@ class AuditLogger:
         query = query.group_by(AuditLog.action)
         
         # Execute query
-        results = await query.all()
+        results = await self.db.execute(query)
         
         return {
             action: count
-            for action, count in results
+            for action, count in results.all()
         }
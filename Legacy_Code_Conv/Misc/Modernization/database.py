@@ -12,7 +12,9 @@ from sqlalchemy import (
     ForeignKey,
     Numeric,
     Enum,
-    Text
+    Text,
+    Index,
+    text
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
@@ -78,6 +80,16 @@ class Void(Base):
     created_by = Column(String(100), nullable=False)
     updated_by = Column(String(100), nullable=False)
 
+    __table_args__ = (
+        Index("ix_voids_claim_number_id", "claim_number", "id"),
+        # Keeps the pending work queue small however many voids are closed
+        Index(
+            "ix_voids_pending_id",
+            "id",
+            postgresql_where=text("status = 'pending'")
+        ),
+    )
+
 
 class PurchaseOrder(Base):
     """Purchase order database model."""
@@ -122,6 +134,12 @@ class PurchaseOrderItem(Base):
     )
     barcode = Column(String(50), nullable=False)
     quantity = Column(Integer, nullable=False)
+    received_quantity = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
     unit_price = Column(
         Numeric(precision=10, scale=2),
         nullable=False
@@ -140,3 +158,11 @@ class PurchaseOrderItem(Base):
     )
 
     order = relationship("PurchaseOrder", back_populates="items")
+
+    __table_args__ = (
+        Index(
+            "ix_purchase_order_items_order_barcode",
+            "purchase_order_id",
+            "barcode"
+        ),
+    )
@@ -1,10 +1,15 @@
 """
 Alert configuration and management.
 """
-from typing import Any, Callable, Dict, List, Optional
+import heapq
+import math
+import operator
+import time
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from enum import Enum
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
 
 
 class AlertSeverity(str, Enum):
@@ -15,6 +20,27 @@ class AlertSeverity(str, Enum):
     INFO = "info"
 
 
+class Aggregation(str, Enum):
+    """How samples in a rule's window are reduced to one value."""
+    LAST = "last"
+    AVG = "avg"
+    MIN = "min"
+    MAX = "max"
+    SUM = "sum"
+    COUNT = "count"
+    P95 = "p95"
+    RATE = "rate"
+
+
+COMPARATORS: Dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq
+}
+
+
 class AlertRule(BaseModel):
     """Alert rule configuration."""
     name: str = Field(..., description="Rule name")
@@ -34,6 +60,35 @@ class AlertRule(BaseModel):
         True,
         description="Whether rule is enabled"
     )
+    aggregation: Aggregation = Field(
+        Aggregation.LAST,
+        description="Aggregate compared with the threshold"
+    )
+    window: int = Field(
+        0,
+        description="Seconds of samples to aggregate (0: latest sample)",
+        ge=0
+    )
+    for_duration: int = Field(
+        0,
+        description="Seconds the condition must hold before firing",
+        ge=0
+    )
+    repeat_interval: Optional[int] = Field(
+        None,
+        description="Seconds between repeat notifications while firing "
+                    "(None: notify once per episode)",
+        gt=0
+    )
+
+    @validator("condition")
+    def validate_condition(cls, v):
+        """Validate comparison operator."""
+        if v not in COMPARATORS:
+            raise ValueError(
+                f"Condition must be one of {', '.join(COMPARATORS)}"
+            )
+        return v
 
 
 class Alert(BaseModel):
@@ -52,11 +107,176 @@ class Alert(BaseModel):
     )
 
 
-class AlertManager:
-    """Manager for alert rules and notifications."""
+class MetricWindow:
+    """Bounded, time-ordered samples of one metric.
+    
+    Samples older than the retention period are dropped on append, and at
+    most max_samples are kept, so memory per metric is bounded.
+    """
+
+    def __init__(self, retention: float, max_samples: int = 10000):
+        """Initialize window.
+        
+        Args:
+            retention: Seconds of samples to keep
+            max_samples: Maximum samples kept
+        """
+        self.retention = retention
+        self.max_samples = max_samples
+        self._times: List[float] = []
+        self._values: List[float] = []
+        self._start = 0
+
+    def __len__(self) -> int:
+        return len(self._times) - self._start
+
+    def append(self, timestamp: float, value: float):
+        """Add a sample.
+        
+        Args:
+            timestamp: Sample time in seconds
+            value: Sample value
+        """
+        if len(self) and timestamp < self._times[-1]:
+            # Keep samples sorted; late samples count as the latest time
+            timestamp = self._times[-1]
+        self._times.append(timestamp)
+        self._values.append(value)
+        
+        cutoff = timestamp - self.retention
+        start = bisect_left(self._times, cutoff, self._start)
+        # Always keep the latest sample for LAST
+        self._start = min(
+            max(start, len(self._times) - self.max_samples),
+            len(self._times) - 1
+        )
+        if self._start > len(self._times) // 2:
+            del self._times[:self._start]
+            del self._values[:self._start]
+            self._start = 0
+
+    def aggregate(
+        self,
+        aggregation: Aggregation,
+        window: float,
+        now: float
+    ) -> Optional[float]:
+        """Reduce samples from the last window seconds.
+        
+        Args:
+            aggregation: Aggregate to compute
+            window: Seconds before now to include
+            now: Current time
+            
+        Returns:
+            Aggregate value, or None without enough samples
+        """
+        if not len(self):
+            return None
+        if aggregation == Aggregation.LAST or window <= 0:
+            return self._values[-1]
+            
+        start = bisect_left(self._times, now - window, self._start)
+        values = self._values[start:]
+        if not values:
+            return 0.0 if aggregation == Aggregation.COUNT else None
+            
+        if aggregation == Aggregation.AVG:
+            return sum(values) / len(values)
+        if aggregation == Aggregation.MIN:
+            return min(values)
+        if aggregation == Aggregation.MAX:
+            return max(values)
+        if aggregation == Aggregation.SUM:
+            return sum(values)
+        if aggregation == Aggregation.COUNT:
+            return float(len(values))
+        if aggregation == Aggregation.P95:
+            ordered = sorted(values)
+            return ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)]
+        if aggregation == Aggregation.RATE:
+            # Per-second increase of a counter; a drop is a counter reset
+            span = self._times[-1] - self._times[start]
+            if span <= 0:
+                return None
+            increase = sum(
+                current - previous if current >= previous else current
+                for previous, current in zip(values, values[1:])
+            )
+            return increase / span
+        return None
+
+
+class _RuleState:
+    """Evaluation state of one rule."""
+    __slots__ = ("active_since", "firing", "generation")
 
     def __init__(self):
-        """Initialize manager."""
+        self.active_since: Optional[float] = None
+        self.firing = False
+        self.generation = 0
+
+
+def _group_key(rule: AlertRule) -> Tuple[str, Aggregation, int, str]:
+    """Rules with equal keys share one aggregate and one threshold list."""
+    if rule.aggregation == Aggregation.LAST or not rule.window:
+        # The window does not matter for the latest sample
+        return rule.metric, Aggregation.LAST, 0, rule.condition
+    return rule.metric, rule.aggregation, rule.window, rule.condition
+
+
+class _RuleGroup:
+    """Rules sharing metric, aggregation, window and condition.
+    
+    Thresholds are kept sorted, so the rules whose condition holds for a
+    value always form one contiguous slice found by bisection.
+    """
+
+    def __init__(self, rules: List[AlertRule]):
+        self.key = _group_key(rules[0])
+        self.metric, self.aggregation, self.window, self.condition = self.key
+        self.rules = sorted(rules, key=lambda rule: rule.threshold)
+        self.thresholds = [rule.threshold for rule in self.rules]
+        self.active: Tuple[int, int] = (0, 0)
+        self.value: Optional[float] = None
+
+    def matching(self, value: Optional[float]) -> Tuple[int, int]:
+        """Index range of rules whose condition holds for value."""
+        if value is None or math.isnan(value):
+            return 0, 0
+        n = len(self.thresholds)
+        if self.condition == ">":
+            return 0, bisect_left(self.thresholds, value)
+        if self.condition == ">=":
+            return 0, bisect_right(self.thresholds, value)
+        if self.condition == "<":
+            return bisect_right(self.thresholds, value), n
+        if self.condition == "<=":
+            return bisect_left(self.thresholds, value), n
+        return (
+            bisect_left(self.thresholds, value),
+            bisect_right(self.thresholds, value)
+        )
+
+
+class AlertManager:
+    """Manager for alert rules and notifications.
+    
+    Metric samples are kept in per-metric windows. Rules are compiled into
+    groups by (metric, aggregation, window, condition); each group computes
+    its aggregate once per evaluation and finds the matching rules by
+    bisecting sorted thresholds, so only rules whose state changes cost
+    anything. A rule fires after its condition has held for for_duration
+    seconds, notifies once per episode (or every repeat_interval seconds),
+    and re-arms when the condition clears.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        """Initialize manager.
+        
+        Args:
+            max_samples: Maximum samples kept per metric
+        """
         self.rules: Dict[str, AlertRule] = {}
         self.handlers: Dict[
             AlertSeverity,
@@ -65,6 +285,14 @@ class AlertManager:
             severity: []
             for severity in AlertSeverity
         }
+        self.max_samples = max_samples
+        self._windows: Dict[str, MetricWindow] = {}
+        self._groups: Dict[str, List[_RuleGroup]] = {}
+        self._states: Dict[str, _RuleState] = {}
+        self._schedule: List[Tuple[float, int, str, int]] = []
+        self._sequence = 0
+        self._compiled = False
+        self._reconcile = False
 
     def add_rule(self, rule: AlertRule):
         """Add alert rule.
@@ -73,6 +301,8 @@ class AlertManager:
             rule: Alert rule
         """
         self.rules[rule.name] = rule
+        self._states[rule.name] = _RuleState()
+        self._compiled = False
 
     def remove_rule(self, rule_name: str):
         """Remove alert rule.
@@ -81,6 +311,8 @@ class AlertManager:
             rule_name: Rule name
         """
         self.rules.pop(rule_name, None)
+        self._states.pop(rule_name, None)
+        self._compiled = False
 
     def add_handler(
         self,
@@ -109,28 +341,21 @@ class AlertManager:
         Returns:
             True if condition met
         """
-        if rule.condition == ">":
-            return value > rule.threshold
-        elif rule.condition == ">=":
-            return value >= rule.threshold
-        elif rule.condition == "<":
-            return value < rule.threshold
-        elif rule.condition == "<=":
-            return value <= rule.threshold
-        elif rule.condition == "==":
-            return value == rule.threshold
-        return False
+        return COMPARATORS[rule.condition](value, rule.threshold)
 
     def trigger_alert(
         self,
         rule: AlertRule,
         value: float
-    ):
+    ) -> Alert:
         """Trigger alert for rule.
         
         Args:
             rule: Alert rule
             value: Current value
+            
+        Returns:
+            The alert sent to handlers
         """
         alert = Alert(
             rule_name=rule.name,
@@ -148,23 +373,218 @@ class AlertManager:
                 print(
                     f"Alert handler error: {str(e)}"
                 )
+        return alert
+
+    def record(
+        self,
+        metric: str,
+        value: float,
+        timestamp: Optional[float] = None
+    ):
+        """Record a metric sample.
+        
+        Samples for metrics no rule watches are ignored.
+        
+        Args:
+            metric: Metric name
+            value: Sample value
+            timestamp: Sample time in seconds (default: now)
+        """
+        if not self._compiled:
+            self._compile()
+        window = self._windows.get(metric)
+        if window is not None:
+            window.append(
+                time.time() if timestamp is None else timestamp,
+                value
+            )
+
+    def evaluate(self, now: Optional[float] = None) -> List[Alert]:
+        """Evaluate every enabled rule against recorded samples.
+        
+        Args:
+            now: Evaluation time in seconds (default: now)
+            
+        Returns:
+            Alerts sent during this evaluation
+        """
+        now = time.time() if now is None else now
+        if not self._compiled:
+            self._compile()
+        # Recompiled groups start with no active range; reconcile them once
+        full = self._reconcile
+        self._reconcile = False
+            
+        alerts: List[Alert] = []
+        for metric, groups in self._groups.items():
+            window = self._windows[metric]
+            values: Dict[Tuple[Aggregation, int], Optional[float]] = {}
+            for group in groups:
+                key = (group.aggregation, group.window)
+                if key not in values:
+                    values[key] = window.aggregate(
+                        group.aggregation,
+                        group.window,
+                        now
+                    )
+                if not full and values[key] == group.value:
+                    # Same value, same matching rules
+                    continue
+                group.value = values[key]
+                self._transition(
+                    group,
+                    group.matching(group.value),
+                    now,
+                    full,
+                    alerts
+                )
+                
+        self._run_schedule(now, alerts)
+        return alerts
 
     async def check_rules(
         self,
         metrics: Dict[str, float]
-    ):
+    ) -> List[Alert]:
         """Check all alert rules.
         
         Args:
             metrics: Current metric values
+            
+        Returns:
+            Alerts sent
         """
+        now = time.time()
+        for metric, value in metrics.items():
+            self.record(metric, value, now)
+        return self.evaluate(now)
+
+    def _compile(self):
+        """Group enabled rules and size metric windows."""
+        grouped: Dict[Tuple, List[AlertRule]] = {}
         for rule in self.rules.values():
-            if not rule.enabled:
-                continue
+            if rule.enabled:
+                grouped.setdefault(_group_key(rule), []).append(rule)
                 
-            value = metrics.get(rule.metric)
-            if value is None:
+        self._groups = {}
+        for rules in grouped.values():
+            group = _RuleGroup(rules)
+            self._groups.setdefault(group.metric, []).append(group)
+            
+        windows = {}
+        for metric, groups in self._groups.items():
+            retention = max(group.window for group in groups)
+            window = self._windows.get(metric)
+            if window is None:
+                window = MetricWindow(retention, self.max_samples)
+            window.retention = retention
+            windows[metric] = window
+        self._windows = windows
+        
+        # Disabled rules stop firing
+        for name, rule in self.rules.items():
+            if not rule.enabled:
+                self._deactivate(self._states[name])
+        self._compiled = True
+        self._reconcile = True
+
+    def _transition(
+        self,
+        group: _RuleGroup,
+        active: Tuple[int, int],
+        now: float,
+        full: bool,
+        alerts: List[Alert]
+    ):
+        """Apply the change from the group's previous active range."""
+        low, high = active
+        old_low, old_high = group.active
+        if active == group.active and not full:
+            return
+        group.active = active
+        
+        if full:
+            # After recompiling, reconcile every rule once
+            for index, rule in enumerate(group.rules):
+                state = self._states[rule.name]
+                if low <= index < high:
+                    self._activate(rule, state, group, now, alerts)
+                else:
+                    self._deactivate(state)
+            return
+            
+        # Rules entering: [low, high) minus [old_low, old_high)
+        for index in range(low, min(high, old_low)):
+            self._activate(group.rules[index], None, group, now, alerts)
+        for index in range(max(low, old_high), high):
+            self._activate(group.rules[index], None, group, now, alerts)
+        # Rules leaving: [old_low, old_high) minus [low, high)
+        for index in range(old_low, min(old_high, low)):
+            self._deactivate(self._states[group.rules[index].name])
+        for index in range(max(old_low, high), old_high):
+            self._deactivate(self._states[group.rules[index].name])
+
+    def _activate(
+        self,
+        rule: AlertRule,
+        state: Optional[_RuleState],
+        group: _RuleGroup,
+        now: float,
+        alerts: List[Alert]
+    ):
+        state = state or self._states[rule.name]
+        if state.active_since is not None:
+            return
+        state.active_since = now
+        state.generation += 1
+        if rule.for_duration:
+            self._schedule_check(now + rule.for_duration, rule, state)
+        else:
+            self._fire(rule, state, group.value, now, alerts)
+
+    def _deactivate(self, state: _RuleState):
+        if state.active_since is None:
+            return
+        state.active_since = None
+        state.firing = False
+        state.generation += 1
+
+    def _fire(
+        self,
+        rule: AlertRule,
+        state: _RuleState,
+        value: float,
+        now: float,
+        alerts: List[Alert]
+    ):
+        state.firing = True
+        alerts.append(self.trigger_alert(rule, value))
+        if rule.repeat_interval:
+            self._schedule_check(now + rule.repeat_interval, rule, state)
+
+    def _schedule_check(self, due: float, rule: AlertRule, state: _RuleState):
+        self._sequence += 1
+        heapq.heappush(
+            self._schedule,
+            (due, self._sequence, rule.name, state.generation)
+        )
+
+    def _run_schedule(self, now: float, alerts: List[Alert]):
+        """Fire rules whose for_duration elapsed and repeat notifications."""
+        while self._schedule and self._schedule[0][0] <= now:
+            _, _, name, generation = heapq.heappop(self._schedule)
+            state = self._states.get(name)
+            if state is None or state.generation != generation:
+                # The rule was removed or its condition cleared since
                 continue
-                
-            if self.check_condition(rule, value):
-                self.trigger_alert(rule, value)
+            rule = self.rules[name]
+            group = self._group_of(rule)
+            if group is not None:
+                self._fire(rule, state, group.value, now, alerts)
+
+    def _group_of(self, rule: AlertRule) -> Optional[_RuleGroup]:
+        key = _group_key(rule)
+        for group in self._groups.get(rule.metric, []):
+            if group.key == key:
+                return group
+        return None
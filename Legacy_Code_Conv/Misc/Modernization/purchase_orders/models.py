@@ -3,7 +3,7 @@ Models for purchase order management.
 """
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -48,6 +48,10 @@ class Item(ItemBase):
         ...,
         description="Purchase order identifier"
     )
+    received_quantity: int = Field(
+        0,
+        description="Quantity received so far"
+    )
     created_at: datetime = Field(
         ...,
         description="Creation timestamp"
@@ -119,3 +123,36 @@ class PurchaseOrder(PurchaseOrderBase):
     class Config:
         """Pydantic config."""
         orm_mode = True
+
+
+class ReceivedItem(BaseModel):
+    """Item touched by a receiving batch."""
+    item_id: int = Field(..., description="Item identifier")
+    barcode: str = Field(..., description="Item barcode")
+    quantity: int = Field(..., description="Ordered quantity")
+    received_quantity: int = Field(
+        ...,
+        description="Quantity received after this batch"
+    )
+    applied: int = Field(
+        ...,
+        description="Units from this batch counted against the item"
+    )
+
+
+class ReceivingResult(BaseModel):
+    """Outcome of receiving a batch of scans."""
+    order_id: int = Field(..., description="Order identifier")
+    status: str = Field(..., description="Order status after receiving")
+    items: List[ReceivedItem] = Field(
+        ...,
+        description="Items updated by the batch"
+    )
+    unknown_barcodes: List[str] = Field(
+        default_factory=list,
+        description="Scanned barcodes not on the order"
+    )
+    over_scanned: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Scans beyond the ordered quantity, by barcode"
+    )
@@ -1,11 +1,15 @@
 """
 Purchase order service implementation.
 """
+from collections import Counter
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select, text, bindparam, String, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import IntegrityError
 from ..database import (
     PurchaseOrder as PurchaseOrderDB,
@@ -16,14 +20,71 @@ from .models import (
     PurchaseOrderCreate,
     PurchaseOrderUpdate,
     Item,
-    ItemCreate
+    ItemCreate,
+    ReceivedItem,
+    ReceivingResult
+)
+
+
+# Applies a batch of scans and recomputes the order status in one
+# statement. Data-modifying CTEs share a snapshot, so the status aggregate
+# reads updated rows from the "updated" CTE rather than the table.
+RECEIVE_SCANS = text("""
+WITH scans AS (
+    SELECT barcode, SUM(scanned)::int AS scanned
+    FROM unnest(:barcodes, :counts) AS s(barcode, scanned)
+    GROUP BY barcode
+),
+updated AS (
+    UPDATE purchase_order_items AS i
+    SET received_quantity = LEAST(i.quantity, prior.received_quantity + scans.scanned),
+        updated_at = :now
+    FROM scans
+    JOIN purchase_order_items AS prior
+        ON prior.barcode = scans.barcode
+        AND prior.purchase_order_id = :order_id
+    WHERE i.id = prior.id
+    RETURNING
+        i.id,
+        i.barcode,
+        i.quantity,
+        i.received_quantity,
+        i.received_quantity - prior.received_quantity AS applied
+),
+totals AS (
+    SELECT
+        bool_and(COALESCE(u.received_quantity, i.received_quantity) >= i.quantity) AS complete,
+        bool_or(COALESCE(u.received_quantity, i.received_quantity) > 0) AS started
+    FROM purchase_order_items AS i
+    LEFT JOIN updated AS u ON u.id = i.id
+    WHERE i.purchase_order_id = :order_id
+),
+order_update AS (
+    UPDATE purchase_orders AS o
+    SET status = CASE
+            WHEN totals.complete THEN 'received'
+            WHEN totals.started THEN 'partial'
+            ELSE o.status
+        END,
+        updated_by = :user,
+        updated_at = :now
+    FROM totals
+    WHERE o.id = :order_id
+    RETURNING o.status
+)
+SELECT u.id, u.barcode, u.quantity, u.received_quantity, u.applied, order_update.status
+FROM order_update
+LEFT JOIN updated AS u ON TRUE
+""").bindparams(
+    bindparam("barcodes", type_=ARRAY(String)),
+    bindparam("counts", type_=ARRAY(Integer))
 )
 
 
 class PurchaseOrderService:
     """Service for managing purchase orders."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize service.
         
         Args:
@@ -75,7 +136,7 @@ class PurchaseOrderService:
                 self.db.add(db_item)
                 
             await self.db.flush()
-            await self.db.refresh(db_order)
+            await self.db.refresh(db_order, ["items"])
             return PurchaseOrder.from_orm(db_order)
             
         except IntegrityError as e:
@@ -104,10 +165,7 @@ class PurchaseOrderService:
         Returns:
             Order if found, None otherwise
         """
-        order = await self.db.query(PurchaseOrderDB).filter(
-            PurchaseOrderDB.id == order_id
-        ).first()
-        
+        order = await self._load_order(order_id)
         return PurchaseOrder.from_orm(order) if order else None
 
     async def update_purchase_order(
@@ -130,9 +188,7 @@ class PurchaseOrderService:
             HTTPException: If update fails
         """
         try:
-            db_order = await self.db.query(PurchaseOrderDB).filter(
-                PurchaseOrderDB.id == order_id
-            ).first()
+            db_order = await self._load_order(order_id)
             
             if not db_order:
                 return None
@@ -145,7 +201,6 @@ class PurchaseOrderService:
                 setattr(db_order, key, value)
                 
             await self.db.flush()
-            await self.db.refresh(db_order)
             return PurchaseOrder.from_orm(db_order)
             
         except IntegrityError as e:
@@ -181,46 +236,92 @@ class PurchaseOrderService:
         Raises:
             HTTPException: If receiving fails
         """
-        try:
-            db_order = await self.db.query(PurchaseOrderDB).filter(
-                PurchaseOrderDB.id == order_id
-            ).first()
+        result = await self.receive_scans(order_id, barcodes, user)
+        if result is None:
+            return None
+        if not result.items:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=400,
+                detail="No matching items found"
+            )
+        order = await self._load_order(order_id, refresh=True)
+        return PurchaseOrder.from_orm(order)
+
+    async def receive_scans(
+        self,
+        order_id: int,
+        barcodes: List[str],
+        user: str
+    ) -> Optional[ReceivingResult]:
+        """Apply a batch of scanned barcodes to an order.
+        
+        Each scan counts as one unit. Scans are counted per barcode, applied
+        to the order's items and the order status recomputed in a single
+        statement. Received quantities never exceed the ordered quantity;
+        extra scans are reported in ``over_scanned``.
+        
+        The order row is locked first, so concurrent scanners on the same
+        order apply one batch after another and neither the per-item
+        increments nor the status aggregate lose updates.
+        
+        Args:
+            order_id: Order identifier
+            barcodes: Scanned barcodes, one entry per unit
+            user: Username
             
-            if not db_order:
-                return None
-                
-            # Get items
-            items = await self.db.query(PurchaseOrderItemDB).filter(
-                PurchaseOrderItemDB.purchase_order_id == order_id,
-                PurchaseOrderItemDB.barcode.in_(barcodes)
-            ).all()
+        Returns:
+            Receiving outcome, or None if the order does not exist
             
-            if not items:
-                raise HTTPException(
-                    status_code=400,
-                    detail="No matching items found"
+        Raises:
+            HTTPException: If receiving fails
+        """
+        try:
+            locked = await self.db.execute(
+                select(PurchaseOrderDB.id).where(
+                    PurchaseOrderDB.id == order_id
+                ).with_for_update()
+            )
+            if locked.scalar_one_or_none() is None:
+                return None
+
+            scans = Counter(barcodes)
+            rows = (await self.db.execute(
+                RECEIVE_SCANS,
+                {
+                    "barcodes": list(scans),
+                    "counts": list(scans.values()),
+                    "order_id": order_id,
+                    "user": user,
+                    "now": datetime.utcnow()
+                }
+            )).all()
+
+            items = [
+                ReceivedItem(
+                    item_id=row.id,
+                    barcode=row.barcode,
+                    quantity=row.quantity,
+                    received_quantity=row.received_quantity,
+                    applied=row.applied
                 )
-                
-            # Update order status
-            all_items = await self.db.query(PurchaseOrderItemDB).filter(
-                PurchaseOrderItemDB.purchase_order_id == order_id
-            ).all()
-            
-            if len(items) == len(all_items):
-                db_order.status = "received"
-            else:
-                db_order.status = "partial"
-                
-            db_order.updated_by = user
-            db_order.updated_at = datetime.utcnow()
-            
+                for row in rows if row.id is not None
+            ]
+            matched = {item.barcode for item in items}
+            over_scanned = {}
+            for item in items:
+                extra = scans[item.barcode] - item.applied
+                if extra > 0:
+                    over_scanned[item.barcode] = extra
+
             await self.db.flush()
-            await self.db.refresh(db_order)
-            return PurchaseOrder.from_orm(db_order)
-            
-        except HTTPException:
-            await self.db.rollback()
-            raise
+            return ReceivingResult(
+                order_id=order_id,
+                status=rows[0].status,
+                items=items,
+                unknown_barcodes=sorted(set(scans) - matched),
+                over_scanned=over_scanned
+            )
             
         except Exception as e:
             await self.db.rollback()
@@ -245,9 +346,13 @@ class PurchaseOrderService:
         Returns:
             List of orders
         """
-        orders = await self.db.query(PurchaseOrderDB).filter(
-            PurchaseOrderDB.vendor_id == vendor_id
-        ).offset(skip).limit(limit).all()
+        orders = (await self.db.execute(
+            select(PurchaseOrderDB).options(
+                selectinload(PurchaseOrderDB.items)
+            ).where(
+                PurchaseOrderDB.vendor_id == vendor_id
+            ).order_by(PurchaseOrderDB.id).offset(skip).limit(limit)
+        )).scalars().all()
         
         return [PurchaseOrder.from_orm(o) for o in orders]
 
@@ -265,8 +370,33 @@ class PurchaseOrderService:
         Returns:
             List of pending orders
         """
-        orders = await self.db.query(PurchaseOrderDB).filter(
-            PurchaseOrderDB.status == "pending"
-        ).offset(skip).limit(limit).all()
+        orders = (await self.db.execute(
+            select(PurchaseOrderDB).options(
+                selectinload(PurchaseOrderDB.items)
+            ).where(
+                PurchaseOrderDB.status == "pending"
+            ).order_by(PurchaseOrderDB.id).offset(skip).limit(limit)
+        )).scalars().all()
         
         return [PurchaseOrder.from_orm(o) for o in orders]
+
+    async def _load_order(
+        self,
+        order_id: int,
+        refresh: bool = False
+    ) -> Optional[PurchaseOrderDB]:
+        """Load an order with its items.
+        
+        Args:
+            order_id: Order identifier
+            refresh: Overwrite objects already in the session
+            
+        Returns:
+            Order if found, None otherwise
+        """
+        query = select(PurchaseOrderDB).options(
+            selectinload(PurchaseOrderDB.items)
+        ).where(PurchaseOrderDB.id == order_id)
+        if refresh:
+            query = query.execution_options(populate_existing=True)
+        return (await self.db.execute(query)).scalar_one_or_none()
@@ -0,0 +1,72 @@
+import pytest
+from monitoring.alerts import AlertManager, AlertRule, AlertSeverity
+
+def make_rule(name: str, threshold: float, **options) -> AlertRule:
+    return AlertRule(
+        name=name,
+        description=f"{name} alert",
+        metric="cpu",
+        condition=">",
+        threshold=threshold,
+        severity=AlertSeverity.WARNING,
+        interval=60,
+        **options
+    )
+
+def fired(manager: AlertManager, value: float, now: float):
+    manager.record("cpu", value, now)
+    return [alert.rule_name for alert in manager.evaluate(now)]
+
+def test_fires_once_per_episode():
+    manager = AlertManager()
+    manager.add_rule(make_rule("a", 10))
+
+    assert fired(manager, 20, 1) == ["a"]
+    assert fired(manager, 25, 2) == []
+    assert fired(manager, 5, 3) == []
+    assert fired(manager, 20, 4) == ["a"]
+
+def test_for_duration_delays_firing():
+    manager = AlertManager()
+    manager.add_rule(make_rule("a", 10, for_duration=30))
+
+    assert fired(manager, 20, 0) == []
+    assert fired(manager, 20, 29) == []
+    assert fired(manager, 20, 30) == ["a"]
+
+@pytest.mark.parametrize("change", ["add", "remove"])
+def test_rule_changes_keep_active_episodes(change):
+    manager = AlertManager()
+    manager.add_rule(make_rule("a", 10))
+    manager.add_rule(make_rule("c", 50))
+    assert fired(manager, 20, 1) == ["a"]
+
+    if change == "add":
+        manager.add_rule(make_rule("b", 30))
+    else:
+        manager.remove_rule("c")
+
+    # The condition clears and the rule re-arms
+    assert fired(manager, 5, 2) == []
+    assert fired(manager, 20, 3) == ["a"]
+
+@pytest.mark.parametrize("change", ["add", "remove"])
+def test_rule_changes_do_not_repeat_active_episodes(change):
+    manager = AlertManager()
+    manager.add_rule(make_rule("a", 10))
+    manager.add_rule(make_rule("c", 50))
+    assert fired(manager, 20, 1) == ["a"]
+
+    if change == "add":
+        manager.add_rule(make_rule("b", 30))
+    else:
+        manager.remove_rule("c")
+
+    assert fired(manager, 20, 2) == []
+
+def test_disabled_rule_stops_firing():
+    manager = AlertManager()
+    manager.add_rule(make_rule("a", 10))
+    manager.add_rule(make_rule("b", 10, enabled=False))
+
+    assert fired(manager, 20, 1) == ["a"]
@@ -2,7 +2,7 @@
 Models for void management.
 """
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -63,3 +63,63 @@ class Void(VoidBase):
     class Config:
         """Pydantic config."""
         orm_mode = True
+
+
+class VoidBatchProcess(BaseModel):
+    """Bulk void processing request."""
+    void_ids: List[int] = Field(
+        default_factory=list,
+        description="Voids to process",
+        max_items=5000
+    )
+    claim_numbers: List[str] = Field(
+        default_factory=list,
+        description="Process every void on these claims",
+        max_items=5000
+    )
+    status: str = Field(
+        ...,
+        description="New status",
+        min_length=1,
+        max_length=20
+    )
+    from_statuses: List[str] = Field(
+        default_factory=lambda: ["pending"],
+        description="Only voids currently in these statuses are processed"
+    )
+
+
+class VoidBatchResult(BaseModel):
+    """Outcome of a bulk void processing request."""
+    status: str = Field(..., description="Status applied")
+    processed: List[Void] = Field(
+        ...,
+        description="Voids moved to the new status"
+    )
+    skipped_ids: List[int] = Field(
+        default_factory=list,
+        description="Requested voids not in an allowed status"
+    )
+    not_found_ids: List[int] = Field(
+        default_factory=list,
+        description="Requested void ids that do not exist"
+    )
+
+    def audit_summary(self) -> dict:
+        """Summary recorded in the audit log for the batch."""
+        return {
+            "status": self.status,
+            "processed": len(self.processed),
+            "processed_ids": [void.id for void in self.processed],
+            "skipped_ids": self.skipped_ids,
+            "not_found_ids": self.not_found_ids
+        }
+
+
+class VoidPage(BaseModel):
+    """One page of a keyset-paginated void listing."""
+    items: List[Void] = Field(..., description="Voids on this page")
+    next_after_id: Optional[int] = Field(
+        None,
+        description="Pass as after_id to get the next page"
+    )
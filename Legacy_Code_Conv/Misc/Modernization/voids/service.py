@@ -4,12 +4,16 @@ Void service implementation.
 from datetime import datetime
 from typing import List, Optional
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from ..database import Void as VoidDB
 from .models import (
     Void,
+    VoidBatchProcess,
+    VoidBatchResult,
     VoidCreate,
+    VoidPage,
     VoidUpdate
 )
 
@@ -17,7 +21,7 @@ from .models import (
 class VoidService:
     """Service for managing voids."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize service.
         
         Args:
@@ -80,10 +84,7 @@ class VoidService:
         Returns:
             Void if found, None otherwise
         """
-        void = await self.db.query(VoidDB).filter(
-            VoidDB.id == void_id
-        ).first()
-        
+        void = await self.db.get(VoidDB, void_id)
         return Void.from_orm(void) if void else None
 
     async def update_void(
@@ -106,9 +107,7 @@ class VoidService:
             HTTPException: If update fails
         """
         try:
-            db_void = await self.db.query(VoidDB).filter(
-                VoidDB.id == void_id
-            ).first()
+            db_void = await self.db.get(VoidDB, void_id)
             
             if not db_void:
                 return None
@@ -158,20 +157,88 @@ class VoidService:
             HTTPException: If processing fails
         """
         try:
-            db_void = await self.db.query(VoidDB).filter(
-                VoidDB.id == void_id
-            ).first()
+            row = (await self.db.execute(
+                update(VoidDB).where(
+                    VoidDB.id == void_id
+                ).values(
+                    status=status,
+                    updated_by=user,
+                    updated_at=datetime.utcnow()
+                ).returning(
+                    *VoidDB.__table__.columns
+                ).execution_options(synchronize_session=False)
+            )).mappings().first()
             
-            if not db_void:
-                return None
-                
-            db_void.status = status
-            db_void.updated_by = user
-            db_void.updated_at = datetime.utcnow()
+            return Void.parse_obj(dict(row)) if row else None
             
-            await self.db.flush()
-            await self.db.refresh(db_void)
-            return Void.from_orm(db_void)
+        except Exception as e:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=500,
+                detail=str(e)
+            )
+
+    async def process_voids(
+        self,
+        batch: VoidBatchProcess,
+        user: str
+    ) -> VoidBatchResult:
+        """Process many voids in one statement.
+        
+        Every void selected by id or claim number that is currently in one
+        of ``batch.from_statuses`` moves to ``batch.status`` in a single
+        UPDATE ... RETURNING. Requested ids that were not processed are
+        reported as skipped (wrong status) or not found.
+        
+        Args:
+            batch: Voids to process and the new status
+            user: Username
+            
+        Returns:
+            Processed voids and the ids left alone
+            
+        Raises:
+            HTTPException: If no voids are selected or processing fails
+        """
+        selectors = []
+        if batch.void_ids:
+            selectors.append(VoidDB.id.in_(batch.void_ids))
+        if batch.claim_numbers:
+            selectors.append(VoidDB.claim_number.in_(batch.claim_numbers))
+        if not selectors:
+            raise HTTPException(
+                status_code=400,
+                detail="No voids selected"
+            )
+            
+        try:
+            rows = (await self.db.execute(
+                update(VoidDB).where(
+                    or_(*selectors),
+                    VoidDB.status.in_(batch.from_statuses)
+                ).values(
+                    status=batch.status,
+                    updated_by=user,
+                    updated_at=datetime.utcnow()
+                ).returning(
+                    *VoidDB.__table__.columns
+                ).execution_options(synchronize_session=False)
+            )).mappings().all()
+            processed = [Void.parse_obj(dict(row)) for row in rows]
+            
+            unprocessed = set(batch.void_ids) - {void.id for void in processed}
+            existing = set()
+            if unprocessed:
+                existing = set((await self.db.execute(
+                    select(VoidDB.id).where(VoidDB.id.in_(unprocessed))
+                )).scalars().all())
+                
+            return VoidBatchResult(
+                status=batch.status,
+                processed=processed,
+                skipped_ids=sorted(existing),
+                not_found_ids=sorted(unprocessed - existing)
+            )
             
         except Exception as e:
             await self.db.rollback()
@@ -183,41 +250,71 @@ class VoidService:
     async def get_voids_by_claim(
         self,
         claim_number: str,
-        skip: int = 0,
+        after_id: Optional[int] = None,
         limit: int = 100
-    ) -> List[Void]:
+    ) -> VoidPage:
         """Get voids by claim number.
         
         Args:
             claim_number: Claim number
-            skip: Number of records to skip
+            after_id: Last id of the previous page
             limit: Maximum number of records
             
         Returns:
-            List of voids
+            Page of voids ordered by id
         """
-        voids = await self.db.query(VoidDB).filter(
-            VoidDB.claim_number == claim_number
-        ).offset(skip).limit(limit).all()
-        
-        return [Void.from_orm(v) for v in voids]
+        return await self._page(
+            VoidDB.claim_number == claim_number,
+            after_id,
+            limit
+        )
 
     async def get_pending_voids(
         self,
-        skip: int = 0,
+        after_id: Optional[int] = None,
         limit: int = 100
-    ) -> List[Void]:
+    ) -> VoidPage:
         """Get pending voids.
         
         Args:
-            skip: Number of records to skip
+            after_id: Last id of the previous page
+            limit: Maximum number of records
+            
+        Returns:
+            Page of pending voids ordered by id
+        """
+        return await self._page(
+            VoidDB.status == "pending",
+            after_id,
+            limit
+        )
+
+    async def _page(
+        self,
+        condition,
+        after_id: Optional[int],
+        limit: int
+    ) -> VoidPage:
+        """Keyset page of voids matching a condition.
+        
+        Args:
+            condition: Filter expression
+            after_id: Last id of the previous page
             limit: Maximum number of records
             
         Returns:
-            List of pending voids
+            Page of voids ordered by id
         """
-        voids = await self.db.query(VoidDB).filter(
-            VoidDB.status == "pending"
-        ).offset(skip).limit(limit).all()
+        query = select(VoidDB).where(condition)
+        if after_id is not None:
+            query = query.where(VoidDB.id > after_id)
+            
+        voids = (await self.db.execute(
+            query.order_by(VoidDB.id).limit(limit + 1)
+        )).scalars().all()
         
-        return [Void.from_orm(v) for v in voids]
+        items = [Void.from_orm(v) for v in voids[:limit]]
+        return VoidPage(
+            items=items,
+            next_after_id=items[-1].id if len(voids) > limit else None
+        )
@@ -8,11 +8,16 @@ from .models import (
     ResourceMetadata
 )
 from .client import SodaClient
+from .coalescing import close_coalescers
 from .auth import get_current_user, User
 from .monitoring import monitor
 from .config import settings
 
-router = APIRouter(prefix="/api/soda", tags=["soda"])
+router = APIRouter(
+    prefix="/api/soda",
+    tags=["soda"],
+    on_shutdown=[close_coalescers]
+)
 
 async def get_soda_client() -> SodaClient:
     """Get SODA client instance."""
@@ -164,12 +164,19 @@ async def search_forms(
     dmerc_service: Annotated[DMERCService, Depends(get_dmerc_service)]
 ) -> DMERCSearchResponse:
     """Search DMERC forms."""
-    forms, total = await dmerc_service.search_forms(
+    page = await dmerc_service.search_forms_page(
         current_user.organization_id,  # TODO: Handle multiple organizations
         params.search_term,
         form_type=params.form_type,
         status=params.status,
-        offset=params.offset,
-        limit=params.limit
+        prefix=params.prefix,
+        cursor=params.cursor,
+        limit=params.limit,
+        count_mode=params.count_mode
+    )
+    return DMERCSearchResponse(
+        forms=page.items,
+        total=page.total,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor
     )
-    return DMERCSearchResponse(forms=forms, total=total)
@@ -5,6 +5,7 @@ from datetime import datetime
 from uuid import UUID
 from pydantic import BaseModel, Field
 
+from ...core.database.pagination import CountMode
 from ...domain.models.dmerc import DMERCFormType, DMERCStatus
 
 class DMERCFormBase(BaseModel):
@@ -92,10 +93,14 @@ class DMERCSearchParams(BaseModel):
     search_term: str
     form_type: Optional[DMERCFormType] = None
     status: Optional[DMERCStatus] = None
-    offset: int = 0
-    limit: int = 100
+    prefix: bool = Field(False, description="Match form number/patient ID prefixes only")
+    cursor: Optional[str] = Field(None, description="Cursor from the previous page")
+    limit: int = Field(100, ge=1, le=500)
+    count_mode: CountMode = CountMode.ESTIMATE
 
 class DMERCSearchResponse(BaseModel):
     """DMERC search response schema."""
     forms: List[DMERCFormResponse]
-    total: int
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
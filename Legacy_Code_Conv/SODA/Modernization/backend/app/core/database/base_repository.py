@@ -1,14 +1,17 @@
 """Base repository for database operations."""
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+import asyncio
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 from uuid import UUID
-from sqlalchemy import select, update, delete, and_, or_
+from sqlalchemy import select, update, delete, and_, or_, func, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 from fastapi import HTTPException, status
 
 from ...domain.models.base import Base
 from .database import DatabaseService
+from .identity_map import get_identity_map
+from .pagination import CountMode, KeysetPage, decode_cursor, encode_cursor
 from ..cache import CacheService
 from ..logging import get_logger
 from ..metrics import MetricsService
@@ -37,6 +40,9 @@ class BaseRepository(Generic[T]):
         self.cache_prefix = f"{model.__name__.lower()}:"
         self.cache_ttl = 300  # 5 minutes
 
+        # Pagination settings
+        self.estimate_count_cap = 10000
+
     def _get_cache_key(self, id: Union[str, UUID]) -> str:
         """Get cache key for entity."""
         return f"{self.cache_prefix}{str(id)}"
@@ -52,8 +58,49 @@ class BaseRepository(Generic[T]):
             if self.metrics:
                 self.metrics.increment(f"{self.model.__name__.lower()}.cache.set")
 
+    async def _cache_entities(self, entities: Sequence[T]) -> None:
+        """Cache several entities in one pipelined write."""
+        if not self.cache_enabled or not entities:
+            return
+        mapping = {
+            self._get_cache_key(entity.id): entity.to_dict()
+            for entity in entities
+        }
+        if hasattr(self.cache, "set_many"):
+            await self.cache.set_many(mapping, self.cache_ttl)
+        else:
+            await asyncio.gather(*(
+                self.cache.set(key, value, self.cache_ttl)
+                for key, value in mapping.items()
+            ))
+        if self.metrics:
+            self.metrics.increment(
+                f"{self.model.__name__.lower()}.cache.set",
+                len(mapping)
+            )
+
+    async def _cache_get_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Read several cache keys in one round trip."""
+        if hasattr(self.cache, "get_many"):
+            return list(await self.cache.get_many(keys))
+        return list(await asyncio.gather(*(self.cache.get(key) for key in keys)))
+
+    def _remember(self, entity: Optional[T]) -> Optional[T]:
+        """Register entity in the request identity map, if one is active."""
+        identity_map = get_identity_map()
+        if identity_map is not None and entity is not None:
+            identity_map.add(entity)
+        return entity
+
+    def _forget(self, id: Union[str, UUID]) -> None:
+        """Drop entity from the request identity map, if one is active."""
+        identity_map = get_identity_map()
+        if identity_map is not None:
+            identity_map.discard(self.model, id)
+
     async def _invalidate_cache(self, id: Union[str, UUID]) -> None:
         """Invalidate entity cache."""
+        self._forget(id)
         if self.cache_enabled:
             await self.cache.delete(self._get_cache_key(id))
             if self.metrics:
@@ -67,20 +114,27 @@ class BaseRepository(Generic[T]):
     ) -> Optional[T]:
         """Get entity by ID."""
         try:
+            # Entities already loaded in this request are free
+            identity_map = get_identity_map()
+            if use_cache and identity_map is not None:
+                entity = identity_map.get(self.model, id)
+                if entity is not None:
+                    return entity
+
             # Check cache first
             if use_cache and self.cache_enabled:
                 cached_data = await self.cache.get(self._get_cache_key(id))
                 if cached_data:
                     if self.metrics:
                         self.metrics.increment(f"{self.model.__name__.lower()}.cache.hit")
-                    return self.model(**cached_data)
+                    return self._remember(self.model(**cached_data))
 
             # Get from database
             async with self.db.session() as session:
                 result = await session.get(self.model, id)
                 if result:
                     await self._cache_entity(result)
-                return result
+                return self._remember(result)
 
         except Exception as e:
             self.logger.error(f"Error getting {self.model.__name__} by ID: {str(e)}", exc_info=True)
@@ -91,6 +145,93 @@ class BaseRepository(Generic[T]):
                 detail=f"Error retrieving {self.model.__name__}"
             )
 
+    async def get_many(
+        self,
+        ids: Sequence[Union[str, UUID]],
+        *,
+        use_cache: bool = True
+    ) -> List[Optional[T]]:
+        """
+        Get entities by ID in input order.
+
+        Resolves the request identity map, then one cache multi-get, then
+        one ``WHERE id IN (...)`` query for the remaining misses, and
+        back-fills the cache in a single pipelined write. Missing IDs
+        yield ``None`` at their position.
+        """
+        try:
+            found: Dict[str, T] = {}
+            pending = list(dict.fromkeys(str(id) for id in ids))
+            identity_map = get_identity_map()
+
+            if use_cache and identity_map is not None:
+                for key in pending:
+                    entity = identity_map.get(self.model, key)
+                    if entity is not None:
+                        found[key] = entity
+                pending = [key for key in pending if key not in found]
+
+            if pending and use_cache and self.cache_enabled:
+                cached = await self._cache_get_many(
+                    [self._get_cache_key(key) for key in pending]
+                )
+                for key, cached_data in zip(pending, cached):
+                    if cached_data:
+                        found[key] = self._remember(self.model(**cached_data))
+                if self.metrics:
+                    hits = sum(1 for cached_data in cached if cached_data)
+                    self.metrics.increment(f"{self.model.__name__.lower()}.cache.hit", hits)
+                    self.metrics.increment(
+                        f"{self.model.__name__.lower()}.cache.miss",
+                        len(pending) - hits
+                    )
+                pending = [key for key in pending if key not in found]
+
+            keys_by_id = self._primary_keys(pending)
+            if keys_by_id:
+                query = select(self.model).where(
+                    self.model.id.in_(list(keys_by_id))
+                )
+                async with self.db.session() as session:
+                    result = await session.execute(query)
+                    loaded = list(result.scalars().all())
+                for entity in loaded:
+                    found[keys_by_id.get(entity.id, str(entity.id))] = self._remember(entity)
+                await self._cache_entities(loaded)
+
+            return [found.get(str(id)) for id in ids]
+
+        except Exception as e:
+            self.logger.error(f"Error getting {self.model.__name__}s by ID: {str(e)}", exc_info=True)
+            if self.metrics:
+                self.metrics.increment(f"{self.model.__name__.lower()}.error.get_many")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error retrieving {self.model.__name__}s"
+            )
+
+    def _primary_keys(self, keys: Sequence[str]) -> Dict[Any, str]:
+        """
+        Map string keys to primary key values.
+
+        Keys are converted only for UUID and integer primary keys; keys
+        that do not parse cannot match a row and are left out.
+        """
+        try:
+            python_type = self.model.id.type.python_type
+        except NotImplementedError:
+            return {key: key for key in keys}
+        if python_type not in (UUID, int):
+            return {key: key for key in keys}
+
+        keys_by_id: Dict[Any, str] = {}
+        for key in keys:
+            try:
+                keys_by_id[python_type(key)] = key
+            except ValueError:
+                continue
+        return keys_by_id
+
     async def find_one(
         self,
         *conditions: Any,
@@ -197,6 +338,7 @@ class BaseRepository(Generic[T]):
                     
                     # Update cache
                     await self._cache_entity(instance)
+                    self._forget(id)
                     
                     if self.metrics:
                         self.metrics.increment(f"{self.model.__name__.lower()}.updated")
@@ -251,7 +393,7 @@ class BaseRepository(Generic[T]):
     ) -> int:
         """Count entities matching conditions."""
         try:
-            query = select(self.model)
+            query = select(func.count()).select_from(self.model)
             if conditions:
                 query = query.where(and_(*conditions))
             if filters:
@@ -259,7 +401,7 @@ class BaseRepository(Generic[T]):
 
             async with self.db.session() as session:
                 result = await session.execute(query)
-                return len(result.scalars().all())
+                return int(result.scalar_one())
 
         except Exception as e:
             self.logger.error(f"Error counting {self.model.__name__}s: {str(e)}", exc_info=True)
@@ -270,6 +412,122 @@ class BaseRepository(Generic[T]):
                 detail=f"Error counting {self.model.__name__}s"
             )
 
+    async def estimate_count(
+        self,
+        *conditions: Any,
+        **filters: Any
+    ) -> Tuple[int, bool]:
+        """
+        Estimate entities matching conditions.
+
+        Unfiltered counts come from planner statistics; filtered counts
+        stop at ``estimate_count_cap``. Returns the count and whether it
+        is an estimate rather than exact.
+        """
+        try:
+            async with self.db.session() as session:
+                if not conditions and not filters:
+                    result = await session.execute(
+                        text(
+                            "SELECT reltuples::bigint FROM pg_class "
+                            "WHERE oid = to_regclass(:table)"
+                        ),
+                        {"table": self.model.__tablename__}
+                    )
+                    estimate = result.scalar_one_or_none()
+                    if estimate is not None and estimate >= 0:
+                        return int(estimate), True
+
+                capped = select(self.model.id)
+                if conditions:
+                    capped = capped.where(and_(*conditions))
+                if filters:
+                    capped = capped.filter_by(**filters)
+                capped = capped.limit(self.estimate_count_cap).subquery()
+
+                result = await session.execute(
+                    select(func.count()).select_from(capped)
+                )
+                total = int(result.scalar_one())
+                return total, total >= self.estimate_count_cap
+
+        except Exception as e:
+            self.logger.error(f"Error estimating {self.model.__name__}s: {str(e)}", exc_info=True)
+            if self.metrics:
+                self.metrics.increment(f"{self.model.__name__.lower()}.error.estimate_count")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error counting {self.model.__name__}s"
+            )
+
+    async def find_page(
+        self,
+        *conditions: Any,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        order_by: Sequence[str] = ("created_at", "id"),
+        descending: bool = True,
+        count_mode: CountMode = CountMode.NONE,
+        **filters: Any
+    ) -> KeysetPage[T]:
+        """
+        Find a page of entities using keyset (seek) pagination.
+
+        The cursor carries the sort-key values of the previous page's last
+        row, so every page is an index range scan regardless of depth.
+        ``order_by`` must end with a unique column.
+        """
+        try:
+            columns = [getattr(self.model, name) for name in order_by]
+            query = select(self.model)
+            if conditions:
+                query = query.where(and_(*conditions))
+            if filters:
+                query = query.filter_by(**filters)
+
+            page_query = query
+            if cursor:
+                values = decode_cursor(cursor, len(columns))
+                if descending:
+                    page_query = page_query.where(tuple_(*columns) < tuple_(*values))
+                else:
+                    page_query = page_query.where(tuple_(*columns) > tuple_(*values))
+
+            page_query = page_query.order_by(
+                *(column.desc() if descending else column.asc() for column in columns)
+            ).limit(limit + 1)
+
+            async with self.db.session() as session:
+                result = await session.execute(page_query)
+                items = list(result.scalars().all())
+
+            page = KeysetPage[T](items=items[:limit])
+            if len(items) > limit:
+                last = page.items[-1]
+                page.next_cursor = encode_cursor(
+                    [getattr(last, name) for name in order_by]
+                )
+
+            if count_mode == CountMode.EXACT:
+                page.total = await self.count(*conditions, **filters)
+            elif count_mode == CountMode.ESTIMATE:
+                page.total, page.total_is_estimate = await self.estimate_count(
+                    *conditions, **filters
+                )
+
+            return page
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error paging {self.model.__name__}s: {str(e)}", exc_info=True)
+            if self.metrics:
+                self.metrics.increment(f"{self.model.__name__.lower()}.error.find_page")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error finding {self.model.__name__}s"
+            )
+
     def build_query(self) -> Select:
         """Build base query for model."""
         return select(self.model)
@@ -0,0 +1,60 @@
+"""Request-scoped identity map for repository lookups."""
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncGenerator, Dict, Optional, Tuple, Type, Union
+from uuid import UUID
+
+from ...domain.models.base import Base
+
+_current_identity_map: ContextVar[Optional["IdentityMap"]] = ContextVar(
+    "identity_map",
+    default=None
+)
+
+
+class IdentityMap:
+    """Holds entities already loaded during the current request."""
+
+    def __init__(self):
+        """Initialize identity map."""
+        self._entities: Dict[Tuple[Type[Base], str], Base] = {}
+
+    def _key(self, model: Type[Base], id: Union[str, UUID]) -> Tuple[Type[Base], str]:
+        """Get identity key for entity."""
+        return (model, str(id))
+
+    def get(self, model: Type[Base], id: Union[str, UUID]) -> Optional[Base]:
+        """Get entity if already loaded in this request."""
+        return self._entities.get(self._key(model, id))
+
+    def add(self, entity: Base) -> None:
+        """Register loaded entity."""
+        self._entities[self._key(type(entity), entity.id)] = entity
+
+    def discard(self, model: Type[Base], id: Union[str, UUID]) -> None:
+        """Forget entity, e.g. after update or delete."""
+        self._entities.pop(self._key(model, id), None)
+
+    def clear(self) -> None:
+        """Forget all entities."""
+        self._entities.clear()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+
+def get_identity_map() -> Optional[IdentityMap]:
+    """Get identity map for the current request, if one is active."""
+    return _current_identity_map.get()
+
+
+@asynccontextmanager
+async def identity_map_scope() -> AsyncGenerator[IdentityMap, None]:
+    """Activate a fresh identity map for the enclosed request or job."""
+    identity_map = IdentityMap()
+    token = _current_identity_map.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _current_identity_map.reset(token)
@@ -0,0 +1,56 @@
+"""DMERC search and keyset pagination indexes
+
+Revision ID: dmerc_search_indexes
+Revises: domain_entities
+Create Date: 2025-01-20 10:00
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'dmerc_search_indexes'
+down_revision: str = 'domain_entities'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create search and keyset pagination indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Keyset pagination: (organization_id, created_at DESC, id DESC)
+    op.create_index(
+        'ix_dmerc_forms_org_created_id',
+        'dmerc_forms',
+        ['organization_id', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+    # Substring (ILIKE '%term%') search
+    op.execute(
+        "CREATE INDEX ix_dmerc_forms_form_number_trgm ON dmerc_forms "
+        "USING gin (form_number gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_dmerc_forms_patient_id_trgm ON dmerc_forms "
+        "USING gin (patient_id gin_trgm_ops)"
+    )
+
+    # Prefix (lower(col) LIKE 'term%') search
+    op.execute(
+        "CREATE INDEX ix_dmerc_forms_form_number_prefix ON dmerc_forms "
+        "(lower(form_number) varchar_pattern_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_dmerc_forms_patient_id_prefix ON dmerc_forms "
+        "(lower(patient_id) varchar_pattern_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop search and keyset pagination indexes."""
+    op.drop_index('ix_dmerc_forms_patient_id_prefix', table_name='dmerc_forms')
+    op.drop_index('ix_dmerc_forms_form_number_prefix', table_name='dmerc_forms')
+    op.drop_index('ix_dmerc_forms_patient_id_trgm', table_name='dmerc_forms')
+    op.drop_index('ix_dmerc_forms_form_number_trgm', table_name='dmerc_forms')
+    op.drop_index('ix_dmerc_forms_org_created_id', table_name='dmerc_forms')
@@ -0,0 +1,38 @@
+"""DMERC form number sequences
+
+Revision ID: dmerc_form_sequences
+Revises: dmerc_search_indexes
+Create Date: 2025-01-20 11:00
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'dmerc_form_sequences'
+down_revision: str = 'dmerc_search_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create form number sequence table."""
+    op.create_table(
+        'dmerc_form_sequences',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('form_type', postgresql.ENUM('cmn', 'dif', 'authorization', 'prescription', 'order', name='dmerc_form_type', create_type=False), nullable=False),
+        sa.Column('sequence_date', sa.Date, nullable=False),
+        sa.Column('last_value', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now()),
+
+        sa.UniqueConstraint('organization_id', 'form_type', 'sequence_date', name='uq_dmerc_form_sequences_key'),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE')
+    )
+
+
+def downgrade() -> None:
+    """Drop form number sequence table."""
+    op.drop_table('dmerc_form_sequences')
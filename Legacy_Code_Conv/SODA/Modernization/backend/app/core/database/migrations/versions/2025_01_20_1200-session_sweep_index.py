@@ -0,0 +1,30 @@
+"""Session sweep index
+
+Revision ID: session_sweep_index
+Revises: dmerc_form_sequences
+Create Date: 2025-01-20 12:00
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'session_sweep_index'
+down_revision: str = 'dmerc_form_sequences'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create partial index for sweeping invalidated sessions."""
+    op.create_index(
+        'ix_sessions_inactive_expires_at',
+        'sessions',
+        ['expires_at'],
+        postgresql_where=sa.text('is_active = false')
+    )
+
+
+def downgrade() -> None:
+    """Drop partial index for sweeping invalidated sessions."""
+    op.drop_index('ix_sessions_inactive_expires_at', table_name='sessions')
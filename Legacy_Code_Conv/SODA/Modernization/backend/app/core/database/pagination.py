@@ -0,0 +1,81 @@
+"""Keyset pagination helpers for repositories."""
+
+import base64
+import enum
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+T = TypeVar("T")
+
+
+class CountMode(str, enum.Enum):
+    """How a page reports the total number of matching rows."""
+    NONE = "none"
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """A page of results with an opaque cursor for the next page."""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+
+    @property
+    def has_more(self) -> bool:
+        """Whether another page follows."""
+        return self.next_cursor is not None
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode key value for a cursor."""
+    if isinstance(value, datetime):
+        return {"t": "dt", "v": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"t": "uuid", "v": str(value)}
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    """Decode key value from a cursor."""
+    if isinstance(value, dict):
+        if value.get("t") == "dt":
+            return datetime.fromisoformat(value["v"])
+        if value.get("t") == "uuid":
+            return UUID(value["v"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort-key values of the last row into an opaque cursor."""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, expected_length: int) -> List[Any]:
+    """Decode an opaque cursor into sort-key values."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != expected_length:
+            raise ValueError("cursor does not match sort key")
+        return [_decode_value(value) for value in values]
+    except (ValueError, TypeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid pagination cursor: {str(e)}"
+        )
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE wildcards in user-supplied search terms."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -3,9 +3,11 @@
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from uuid import UUID
+import asyncio
 import secrets
+import time
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, delete, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...domain.models.session import Session
@@ -36,6 +38,8 @@ class SessionService:
         # Session configuration
         self.session_ttl = timedelta(hours=24)
         self.cleanup_batch_size = 1000
+        self.cleanup_time_budget = 30.0  # seconds per sweep
+        self.cleanup_window = timedelta(hours=1)
         self.token_length = 64
         self.cache_ttl = 300  # 5 minutes
 
@@ -196,40 +200,109 @@ class SessionService:
 
     async def cleanup_expired_sessions(
         self,
-        batch_size: Optional[int] = None
+        batch_size: Optional[int] = None,
+        *,
+        time_budget: Optional[float] = None,
+        window: Optional[timedelta] = None
     ) -> int:
-        """Clean up expired sessions."""
+        """
+        Clean up expired and inactive sessions.
+
+        Expired sessions are swept oldest first in ``window``-sized slices
+        of ``expires_at`` that end at the sweep start, so the sweep only
+        ever range-scans rows that were already expired. Each batch is one
+        ``DELETE ... RETURNING token`` followed by one multi-key cache
+        eviction. Sweeping stops when drained, when a batch deletes nothing
+        because every candidate is locked by another worker, or when
+        ``time_budget`` seconds have elapsed.
+        """
         batch = batch_size or self.cleanup_batch_size
+        budget = self.cleanup_time_budget if time_budget is None else time_budget
+        window = window or self.cleanup_window
+        deadline = time.monotonic() + budget
+        cutoff = datetime.utcnow()
         cleaned = 0
-        
+
         try:
-            async with self.db.session() as db_session:
-                # Get expired sessions
-                query = select(Session).where(
-                    or_(
-                        Session.expires_at <= datetime.utcnow(),
-                        Session.is_active == False
-                    )
-                ).limit(batch)
-                
-                result = await db_session.execute(query)
-                expired_sessions = list(result.scalars().all())
-                
-                # Remove sessions and their cache entries
-                for session in expired_sessions:
-                    await db_session.delete(session)
-                    await self.cache.delete(f"session:{session.token}")
-                    cleaned += 1
-                
-                await db_session.commit()
-                
-                self.metrics.gauge("session.cleaned", cleaned)
-                return cleaned
+            # Expired sessions, one expiry window at a time
+            lower = await self._oldest_expiry(cutoff)
+            while lower is not None and time.monotonic() < deadline:
+                upper = min(lower + window, cutoff)
+                deleted = await self._sweep_batch(
+                    and_(
+                        Session.expires_at >= lower,
+                        Session.expires_at < upper
+                    ),
+                    batch
+                )
+                cleaned += deleted
+                if deleted == 0:
+                    # Remaining rows are locked by another sweeper
+                    break
+                if deleted < batch:
+                    # Window drained; skip straight to the next expired row
+                    lower = await self._oldest_expiry(cutoff)
+
+            # Explicitly invalidated sessions that have not expired yet
+            while time.monotonic() < deadline:
+                deleted = await self._sweep_batch(
+                    and_(
+                        Session.is_active == False,
+                        Session.expires_at >= cutoff
+                    ),
+                    batch
+                )
+                cleaned += deleted
+                if deleted < batch:
+                    break
+
+            self.metrics.gauge("session.cleaned", cleaned)
+            return cleaned
 
         except Exception as e:
             self.logger.error(f"Error cleaning up sessions: {str(e)}", exc_info=True)
             self.metrics.increment("session.cleanup_error")
-            return 0
+            return cleaned
+
+    async def _oldest_expiry(self, cutoff: datetime) -> Optional[datetime]:
+        """Get the oldest expiry before cutoff using the expires_at index."""
+        async with self.db.session() as db_session:
+            result = await db_session.execute(
+                select(func.min(Session.expires_at)).where(
+                    Session.expires_at < cutoff
+                )
+            )
+            return result.scalar_one_or_none()
+
+    async def _sweep_batch(self, condition: Any, batch_size: int) -> int:
+        """Delete one batch of sessions and evict their cache entries."""
+        doomed = (
+            select(Session.id)
+            .where(condition)
+            .order_by(Session.expires_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        statement = (
+            delete(Session)
+            .where(Session.id.in_(doomed))
+            .returning(Session.token)
+            .execution_options(synchronize_session=False)
+        )
+
+        async with self.db.session() as db_session:
+            result = await db_session.execute(statement)
+            tokens = list(result.scalars().all())
+            await db_session.commit()
+
+        if tokens:
+            keys = [f"session:{token}" for token in tokens]
+            if hasattr(self.cache, "delete_many"):
+                await self.cache.delete_many(keys)
+            else:
+                await asyncio.gather(*(self.cache.delete(key) for key in keys))
+        return len(tokens)
 
     async def extend_session(
         self,
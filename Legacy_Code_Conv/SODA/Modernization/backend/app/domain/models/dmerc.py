@@ -1,8 +1,11 @@
 """DMERC models for AriesOne SaaS platform."""
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List, Dict, Any
-from sqlalchemy import String, DateTime, JSON, ForeignKey, Enum as SQLAEnum, Text
+from sqlalchemy import (
+    String, Date, DateTime, Integer, JSON, ForeignKey, Enum as SQLAEnum, Text,
+    UniqueConstraint
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 from uuid import UUID
@@ -169,3 +172,33 @@ class DMERCHistory(Base):
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat()
         }
+
+class DMERCFormSequence(Base):
+    """Per-organization, per-type, per-day form number counter."""
+
+    __tablename__ = "dmerc_form_sequences"
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id",
+            "form_type",
+            "sequence_date",
+            name="uq_dmerc_form_sequences_key"
+        ),
+    )
+
+    organization_id: Mapped[UUID] = mapped_column(ForeignKey("organizations.id"))
+    form_type: Mapped[DMERCFormType] = mapped_column(SQLAEnum(DMERCFormType))
+    sequence_date: Mapped[date] = mapped_column(Date)
+    last_value: Mapped[int] = mapped_column(Integer, default=0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert sequence to dictionary."""
+        return {
+            "id": str(self.id),
+            "organization_id": str(self.organization_id),
+            "form_type": self.form_type.value,
+            "sequence_date": self.sequence_date.isoformat(),
+            "last_value": self.last_value,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat()
+        }
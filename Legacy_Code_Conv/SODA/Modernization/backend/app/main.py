@@ -1,11 +1,12 @@
 """Main FastAPI application."""
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api.routes import api_router
 from .api.docs.api_docs import get_openapi_schema
 from .core.config import settings
+from .core.database.identity_map import identity_map_scope
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -37,6 +38,12 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
+@app.middleware("http")
+async def identity_map_middleware(request: Request, call_next):
+    """Scope repository identity map to a single request."""
+    async with identity_map_scope():
+        return await call_next(request)
+
 # Include API routes
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
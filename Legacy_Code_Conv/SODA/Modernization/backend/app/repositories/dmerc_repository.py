@@ -2,12 +2,14 @@
 
 from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
-from datetime import datetime
-from sqlalchemy import select, and_, or_, desc
+from datetime import date, datetime
+from sqlalchemy import select, and_, or_, desc, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql import Select
 
 from ..core.database.base_repository import BaseRepository
 from ..core.database.database import DatabaseService
+from ..core.database.pagination import CountMode, KeysetPage, escape_like
 from ..core.cache import CacheService
 from ..core.metrics import MetricsService
 from ..domain.models.dmerc import (
@@ -15,7 +17,8 @@ from ..domain.models.dmerc import (
     DMERCFormType,
     DMERCStatus,
     DMERCAttachment,
-    DMERCHistory
+    DMERCHistory,
+    DMERCFormSequence
 )
 
 class DMERCRepository(BaseRepository[DMERCForm]):
@@ -99,6 +102,46 @@ class DMERCRepository(BaseRepository[DMERCForm]):
             limit=limit
         )
 
+    async def reserve_sequence_block(
+        self,
+        organization_id: UUID,
+        form_type: DMERCFormType,
+        sequence_date: date,
+        block_size: int
+    ) -> Tuple[int, int]:
+        """
+        Atomically reserve a block of form sequence values.
+
+        A single upsert bumps the counter row by ``block_size`` and returns
+        the new upper bound, so concurrent callers always receive disjoint
+        ranges. Returns the inclusive (first, last) values of the block.
+        """
+        statement = (
+            insert(DMERCFormSequence)
+            .values(
+                organization_id=organization_id,
+                form_type=form_type,
+                sequence_date=sequence_date,
+                last_value=block_size
+            )
+            .on_conflict_do_update(
+                constraint="uq_dmerc_form_sequences_key",
+                set_={
+                    "last_value": DMERCFormSequence.last_value + block_size,
+                    "updated_at": func.now()
+                }
+            )
+            .returning(DMERCFormSequence.last_value)
+        )
+
+        async with self.db.transaction() as session:
+            result = await session.execute(statement)
+            last = int(result.scalar_one())
+
+        if self.metrics:
+            self.metrics.increment("dmerc.sequence.block_reserved")
+        return last - block_size + 1, last
+
     async def update_status(
         self,
         form_id: UUID,
@@ -244,6 +287,47 @@ class DMERCRepository(BaseRepository[DMERCForm]):
                 self.metrics.increment("dmerc.error.get_attachments")
             return []
 
+    def _search_conditions(
+        self,
+        organization_id: UUID,
+        search_term: str,
+        form_type: Optional[DMERCFormType] = None,
+        status: Optional[DMERCStatus] = None,
+        prefix: bool = False
+    ) -> List[Any]:
+        """
+        Build search conditions.
+
+        Prefix searches compare ``lower(column) LIKE 'term%'`` and use the
+        lower(...) pattern-ops indexes; substring searches use ILIKE, which
+        is served by the pg_trgm GIN indexes.
+        """
+        conditions = [DMERCForm.organization_id == organization_id]
+
+        term = escape_like(search_term)
+        if prefix:
+            pattern = f"{term.lower()}%"
+            conditions.append(
+                or_(
+                    func.lower(DMERCForm.form_number).like(pattern, escape="\\"),
+                    func.lower(DMERCForm.patient_id).like(pattern, escape="\\")
+                )
+            )
+        else:
+            pattern = f"%{term}%"
+            conditions.append(
+                or_(
+                    DMERCForm.form_number.ilike(pattern, escape="\\"),
+                    DMERCForm.patient_id.ilike(pattern, escape="\\")
+                )
+            )
+
+        if form_type:
+            conditions.append(DMERCForm.form_type == form_type)
+        if status:
+            conditions.append(DMERCForm.status == status)
+        return conditions
+
     async def search_forms(
         self,
         organization_id: UUID,
@@ -255,33 +339,23 @@ class DMERCRepository(BaseRepository[DMERCForm]):
     ) -> Tuple[List[DMERCForm], int]:
         """Search forms with filters."""
         try:
-            conditions = [DMERCForm.organization_id == organization_id]
-            
-            # Add search condition
-            search_pattern = f"%{search_term}%"
-            conditions.append(
-                or_(
-                    DMERCForm.form_number.ilike(search_pattern),
-                    DMERCForm.patient_id.ilike(search_pattern)
-                )
+            conditions = self._search_conditions(
+                organization_id,
+                search_term,
+                form_type=form_type,
+                status=status
             )
-            
-            # Add filters
-            if form_type:
-                conditions.append(DMERCForm.form_type == form_type)
-            if status:
-                conditions.append(DMERCForm.status == status)
-            
+
             # Get total count
             total = await self.count(*conditions)
-            
+
             # Get paginated results
             forms = await self.find_many(
                 *conditions,
                 offset=offset,
                 limit=limit
             )
-            
+
             return forms, total
 
         except Exception as e:
@@ -289,3 +363,30 @@ class DMERCRepository(BaseRepository[DMERCForm]):
             if self.metrics:
                 self.metrics.increment("dmerc.error.search")
             return [], 0
+
+    async def search_forms_page(
+        self,
+        organization_id: UUID,
+        search_term: str,
+        form_type: Optional[DMERCFormType] = None,
+        status: Optional[DMERCStatus] = None,
+        *,
+        prefix: bool = False,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.ESTIMATE
+    ) -> KeysetPage[DMERCForm]:
+        """Search forms with keyset pagination, newest first."""
+        conditions = self._search_conditions(
+            organization_id,
+            search_term,
+            form_type=form_type,
+            status=status,
+            prefix=prefix
+        )
+        return await self.find_page(
+            *conditions,
+            cursor=cursor,
+            limit=limit,
+            count_mode=count_mode
+        )
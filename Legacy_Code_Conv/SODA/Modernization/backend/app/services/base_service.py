@@ -39,6 +39,16 @@ class BaseService(Generic[T]):
             )
         return entity
 
+    async def get_many(
+        self,
+        ids: List[Union[str, UUID]],
+        *,
+        use_cache: bool = True
+    ) -> List[T]:
+        """Get entities by ID in input order, skipping IDs that don't exist."""
+        entities = await self.repository.get_many(ids, use_cache=use_cache)
+        return [entity for entity in entities if entity is not None]
+
     async def find_one(
         self,
         *conditions: Any,
@@ -6,6 +6,7 @@ from datetime import datetime
 from fastapi import HTTPException, status
 
 from ..core.metrics import MetricsService
+from ..core.database.pagination import CountMode, KeysetPage
 from ..repositories.dmerc_repository import DMERCRepository
 from ..domain.models.dmerc import (
     DMERCForm,
@@ -15,6 +16,7 @@ from ..domain.models.dmerc import (
     DMERCHistory
 )
 from .base_service import BaseService
+from .form_number_allocator import FormNumberAllocator
 
 class DMERCService(BaseService[DMERCForm]):
     """Service for DMERC form operations."""
@@ -22,11 +24,13 @@ class DMERCService(BaseService[DMERCForm]):
     def __init__(
         self,
         repository: DMERCRepository,
-        metrics: Optional[MetricsService] = None
+        metrics: Optional[MetricsService] = None,
+        form_numbers: Optional[FormNumberAllocator] = None
     ):
         """Initialize DMERC service."""
         super().__init__(repository, metrics)
         self.repository: DMERCRepository = repository
+        self.form_numbers = form_numbers or FormNumberAllocator(repository, metrics=metrics)
 
     def validate_data(self, data: Dict[str, Any]) -> None:
         """Validate DMERC form data."""
@@ -280,22 +284,50 @@ class DMERCService(BaseService[DMERCForm]):
             limit=limit
         )
 
+    async def search_forms_page(
+        self,
+        organization_id: UUID,
+        search_term: str,
+        form_type: Optional[DMERCFormType] = None,
+        status: Optional[DMERCStatus] = None,
+        *,
+        prefix: bool = False,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.ESTIMATE
+    ) -> KeysetPage[DMERCForm]:
+        """Search forms with keyset pagination."""
+        return await self.repository.search_forms_page(
+            organization_id,
+            search_term,
+            form_type=form_type,
+            status=status,
+            prefix=prefix,
+            cursor=cursor,
+            limit=limit,
+            count_mode=count_mode
+        )
+
     async def _generate_form_number(
         self,
         organization_id: UUID,
         form_type: DMERCFormType
     ) -> str:
         """Generate unique form number."""
-        # Get count of forms for this org and type
-        count = await self.repository.count(
-            DMERCForm.organization_id == organization_id,
-            DMERCForm.form_type == form_type
+        if not isinstance(organization_id, UUID):
+            organization_id = UUID(str(organization_id))
+        form_type = DMERCFormType(form_type)
+        today = datetime.utcnow().date()
+        sequence = await self.form_numbers.next_value(
+            organization_id,
+            form_type,
+            today
         )
 
         # Format: ORG-TYPE-YYYYMMDD-SEQUENCE
         return (
             f"{organization_id.hex[:6]}-"
             f"{form_type.value}-"
-            f"{datetime.utcnow().strftime('%Y%m%d')}-"
-            f"{count + 1:04d}"
+            f"{today.strftime('%Y%m%d')}-"
+            f"{sequence:04d}"
         )
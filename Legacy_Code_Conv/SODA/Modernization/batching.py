@@ -0,0 +1,163 @@
+"""
+Batched upsert writer for the SODA client.
+"""
+from typing import Optional, List, Dict, Any, Iterator, TYPE_CHECKING
+import httpx
+import asyncio
+import json
+import random
+from datetime import datetime
+import logging
+from .models import SodaError, SodaChunkResult, SodaBatchResult
+
+if TYPE_CHECKING:
+    from .client import SodaClient
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class UpsertBatchWriter:
+    """
+    Splits large upsert payloads into size-bounded chunks and submits
+    them concurrently, retrying each chunk independently.
+    """
+
+    def __init__(
+        self,
+        client: "SodaClient",
+        batch_size: Optional[int] = None,
+        max_batch_bytes: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        backoff: Optional[float] = None
+    ):
+        """Initialize batch writer from the client configuration."""
+        config = client.config
+        self.client = client
+        self.batch_size = batch_size or config.upsert_batch_size
+        self.max_batch_bytes = max_batch_bytes or config.upsert_batch_max_bytes
+        self.concurrency = concurrency or config.upsert_concurrency
+        self.max_retries = max_retries or config.max_retries
+        self.backoff = (
+            config.upsert_retry_backoff if backoff is None else backoff
+        )
+
+    def chunk(self, records: List[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield chunks bounded by record count and serialized size.
+
+        A single record larger than the byte limit is sent on its own.
+        """
+        current: List[Dict[str, Any]] = []
+        current_bytes = 2  # enclosing brackets
+        for record in records:
+            record_bytes = len(json.dumps(record, default=str)) + 1
+            if current and (
+                len(current) >= self.batch_size
+                or current_bytes + record_bytes > self.max_batch_bytes
+            ):
+                yield current
+                current, current_bytes = [], 2
+            current.append(record)
+            current_bytes += record_bytes
+        if current:
+            yield current
+
+    async def write(
+        self,
+        dataset_id: str,
+        records: List[Dict[str, Any]]
+    ) -> SodaBatchResult:
+        """
+        Upsert records in chunks and aggregate per-chunk results.
+        """
+        start_time = datetime.now()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        url = f"/resource/{dataset_id}"
+
+        chunks = await asyncio.gather(*(
+            self._submit_chunk(index, url, chunk, semaphore)
+            for index, chunk in enumerate(self.chunk(records))
+        ))
+
+        result = SodaBatchResult(
+            dataset_id=dataset_id,
+            total_records=len(records),
+            chunks=list(chunks)
+        )
+        for chunk in result.chunks:
+            if not chunk.succeeded or not chunk.response:
+                continue
+            result.rows_created += int(chunk.response.get("Rows Created", 0))
+            result.rows_updated += int(chunk.response.get("Rows Updated", 0))
+            result.rows_deleted += int(chunk.response.get("Rows Deleted", 0))
+            result.row_errors += int(chunk.response.get("Errors", 0))
+
+        result.request_time = (datetime.now() - start_time).total_seconds()
+        if result.failed_chunks:
+            logger.error(
+                f"SODA upsert to {dataset_id}: "
+                f"{len(result.failed_chunks)}/{len(result.chunks)} chunks failed"
+            )
+        return result
+
+    async def _submit_chunk(
+        self,
+        index: int,
+        url: str,
+        chunk: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore
+    ) -> SodaChunkResult:
+        """
+        Post one chunk, retrying transport errors and retryable statuses
+        with exponential backoff and jitter.
+        """
+        result = SodaChunkResult(index=index, size=len(chunk))
+        async with semaphore:
+            while result.attempts < self.max_retries:
+                result.attempts += 1
+                delay = self.backoff * (2 ** (result.attempts - 1))
+                try:
+                    response = await self.client.client.post(url, json=chunk)
+                    response.raise_for_status()
+                    body = response.json()
+                    result.response = body if isinstance(body, dict) else {"data": body}
+                    result.succeeded = True
+                    result.error = None
+                    return result
+                except httpx.HTTPStatusError as e:
+                    result.error = self._to_error(e.response, e)
+                    if e.response.status_code not in RETRYABLE_STATUS_CODES:
+                        return result
+                    retry_after = e.response.headers.get("Retry-After")
+                    if retry_after and retry_after.isdigit():
+                        delay = max(delay, float(retry_after))
+                except httpx.RequestError as e:
+                    result.error = SodaError(code="request_error", message=str(e))
+
+                if result.attempts < self.max_retries:
+                    await asyncio.sleep(delay + random.uniform(0, delay / 2))
+
+        logger.error(
+            f"SODA upsert chunk {index} failed after {result.attempts} attempts: "
+            f"{result.error.message if result.error else 'unknown error'}"
+        )
+        return result
+
+    @staticmethod
+    def _to_error(response: httpx.Response, exc: Exception) -> SodaError:
+        """Build a SodaError from a failed HTTP response."""
+        try:
+            details = response.json()
+        except ValueError:
+            details = {"body": response.text}
+        if not isinstance(details, dict):
+            details = {"body": details}
+        return SodaError(
+            code=str(response.status_code),
+            message=details.get("message", str(exc)),
+            details=details,
+            request_id=response.headers.get("X-Request-Id")
+        )
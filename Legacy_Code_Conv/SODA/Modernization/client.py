@@ -1,21 +1,34 @@
 """
 SODA (Socrata Open Data API) client implementation.
 """
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 import httpx
 import asyncio
 import json
+import time
 from datetime import datetime
 import logging
 from .models import (
     SodaConfig, SodaResponse, SodaError, ResourceMetadata,
-    SoqlQuery, SodaDataFormat
+    SoqlQuery, SodaDataFormat, SodaBatchResult
 )
+from .batching import UpsertBatchWriter
+from .coalescing import RequestCoalescer, get_coalescer
 from .cache import cache_manager
 from .monitoring import monitor
 
 logger = logging.getLogger(__name__)
 
+# Settings that change what a coalesced read returns or how it is fetched
+READ_SETTINGS = {
+    "domain", "app_token", "username", "password", "timeout", "max_retries",
+    "verify_ssl", "cache_enabled", "cache_ttl", "metadata_lru_size", "user_agent"
+}
+
+def coalescer_key(config: SodaConfig) -> Tuple[Tuple[str, Any], ...]:
+    """Key clients that may share coalesced reads."""
+    return tuple(sorted(config.dict(include=READ_SETTINGS).items()))
+
 class SodaClient:
     """
     Async SODA client for interacting with Socrata Open Data APIs.
@@ -30,20 +43,40 @@ class SodaClient:
             "Accept": "application/json",
             "User-Agent": config.user_agent or "AriesOne-SODA-Client/1.0.0"
         }
+        self.client = self._http_client()
+        self.coalescer: RequestCoalescer = get_coalescer(
+            coalescer_key(config),
+            metadata_maxsize=config.metadata_lru_size,
+            metadata_ttl=config.cache_ttl
+        )
 
-        if config.username and config.password:
-            auth = httpx.BasicAuth(config.username, config.password)
+    def _http_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client for this configuration."""
+        if self.config.username and self.config.password:
+            auth = httpx.BasicAuth(self.config.username, self.config.password)
         else:
             auth = None
 
-        self.client = httpx.AsyncClient(
+        return httpx.AsyncClient(
             base_url=self.base_url,
             headers=self.headers,
             auth=auth,
-            timeout=config.timeout,
-            verify=config.verify_ssl,
+            timeout=self.config.timeout,
+            verify=self.config.verify_ssl,
         )
 
+    def _upstream(self) -> httpx.AsyncClient:
+        """
+        Pooled HTTP client for coalesced reads.
+
+        Owned by the coalescer so a flight outlives the client that started
+        it; close() leaves it open.
+        """
+        upstream = self.coalescer.upstream
+        if upstream is None or upstream.is_closed:
+            upstream = self.coalescer.upstream = self._http_client()
+        return upstream
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
@@ -56,27 +89,57 @@ class SodaClient:
         """Close the client session."""
         await self.client.aclose()
 
+    @property
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss/coalesced counters for metadata and queries."""
+        return self.coalescer.stats.snapshot()
+
     @monitor()
     async def get_metadata(self, dataset_id: str) -> ResourceMetadata:
-        """Get dataset metadata."""
+        """
+        Get dataset metadata.
+
+        Served from the in-process LRU when possible; concurrent misses
+        for the same dataset share a single Redis/HTTP lookup.
+        """
+        metadata = self.coalescer.metadata.get(dataset_id)
+        if metadata is not None:
+            self.coalescer.stats.record("metadata", "hits")
+            return metadata
+
+        metadata, shared = await self.coalescer.flights.do(
+            f"metadata:{dataset_id}",
+            lambda: self._fetch_metadata(dataset_id)
+        )
+        self.coalescer.stats.record(
+            "metadata", "coalesced" if shared else "misses"
+        )
+        return metadata
+
+    @monitor()
+    async def _fetch_metadata(self, dataset_id: str) -> ResourceMetadata:
+        """Load metadata from Redis or the API and memoize it in-process."""
         cache_key = f"metadata:{dataset_id}"
-        
+        metadata = None
+
         if self.config.cache_enabled:
             cached = await cache_manager.get(cache_key)
             if cached:
-                return ResourceMetadata(**cached)
+                metadata = ResourceMetadata(**cached)
 
-        url = f"/api/views/{dataset_id}"
-        response = await self._make_request("GET", url)
-        metadata = ResourceMetadata(**response)
+        if metadata is None:
+            url = f"/api/views/{dataset_id}"
+            response = await self._make_request("GET", url, client=self._upstream())
+            metadata = ResourceMetadata(**response)
 
-        if self.config.cache_enabled:
-            await cache_manager.set(
-                cache_key,
-                metadata.dict(),
-                expire=self.config.cache_ttl
-            )
+            if self.config.cache_enabled:
+                await cache_manager.set(
+                    cache_key,
+                    metadata.dict(),
+                    expire=self.config.cache_ttl
+                )
 
+        self.coalescer.metadata.set(dataset_id, metadata)
         return metadata
 
     @monitor()
@@ -89,22 +152,42 @@ class SodaClient:
     ) -> SodaResponse:
         """
         Query a dataset using SOQL.
+
+        Identical queries already in flight share one upstream request.
         """
-        start_time = datetime.now()
         query_str = query.to_query_string() if query else ""
-        cache_key = f"query:{dataset_id}:{query_str}"
+        cache_key = None
 
         if use_cache and self.config.cache_enabled:
+            cache_key = await self._query_cache_key(dataset_id, query_str)
             cached = await cache_manager.get(cache_key)
             if cached:
+                self.coalescer.stats.record("query", "hits")
                 return SodaResponse(**cached)
 
+        result, shared = await self.coalescer.flights.do(
+            f"query:{dataset_id}:{format}:{query_str}",
+            lambda: self._fetch_query(dataset_id, query_str, format, cache_key)
+        )
+        self.coalescer.stats.record("query", "coalesced" if shared else "misses")
+        return result.copy(deep=True) if shared else result
+
+    @monitor()
+    async def _fetch_query(
+        self,
+        dataset_id: str,
+        query_str: str,
+        format: SodaDataFormat,
+        cache_key: Optional[str]
+    ) -> SodaResponse:
+        """Run a query against the API and cache the response."""
+        start_time = datetime.now()
         url = f"/resource/{dataset_id}.{format}"
         if query_str:
             url = f"{url}?{query_str}"
 
-        response = await self._make_request("GET", url)
-        
+        response = await self._make_request("GET", url, client=self._upstream())
+
         result = SodaResponse(
             data=response,
             metadata=await self.get_metadata(dataset_id),
@@ -113,7 +196,7 @@ class SodaClient:
             request_time=(datetime.now() - start_time).total_seconds()
         )
 
-        if use_cache and self.config.cache_enabled:
+        if cache_key:
             await cache_manager.set(
                 cache_key,
                 result.dict(),
@@ -130,20 +213,52 @@ class SodaClient:
     ) -> SodaResponse:
         """
         Create or update records in a dataset.
+
+        Large payloads are split into chunks and written concurrently;
+        chunks that still fail after retries are reported in ``error``.
         """
-        url = f"/resource/{dataset_id}"
-        response = await self._make_request("POST", url, json=data)
-        
-        if self.config.cache_enabled:
-            # Invalidate query cache for this dataset
-            await cache_manager.delete_pattern(f"query:{dataset_id}:*")
-        
+        result = await self.upsert_batched(dataset_id, data)
+        error = None
+        if result.failed_chunks:
+            failed = result.failed_chunks
+            error = SodaError(
+                code=failed[0].error.code if failed[0].error else "upsert_failed",
+                message=(
+                    f"{len(failed)} of {len(result.chunks)} upsert chunks failed"
+                ),
+                details={
+                    "failed_chunks": [chunk.dict() for chunk in failed]
+                }
+            )
+
         return SodaResponse(
-            data=response,
+            data=[chunk.response for chunk in result.chunks if chunk.response],
             metadata=await self.get_metadata(dataset_id),
-            total_count=len(response)
+            error=error,
+            total_count=sum(
+                chunk.size for chunk in result.chunks if chunk.succeeded
+            ),
+            request_time=result.request_time
         )
 
+    @monitor()
+    async def upsert_batched(
+        self,
+        dataset_id: str,
+        data: List[Dict[str, Any]],
+        writer: Optional[UpsertBatchWriter] = None
+    ) -> SodaBatchResult:
+        """
+        Upsert records in size-bounded chunks and return per-chunk results.
+        """
+        writer = writer or UpsertBatchWriter(self)
+        result = await writer.write(dataset_id, data)
+
+        if any(chunk.succeeded for chunk in result.chunks):
+            await self.invalidate_queries(dataset_id)
+
+        return result
+
     @monitor()
     async def delete(
         self,
@@ -156,30 +271,54 @@ class SodaClient:
         url = f"/resource/{dataset_id}"
         params = {"$where": where}
         response = await self._make_request("DELETE", url, params=params)
-        
-        if self.config.cache_enabled:
-            # Invalidate query cache for this dataset
-            await cache_manager.delete_pattern(f"query:{dataset_id}:*")
-        
+        await self.invalidate_queries(dataset_id)
+
         return SodaResponse(
             data=response,
             metadata=await self.get_metadata(dataset_id),
             total_count=0
         )
 
+    async def invalidate_queries(self, dataset_id: str) -> None:
+        """
+        Invalidate cached queries for a dataset.
+
+        Query cache keys embed a per-dataset generation; writing a new
+        generation orphans every existing key in O(1) and the stale
+        entries simply age out through their TTL.
+        """
+        # Queries already in flight may predate the write; don't let new callers join them
+        self.coalescer.flights.forget(f"query:{dataset_id}:")
+        if not self.config.cache_enabled:
+            return
+        await cache_manager.set(
+            f"generation:{dataset_id}",
+            time.time_ns(),
+            expire=self.config.cache_ttl * 2
+        )
+
+    async def _query_cache_key(self, dataset_id: str, query_str: str) -> str:
+        """Build the generation-scoped cache key for a query."""
+        generation = await cache_manager.get(f"generation:{dataset_id}") or 0
+        return f"query:{dataset_id}:{generation}:{query_str}"
+
     async def _make_request(
         self,
         method: str,
         url: str,
+        client: Optional[httpx.AsyncClient] = None,
         **kwargs
     ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Make an HTTP request to the SODA API.
+
+        Uses this client's connection unless ``client`` is given.
         """
+        client = client or self.client
         retries = 0
         while retries < self.config.max_retries:
             try:
-                response = await self.client.request(method, url, **kwargs)
+                response = await client.request(method, url, **kwargs)
                 response.raise_for_status()
                 return response.json()
             except httpx.HTTPStatusError as e:
@@ -0,0 +1,179 @@
+"""
+In-process request coalescing and memoization for the SODA client.
+"""
+from typing import Optional, Dict, Any, Callable, Awaitable, Hashable, Tuple, TypeVar
+from collections import OrderedDict
+import asyncio
+import time
+
+T = TypeVar("T")
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with per-entry expiry.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = None):
+        """Initialize LRU cache."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at and expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Set value, evicting the least recently used entry when full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one execution.
+
+    The first caller starts the work; callers arriving while it is in
+    flight await the same task instead of issuing their own request.
+    """
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]]
+    ) -> Tuple[T, bool]:
+        """
+        Run ``fn`` once per key; return its result and whether it was shared.
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._release(key, t))
+        # Shield so a cancelled caller does not cancel the work for the others
+        return await asyncio.shield(task), shared
+
+    def forget(self, prefix: str) -> None:
+        """Detach in-flight calls so later callers start a fresh flight."""
+        for key in [k for k in self._inflight if k.startswith(prefix)]:
+            del self._inflight[key]
+
+    def _release(self, key: str, task: "asyncio.Task[Any]") -> None:
+        """Drop a finished task and consume its exception if nobody awaited it."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+class CoalescingStats:
+    """
+    Hit/miss/coalesced counters per cache namespace.
+    """
+
+    EVENTS = ("hits", "misses", "coalesced")
+
+    def __init__(self):
+        """Initialize counters."""
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def record(self, namespace: str, event: str) -> None:
+        """Increment a counter."""
+        counters = self._counters.setdefault(
+            namespace, {name: 0 for name in self.EVENTS}
+        )
+        counters[event] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Return a copy of all counters."""
+        return {ns: dict(counters) for ns, counters in self._counters.items()}
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        self._counters.clear()
+
+
+class RequestCoalescer:
+    """
+    Shared single-flight groups, metadata LRU and counters for one
+    SODA client configuration.
+
+    Flights are joined by callers whose own clients may close at any time,
+    so shared work runs on ``upstream``, a pooled HTTP client owned by the
+    coalescer rather than borrowed from whichever caller started it.
+    """
+
+    def __init__(self, metadata_maxsize: int = 256, metadata_ttl: Optional[float] = None):
+        """Initialize coalescer."""
+        self.metadata = LRUCache(maxsize=metadata_maxsize, ttl=metadata_ttl)
+        self.flights = SingleFlight()
+        self.stats = CoalescingStats()
+        self.upstream: Optional[Any] = None
+
+    async def close(self) -> None:
+        """Close the pooled upstream client."""
+        if self.upstream is not None:
+            await self.upstream.aclose()
+            self.upstream = None
+
+
+_coalescers: Dict[Hashable, RequestCoalescer] = {}
+
+
+def get_coalescer(
+    key: Hashable,
+    metadata_maxsize: int = 256,
+    metadata_ttl: Optional[float] = None
+) -> RequestCoalescer:
+    """
+    Get the process-wide coalescer for a client configuration.
+
+    Clients are typically created per request, so the coalescing state
+    has to outlive any single client instance to be useful. ``key`` must
+    cover every setting that changes what a shared flight returns,
+    including the metadata cache size and TTL.
+    """
+    coalescer = _coalescers.get(key)
+    if coalescer is None:
+        coalescer = RequestCoalescer(metadata_maxsize, metadata_ttl)
+        _coalescers[key] = coalescer
+    return coalescer
+
+
+async def close_coalescers() -> None:
+    """Close every pooled upstream client and drop the coalescers."""
+    coalescers = list(_coalescers.values())
+    _coalescers.clear()
+    for coalescer in coalescers:
+        await coalescer.close()
@@ -150,6 +150,36 @@ class SodaResponse(BaseModel):
     cached: bool = False
     request_time: float = 0.0
 
+class SodaChunkResult(BaseModel):
+    """Outcome of a single upsert chunk."""
+    index: int
+    size: int
+    attempts: int = 0
+    succeeded: bool = False
+    response: Optional[Dict[str, Any]] = None
+    error: Optional[SodaError] = None
+
+class SodaBatchResult(BaseModel):
+    """Aggregated outcome of a batched upsert."""
+    dataset_id: str
+    total_records: int = 0
+    rows_created: int = 0
+    rows_updated: int = 0
+    rows_deleted: int = 0
+    row_errors: int = 0
+    chunks: List[SodaChunkResult] = []
+    request_time: float = 0.0
+
+    @property
+    def failed_chunks(self) -> List[SodaChunkResult]:
+        """Chunks that could not be written after all retries."""
+        return [chunk for chunk in self.chunks if not chunk.succeeded]
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every chunk was written."""
+        return not self.failed_chunks
+
 class SodaConfig(BaseModel):
     """SODA client configuration."""
     domain: str
@@ -161,4 +191,9 @@ class SodaConfig(BaseModel):
     verify_ssl: bool = True
     cache_enabled: bool = True
     cache_ttl: int = 300  # 5 minutes
+    metadata_lru_size: int = Field(256, gt=0)
     user_agent: Optional[str] = None
+    upsert_batch_size: int = Field(1000, gt=0)
+    upsert_batch_max_bytes: int = Field(4_000_000, gt=0)
+    upsert_concurrency: int = Field(4, gt=0)
+    upsert_retry_backoff: float = Field(0.5, ge=0)